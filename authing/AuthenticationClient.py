@@ -3,7 +3,10 @@
 from .exceptions import AuthingWrongArgumentException
 from .http.AuthenticationHttpClient import AuthenticationHttpClient
 from .http.ProtocolHttpClient import ProtocolHttpClient
-from .utils import get_random_string, url_join_args
+from .BulkTokenVerifier import BulkTokenVerifier
+from .PasswordEncryptor import PasswordEncryptor
+from .UserInfoCache import UserInfoCache
+from .utils import get_random_string, parse_jwks, url_join_args
 import base64
 import hashlib
 import json
@@ -32,7 +35,10 @@ class AuthenticationClient(object):
             lang=None,
             websocket_host=None,
             websocket_endpoint=None,
-            real_ip=None
+            real_ip=None,
+            http_cache=None,
+            coalesce_requests=True,
+            revocation_tracker=None
     ):
 
         """
@@ -52,6 +58,9 @@ class AuthenticationClient(object):
             redirect_uri (str): 认证完成后的重定向目标 URL。可选，默认使用控制台中配置的第一个回调地址。
             post_logout_redirect_uri(str): 登出完成后的重定向目标 URL
             real_ip (str): 客户端真实 ip，如果不传的话将一直使用服务器的 ip 作为请求 ip，这可能会影响发送验证码等接口的限流策略。
+            http_cache (HttpCache): HTTP 缓存（可选），GET 请求按 Cache-Control / ETag / Last-Modified 缓存和重新验证
+            coalesce_requests (bool): 是否合并相同的并发 GET 请求，默认为 True
+            revocation_tracker (RevocationTracker): 本地 Token 吊销列表（可选），introspect_token_offline 验签后会检查 Token 是否已被吊销
         """
         if not app_id:
             raise Exception('Please provide app_id')
@@ -72,6 +81,9 @@ class AuthenticationClient(object):
         self.websocket_host = websocket_host or "wss://events.authing.cn"
         self.websocket_endpoint = websocket_endpoint or "/events/v1/authentication/sub"
         self.real_ip = real_ip
+        self._password_encryptor = None
+        self._user_info_cache = None
+        self.revocation_tracker = revocation_tracker
 
         # V3 API 接口使用的 HTTP Client
         self.http_client = AuthenticationHttpClient(
@@ -81,7 +93,9 @@ class AuthenticationClient(object):
             lang=self.lang,
             use_unverified_ssl=self.use_unverified_ssl,
             token_endpoint_auth_method=token_endpoint_auth_method,
-            real_ip=real_ip
+            real_ip=real_ip,
+            http_cache=http_cache,
+            coalesce_requests=coalesce_requests
         )
         if self.access_token:
             self.http_client.set_access_token(self.access_token)
@@ -90,12 +104,39 @@ class AuthenticationClient(object):
         self.protocol_http_client = ProtocolHttpClient(
             host=self.app_host,
             use_unverified_ssl=self.use_unverified_ssl,
+            http_cache=http_cache,
+            coalesce_requests=coalesce_requests,
         )
 
     def set_access_token(self, access_token):
         self.access_token = access_token
         self.http_client.set_access_token(self.access_token)
 
+    def get_password_encryptor(self, key_ttl=3600):
+        """
+        获取当前客户端的密码加密器，服务端公钥通过 get_system_info 获取，解析后在客户端实例上缓存。
+
+        Args:
+            key_ttl (int): 公钥缓存时间，单位为秒，过期后重新获取以支持密钥轮换，仅在首次调用时生效。
+        """
+        if self._password_encryptor is None:
+            self._password_encryptor = PasswordEncryptor(client=self, key_ttl=key_ttl)
+        return self._password_encryptor
+
+    def get_user_info_cache(self, maxsize=10000, ttl=300, derive_from_id_token=False):
+        """
+        获取当前客户端的用户信息缓存，缓存 get_user_info_by_access_token 的结果，在客户端实例上复用。
+
+        Args:
+            maxsize (int): 最多缓存的 Access token 数，仅在首次调用时生效。
+            ttl (int): 缓存时间，单位为秒，同时不超过 Access token 的过期时间，仅在首次调用时生效。
+            derive_from_id_token (bool): 请求的 scope 已包含在 Id token 中时，是否直接从 Id token 取出用户信息，仅在首次调用时生效。
+        """
+        if self._user_info_cache is None:
+            self._user_info_cache = UserInfoCache(
+                client=self, maxsize=maxsize, ttl=ttl, derive_from_id_token=derive_from_id_token)
+        return self._user_info_cache
+
     def ___get_access_token_by_code_with_client_secret_post(self, code, code_verifier=None):
         url = "/%s/token" % ('oidc' if self.protocol == 'oidc' else 'oauth')
         data = self.protocol_http_client.request(
@@ -565,17 +606,21 @@ class AuthenticationClient(object):
             raise AuthingWrongArgumentException('secret must be provided')
 
         if self.revocation_endpoint_auth_method == 'client_secret_post':
-            return self.__revoke_token_with_client_secret_post(token)
+            result = self.__revoke_token_with_client_secret_post(token)
 
         elif self.revocation_endpoint_auth_method == 'client_secret_basic':
-            return self.__revoke_token_with_client_secret_basic(token)
+            result = self.__revoke_token_with_client_secret_basic(token)
 
         elif self.revocation_endpoint_auth_method == 'none':
-            return self.__revoke_token_with_none(token)
+            result = self.__revoke_token_with_none(token)
 
         else:
             raise AuthingWrongArgumentException('unsupported argument token_endpoint_auth_method')
 
+        if self.revocation_tracker is not None:
+            self.revocation_tracker.revoke_token(token)
+        return result
+
     def __introspect_token_with_client_secret_post(self, token):
         url = "/%s/token/introspection" % ('oidc' if self.protocol == 'oidc' else 'oauth')
         return self.protocol_http_client.request(
@@ -655,16 +700,38 @@ class AuthenticationClient(object):
                         注意: refresh_token 只有在 scope 中包含 offline_access 才会返回。
             serverJWKS: 服务端的 JWKS 公钥，用于验证 Token 签名，默认会通过网络请求从服务端的 JWKS 端点自动获取
         """
-        jwks = self.__fetch_jwks(server_jwks)
-        public_keys = {}
-        for jwk in jwks['keys']:
-            kid = jwk['kid']
-            public_keys[kid] = jwt.algorithms.RSAAlgorithm.from_jwk(json.dumps(jwk))
+        public_keys = parse_jwks(self.__fetch_jwks(server_jwks))
         kid = jwt.get_unverified_header(token)['kid']
         key = public_keys[kid]
         payload = jwt.decode(token, key=key, algorithms=['RS256'], audience=self.app_id)
+        if self.revocation_tracker is not None and self.revocation_tracker.is_revoked(payload):
+            raise jwt.InvalidTokenError('token has been revoked')
         return payload
 
+    def introspect_tokens_offline(self, tokens, server_jwks=None, verify_exp=True, processes=None, chunk_size=500):
+        """
+        批量本地验证 Access token 或 Id token，JWKS 只获取和解析一次，使用多进程并发验签。
+
+        Args:
+            tokens (iterable): Token 列表或迭代器
+            server_jwks: 服务端的 JWKS 公钥，默认会通过网络请求从服务端的 JWKS 端点自动获取
+            verify_exp (bool): 是否校验过期时间，校验归档的历史 Token 时可以设为 False
+            processes (int): 工作进程数，默认为 CPU 核数，为 0 时在当前进程中校验
+            chunk_size (int): 每批提交给工作进程的 Token 数
+
+        Returns:
+            按输入顺序返回每个 Token 结果的迭代器，结果为包含 index、valid、payload、error 的 dict
+        """
+        verifier = BulkTokenVerifier(
+            jwks=self.__fetch_jwks(server_jwks),
+            audience=self.app_id,
+            verify_exp=verify_exp,
+            processes=processes,
+            chunk_size=chunk_size,
+            revocation_tracker=self.revocation_tracker,
+        )
+        return verifier.verify(tokens)
+
     def validate_ticket_v1(self, ticket, service):
         """
         检验 CAS 1.0 Ticket 合法性。
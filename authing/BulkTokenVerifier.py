@@ -0,0 +1,133 @@
+# coding: utf-8
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import jwt
+
+from .utils import parse_jwks
+
+# 工作进程内解析好的公钥：kid -> key，由 _init_worker 在进程启动时解析一次
+_worker_keys = {}
+_worker_options = {}
+
+
+def _init_worker(jwks, options):
+    global _worker_keys, _worker_options
+    _worker_keys = parse_jwks(jwks)
+    _worker_options = options
+
+
+# 单个 Token 校验时可能出现的错误：非字符串 / 格式错误的输入会抛出 TypeError、ValueError 而不是 InvalidTokenError，
+# 按单个 Token 无效处理，避免一个异常输入中断整批乃至整个流
+_TOKEN_ERRORS = (jwt.PyJWTError, TypeError, ValueError)
+
+
+def _error(e):
+    return "%s: %s" % (type(e).__name__, e)
+
+
+def _verify_chunk(chunk, keys=None, options=None):
+    """校验一批 (序号, token)，返回 [(序号, payload, error)]"""
+    keys = _worker_keys if keys is None else keys
+    options = _worker_options if options is None else options
+    # 按 kid 分组，同一个公钥的 token 连续校验
+    groups = {}
+    results = []
+    for index, token in chunk:
+        try:
+            kid = jwt.get_unverified_header(token).get("kid")
+            groups.setdefault(kid, []).append((index, token))
+        except _TOKEN_ERRORS as e:
+            results.append((index, None, _error(e)))
+    for kid, items in groups.items():
+        key = keys.get(kid)
+        for index, token in items:
+            if key is None:
+                results.append((index, None, "InvalidKeyError: unknown kid %s" % kid))
+                continue
+            try:
+                payload = jwt.decode(token, key=key, algorithms=options["algorithms"],
+                                     audience=options["audience"], options={"verify_exp": options["verify_exp"]})
+                results.append((index, payload, None))
+            except _TOKEN_ERRORS as e:
+                results.append((index, None, _error(e)))
+    return results
+
+
+class BulkTokenVerifier(object):
+    """批量离线校验 Token
+
+    JWKS 中的公钥在每个工作进程启动时解析一次；输入按 chunk_size 分批提交到进程池，批内按 kid 分组校验，
+    最多同时保持 processes * 2 批在途，因此输入可以是任意长的迭代器（如逐行读取的日志文件），内存占用有上限。
+
+    verify 按输入顺序流式返回每个 Token 的结果 dict：
+
+    - index: Token 在输入中的序号
+    - valid: 是否校验通过
+    - payload: 校验通过时为 Token 内容
+    - error: 校验失败的原因
+
+    一般通过 AuthenticationClient.introspect_tokens_offline 使用。
+    """
+
+    def __init__(self, jwks, audience=None, algorithms=("RS256",), verify_exp=True, processes=None, chunk_size=500,
+                 revocation_tracker=None):
+        """
+        Args:
+            jwks (dict): 服务端 JWKS
+            audience (str): 期望的 aud，一般为应用 ID
+            algorithms (tuple): 允许的签名算法
+            verify_exp (bool): 是否校验过期时间，校验归档的历史 Token 时可以设为 False
+            processes (int): 工作进程数，默认为 CPU 核数，为 0 时在当前进程中校验
+            chunk_size (int): 每批提交的 Token 数
+            revocation_tracker (RevocationTracker): 本地 Token 吊销列表（可选）
+        """
+        self.jwks = jwks
+        self.options = {"audience": audience, "algorithms": list(algorithms), "verify_exp": verify_exp}
+        self.processes = (os.cpu_count() or 1) if processes is None else processes
+        self.chunk_size = chunk_size
+        self.revocation_tracker = revocation_tracker
+
+    def __chunks(self, tokens):
+        chunk = []
+        for index, token in enumerate(tokens):
+            chunk.append((index, token))
+            if len(chunk) >= self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def __results(self, tokens):
+        if not self.processes:
+            keys = parse_jwks(self.jwks)
+            for chunk in self.__chunks(tokens):
+                yield _verify_chunk(chunk, keys, self.options)
+            return
+        with ProcessPoolExecutor(max_workers=self.processes, initializer=_init_worker,
+                                 initargs=(self.jwks, self.options)) as executor:
+            pending = deque()
+            chunks = self.__chunks(tokens)
+            for chunk in chunks:
+                pending.append(executor.submit(_verify_chunk, chunk))
+                if len(pending) >= self.processes * 2:
+                    break
+            while pending:
+                results = pending.popleft().result()
+                for chunk in chunks:
+                    pending.append(executor.submit(_verify_chunk, chunk))
+                    break
+                yield results
+
+    def verify(self, tokens):
+        """按输入顺序流式返回每个 Token 的校验结果"""
+        for results in self.__results(tokens):
+            # 批内按 kid 分组后顺序被打乱，按序号恢复
+            results.sort(key=lambda r: r[0])
+            for index, payload, error in results:
+                if payload is not None and self.revocation_tracker is not None and \
+                        self.revocation_tracker.is_revoked(payload):
+                    payload, error = None, "InvalidTokenError: token has been revoked"
+                yield {"index": index, "valid": payload is not None, "payload": payload, "error": error}
@@ -0,0 +1,239 @@
+# coding: utf-8
+
+import inspect
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .utils.lru import LRUCache
+from .utils.singleflight import SingleFlight
+
+# 默认缓存的方法：方法名 -> (ttl, stale_ttl)，单位为秒。stale_ttl 为过期后仍可直接返回旧值、并在后台刷新的时长
+DEFAULT_TTLS = {
+    # ManagementClient
+    "get_application": (300, 3600),
+    "get_security_settings": (300, 3600),
+    "get_global_mfa_settings": (300, 3600),
+    "get_user_base_fields": (300, 3600),
+    "get_custom_fields": (300, 3600),
+    "list_namespaces": (300, 3600),
+    # AuthenticationClient
+    "get_system_info": (3600, 86400),
+    "get_country_list": (86400, 86400 * 7),
+}
+
+# 写方法 -> 调用成功后需要清空缓存的读方法
+DEFAULT_INVALIDATIONS = {
+    "delete_application": ["get_application"],
+    "refresh_application_secret": ["get_application"],
+    "update_application_permission_strategy": ["get_application"],
+    "update_application_mfa_settings": ["get_application"],
+    "authorize_application_access": ["get_application"],
+    "revoke_application_access": ["get_application"],
+    "update_security_settings": ["get_security_settings"],
+    "update_global_mfa_settings": ["get_global_mfa_settings"],
+    "set_user_base_fields": ["get_user_base_fields"],
+    "set_custom_fields": ["get_custom_fields"],
+    "delete_custom_fields": ["get_custom_fields"],
+    "create_namespace": ["list_namespaces"],
+    "create_namespaces_batch": ["list_namespaces"],
+    "update_namespace": ["list_namespaces"],
+    "delete_namespace": ["list_namespaces"],
+    "delete_namespaces_batch": ["list_namespaces"],
+}
+
+
+class LRUBackend(object):
+    """进程内缓存后端"""
+
+    def __init__(self, maxsize=4096):
+        self._cache = LRUCache(maxsize=maxsize)
+
+    def get(self, key):
+        return self._cache.get(key)
+
+    def set(self, key, value, ttl):
+        self._cache.set(key, value, ttl=ttl)
+
+    def delete_prefix(self, prefix):
+        for key in self._cache.keys():
+            if key.startswith(prefix):
+                self._cache.pop(key)
+
+
+class RedisBackend(object):
+    """Redis 缓存后端，多个进程可共享缓存和失效，需要安装 redis"""
+
+    def __init__(self, redis_client=None, url="redis://localhost:6379/0", namespace="authing:cache:"):
+        """
+        Args:
+            redis_client (redis.Redis): 已创建的 Redis 客户端，不传时使用 url 创建
+            url (str): Redis 连接地址
+            namespace (str): key 前缀
+        """
+        if redis_client is None:
+            try:
+                import redis
+            except ImportError:
+                raise ImportError("RedisBackend requires redis, please run: pip install redis")
+            redis_client = redis.Redis.from_url(url)
+        self.redis = redis_client
+        self.namespace = namespace
+
+    def get(self, key):
+        value = self.redis.get(self.namespace + key)
+        return json.loads(value) if value is not None else None
+
+    def set(self, key, value, ttl):
+        self.redis.set(self.namespace + key, json.dumps(value), ex=max(1, int(ttl)))
+
+    def delete_prefix(self, prefix):
+        keys = list(self.redis.scan_iter(match=self.namespace + prefix + "*"))
+        if keys:
+            self.redis.delete(*keys)
+
+
+class CachedClient(object):
+    """给 ManagementClient / AuthenticationClient 加上读缓存的代理
+
+    除缓存的方法外，其余属性和方法都原样转发给被代理的客户端：
+
+    - ttls 中的读方法按「方法名 + 参数」缓存成功的返回值（statusCode 为 200），ttl 内直接返回缓存；
+    - 过期后 stale_ttl 内仍直接返回旧值，同时在后台线程刷新（stale-while-revalidate）；超过 stale_ttl 则同步请求；
+    - 同一个 key 的并发未命中和后台刷新只会发起一次请求；
+    - 通过本代理调用 invalidations 中的写方法并成功后，清空对应读方法的全部缓存。
+
+    缓存命中时返回的是缓存中的同一个对象，调用方不要修改。
+
+    示例::
+
+        client = CachedClient(ManagementClient(...))
+        client.get_application(app_id="xxx")   # 请求接口
+        client.get_application(app_id="xxx")   # 命中缓存
+        client.update_application_mfa_settings(app_id="xxx", enabled_factors=["OTP"])  # 清空 get_application 缓存
+    """
+
+    def __init__(self, client, ttls=None, invalidations=None, backend=None, max_workers=2):
+        """
+        Args:
+            client: ManagementClient 或 AuthenticationClient
+            ttls (dict): 方法名 -> ttl 或 (ttl, stale_ttl)，默认为 DEFAULT_TTLS
+            invalidations (dict): 写方法名 -> 读方法名列表，默认为 DEFAULT_INVALIDATIONS
+            backend: 缓存后端，需实现 get / set / delete_prefix，默认为 LRUBackend()
+            max_workers (int): 后台刷新的最大线程数
+        """
+        self._client = client
+        self._ttls = {}
+        for name, ttl in (DEFAULT_TTLS if ttls is None else ttls).items():
+            self._ttls[name] = tuple(ttl) if isinstance(ttl, (tuple, list)) else (ttl, 0)
+        self._invalidations = DEFAULT_INVALIDATIONS if invalidations is None else invalidations
+        self._backend = backend or LRUBackend()
+        self._flight = SingleFlight()
+        self._max_workers = max_workers
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._refreshing = set()
+        self._wrapped = {}
+        # 每个读方法被清空缓存的次数，用于丢弃清空前发起、清空后才返回的请求结果
+        self._generations = {}
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if not callable(attr) or (name not in self._ttls and name not in self._invalidations):
+            return attr
+        wrapped = self._wrapped.get(name)
+        if wrapped is None:
+            if name in self._ttls:
+                wrapped = self.__wrap_read(name, attr)
+            else:
+                wrapped = self.__wrap_write(name, attr)
+            self._wrapped[name] = wrapped
+        return wrapped
+
+    def invalidate(self, *names):
+        """清空指定读方法的缓存，不传时清空全部"""
+        for name in names or list(self._ttls):
+            self._generations[name] = self._generations.get(name, 0) + 1
+            self._backend.delete_prefix(name + ":")
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    @staticmethod
+    def __key(name, method, args, kwargs):
+        endpoint = getattr(method, "endpoint", None)
+        if endpoint is not None:
+            # 由接口表生成的方法没有具体的签名，按接口的参数列表归一化，未传的参数默认为 None
+            arguments = dict.fromkeys(endpoint.args)
+            arguments.update(zip(endpoint.args, args))
+            arguments.update(kwargs)
+            return "%s:%s" % (name, json.dumps(arguments, sort_keys=True, default=str))
+        try:
+            bound = inspect.signature(method).bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = bound.arguments
+        except (TypeError, ValueError):
+            arguments = {"args": args, "kwargs": kwargs}
+        return "%s:%s" % (name, json.dumps(arguments, sort_keys=True, default=str))
+
+    def __load(self, key, method, args, kwargs, ttl, stale_ttl):
+        name = key.split(":", 1)[0]
+        generation = self._generations.get(name, 0)
+        resp = method(*args, **kwargs)
+        if isinstance(resp, dict) and resp.get("statusCode") == 200 and generation == self._generations.get(name, 0):
+            now = time.time()
+            self._backend.set(key, {"value": resp, "fresh_until": now + ttl}, ttl + stale_ttl)
+        return resp
+
+    def __revalidate(self, key, method, args, kwargs, ttl, stale_ttl):
+        with self._executor_lock:
+            if key in self._refreshing or self._flight.in_flight(key):
+                return
+            self._refreshing.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+
+        def refresh():
+            try:
+                self._flight.do(key, self.__load, key, method, args, kwargs, ttl, stale_ttl)
+            finally:
+                with self._executor_lock:
+                    self._refreshing.discard(key)
+
+        try:
+            self._executor.submit(refresh)
+        except RuntimeError:
+            # 已 close
+            with self._executor_lock:
+                self._refreshing.discard(key)
+
+    def __wrap_read(self, name, method):
+        ttl, stale_ttl = self._ttls[name]
+
+        def wrapper(*args, **kwargs):
+            key = self.__key(name, method, args, kwargs)
+            entry = self._backend.get(key)
+            if entry is not None:
+                if entry["fresh_until"] <= time.time():
+                    self.__revalidate(key, method, args, kwargs, ttl, stale_ttl)
+                return entry["value"]
+            return self._flight.do(key, self.__load, key, method, args, kwargs, ttl, stale_ttl)
+
+        wrapper.__name__ = name
+        wrapper.__doc__ = method.__doc__
+        return wrapper
+
+    def __wrap_write(self, name, method):
+        targets = self._invalidations[name]
+
+        def wrapper(*args, **kwargs):
+            resp = method(*args, **kwargs)
+            if not isinstance(resp, dict) or resp.get("statusCode") == 200:
+                self.invalidate(*targets)
+            return resp
+
+        wrapper.__name__ = name
+        wrapper.__doc__ = method.__doc__
+        return wrapper
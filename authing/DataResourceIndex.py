@@ -0,0 +1,188 @@
+# coding: utf-8
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .utils import get_response_data
+from .utils.pagination import iter_pages
+from .utils.trie import PathTrie, split_path
+
+
+class UserResourceView(object):
+    """get_user_resource_struct 返回的用户对一个数据资源的授权视图，节点按 资源 code/节点 code/... 的路径保存在前缀树中
+
+    inherit 为 True 时，拥有上级节点的操作权限即视为拥有其所有下级节点的该权限。
+    """
+
+    def __init__(self, resource_code, resource_type=None, inherit=False):
+        self.resource_code = resource_code
+        self.resource_type = resource_type
+        self.inherit = inherit
+        self.trie = PathTrie()
+
+    def is_allowed(self, path, action):
+        """path 为包含资源 code 的完整路径，如 treeResourceCode1/StructCode1/child"""
+        if self.inherit:
+            return any(action in (value or ()) for _, value in self.trie.prefixes(path))
+        return action in (self.trie.get(path) or ())
+
+    def authorized_paths(self, path=None, action=None):
+        """遍历 path（默认为资源根节点）下有 action 权限（不指定 action 时为有任意权限）的节点路径"""
+        path = path or self.resource_code
+        if action is None:
+            for item_path, actions in self.trie.subtree(path):
+                if actions:
+                    yield item_path
+            return
+        if not self.inherit:
+            for item_path, actions in self.trie.subtree(path):
+                if action in (actions or ()):
+                    yield item_path
+            return
+        # path 的上级节点是否已授权，遍历时沿路向下传递：节点自身或其任一上级节点授权即视为有权限，与 is_allowed 一致
+        segments = split_path(path)
+        inherited = any(action in (value or ()) for _, value in self.trie.prefixes(segments[:-1]))
+        for item_path, _, allowed in self.trie.accumulate(
+                path, inherited, lambda parent, actions: parent or action in (actions or ())):
+            if allowed:
+                yield item_path
+
+    def actions(self, path):
+        return set(self.trie.get(path) or ())
+
+
+class DataResourceIndex(object):
+    """权限空间内数据资源的本地路径索引
+
+    树类型资源的节点以 资源 code/节点 code/子节点 code 的路径插入前缀树，字符串资源以 资源 code/字符串按 / 切分 的路径插入，
+    数组资源的每个值作为资源 code 下的一层子节点。因此：
+
+    - exists / get / ancestors / longest_prefix 为 O(路径深度)；
+    - expand 支持 * 和 ** 通配符；subtree 只遍历命中的子树，耗时与输出规模成正比；
+    - get_user_view 调用 get_user_resource_struct 构建用户授权视图，之后对同一资源的路径判断和授权子树遍历都在本地完成。
+    """
+
+    def __init__(self, management_client, namespace_code, max_workers=8, page_size=50):
+        """
+        Args:
+            management_client (ManagementClient): 管理客户端
+            namespace_code (str): 权限空间 code
+            max_workers (int): 并发拉取资源详情的最大线程数
+            page_size (int): 每页数目
+        """
+        self.management_client = management_client
+        self.namespace_code = namespace_code
+        self.max_workers = max_workers
+        self.page_size = page_size
+        self.trie = PathTrie()
+        self.resources = {}
+
+    # ==== 加载 ====
+
+    def load(self, resource_codes=None):
+        """通过 list_data_resources 和 get_data_resource 加载资源，resource_codes 为空时加载权限空间内的全部资源"""
+        if resource_codes is None:
+            def fetch_page(page, limit):
+                return self.management_client.list_data_resources(
+                    page=page, limit=limit, namespace_codes=[self.namespace_code])
+            resource_codes = [r["resourceCode"] for _, items in iter_pages(
+                fetch_page, limit=self.page_size, max_workers=self.max_workers) for r in items
+                if r.get("namespaceCode") in (None, self.namespace_code)]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            resources = list(executor.map(self.__fetch_resource, resource_codes))
+        self.trie = PathTrie()
+        self.resources = {}
+        for resource in resources:
+            self.add_resource(resource)
+        return self
+
+    def refresh_resource(self, resource_code):
+        """重新拉取单个资源，替换其在索引中的全部节点"""
+        self.remove_resource(resource_code)
+        self.add_resource(self.__fetch_resource(resource_code))
+
+    def __fetch_resource(self, resource_code):
+        return get_response_data(self.management_client.get_data_resource(
+            namespace_code=self.namespace_code, resource_code=resource_code))
+
+    def add_resource(self, resource):
+        """把 get_data_resource 返回的资源详情加入索引"""
+        code = resource["resourceCode"]
+        resource_type = resource.get("type") or resource.get("resourceType")
+        struct = resource.get("struct")
+        self.resources[code] = resource
+        self.trie.insert(code, {"resourceCode": code, "type": resource_type, "actions": resource.get("actions")})
+        if resource_type == "TREE":
+            self.__insert_nodes([code], struct or [])
+        elif resource_type == "ARRAY":
+            for value in struct or []:
+                self.trie.insert([code, str(value)], {"value": value})
+        elif resource_type == "STRING" and struct:
+            self.trie.insert([code] + split_path(struct), {"value": struct})
+
+    def remove_resource(self, resource_code):
+        self.resources.pop(resource_code, None)
+        self.trie.remove(resource_code)
+
+    def __insert_nodes(self, prefix, nodes):
+        stack = [(prefix, nodes)]
+        while stack:
+            prefix, nodes = stack.pop()
+            for node in nodes:
+                path = prefix + [node["code"]]
+                self.trie.insert(path, dict((k, v) for k, v in node.items() if k != "children"))
+                if node.get("children"):
+                    stack.append((path, node["children"]))
+
+    # ==== 查询 ====
+
+    def exists(self, path):
+        return path in self.trie
+
+    def get(self, path):
+        return self.trie.get(path)
+
+    def ancestors(self, path, include_self=False):
+        """返回 path 已存在的祖先节点路径，由浅到深"""
+        prefixes = [p for p, _ in self.trie.prefixes(path)]
+        if not include_self and prefixes and prefixes[-1] == "/".join(split_path(path)):
+            prefixes.pop()
+        return prefixes
+
+    def longest_prefix(self, path):
+        return self.trie.longest_prefix(path)[0]
+
+    def expand(self, pattern):
+        """展开带 * / ** 通配符的路径，返回存在的节点路径"""
+        return [path for path, _ in self.trie.expand(pattern)]
+
+    def subtree(self, path, include_self=True):
+        return [p for p, _ in self.trie.subtree(path, include_self)]
+
+    def get_user_view(self, user_id, resource_code, inherit=False):
+        """调用 get_user_resource_struct，返回用户对该资源的 UserResourceView"""
+        data = get_response_data(self.management_client.get_user_resource_struct(
+            resource_code=resource_code, user_id=user_id, namespace_code=self.namespace_code)) or {}
+        view = UserResourceView(resource_code, data.get("resourceType"), inherit)
+        tree = data.get("treeResourceAuthAction")
+        string = data.get("strResourceAuthAction")
+        array = data.get("arrResourceAuthAction")
+        if tree:
+            stack = [([resource_code], tree.get("nodeAuthActionList") or [])]
+            while stack:
+                prefix, nodes = stack.pop()
+                for node in nodes:
+                    path = prefix + [node["code"]]
+                    view.trie.insert(path, frozenset(node.get("actions") or ()))
+                    if node.get("children"):
+                        stack.append((path, node["children"]))
+        elif string:
+            actions = frozenset(string.get("actions") or ())
+            view.trie.insert(resource_code, actions)
+            if string.get("value"):
+                view.trie.insert([resource_code] + split_path(string["value"]), actions)
+        elif array:
+            actions = frozenset(array.get("actions") or ())
+            view.trie.insert(resource_code, actions)
+            for value in array.get("values") or []:
+                view.trie.insert([resource_code, str(value)], actions)
+        return view
@@ -0,0 +1,265 @@
+# coding: utf-8
+
+import ipaddress
+import json
+import re
+import threading
+import time
+
+from .utils import get_response_data, to_millis
+from .utils.cidr import CidrTable, parse_ip
+from .utils.pagination import iter_pages
+
+WHITE = "WHITE"
+BLACK = "BLACK"
+
+# 默认触发重新加载的事件编码，可通过 events 参数修改
+DEFAULT_IP_LIST_EVENTS = frozenset([
+    "authing.ip-list.created",
+    "authing.ip-list.deleted",
+    "authing.risk-list-policy.triggered",
+])
+
+# 最多缓存的判断结果数
+_MAX_DECISIONS = 100000
+
+# 日志行中形如 IPv4 / IPv6 地址的字段，12:30:45 这样的时间也会匹配，使用前需经 _valid_ip 校验
+_IP_PATTERN = re.compile(r"(?<![\w.:])(?:\d{1,3}(?:\.\d{1,3}){3}|[0-9a-fA-F]{0,4}(?::[0-9a-fA-F]{0,4}){2,7}"
+                         r"(?:\d{1,3}(?:\.\d{1,3}){3})?)(?![\w.:])")
+
+
+def _valid_ip(text):
+    try:
+        ipaddress.ip_address(text.split("%", 1)[0])
+    except ValueError:
+        return False
+    return True
+
+
+class IpPolicy(object):
+    """本地 IP 黑白名单判断
+
+    通过 find_ip_list 分页加载 IP 白名单（WHITE）和黑名单（BLACK），按限制类型（FORBID_LOGIN、FORBID_REGISTER、
+    SKIP_MFA 等）分别建立 CidrTable，判断时对 IP 做最长前缀匹配：更精确的网段优先，同一网段同时出现在黑白名单中时以
+    黑名单为准。已过期（expireAt）的名单在到期后自动从表中去掉。
+
+    名单的变化通过以下方式同步：
+
+    - start 启动后台线程，每 refresh_interval 秒重新加载一次；
+    - on_event 可作为 ManagementClient.sub_event 的回调，收到名单变更事件时重新加载；
+    - 通过本类的 add_ips、delete_ip 修改名单时，在调用接口成功后重新加载。
+
+    判断结果按 (IP, 限制类型) 缓存，名单重新加载或过期时清空；evaluate_log 可批量判断日志文件中的 IP。
+    风险策略（find_risk_list_policy）本身不包含 IP，命中策略后由服务端加入黑名单，load 时一并读取保存在 risk_policies 中。
+    """
+
+    def __init__(self, management_client, refresh_interval=300, page_size=50, max_workers=4, events=None):
+        """
+        Args:
+            management_client (ManagementClient): 管理客户端
+            refresh_interval (int): start 后定时重新加载的间隔，单位为秒
+            page_size (int): 每页数目
+            max_workers (int): 并发拉取分页的最大线程数
+            events (set): 触发重新加载的事件编码，默认为 DEFAULT_IP_LIST_EVENTS
+        """
+        self.management_client = management_client
+        self.refresh_interval = refresh_interval
+        self.page_size = page_size
+        self.max_workers = max_workers
+        self.events = DEFAULT_IP_LIST_EVENTS if events is None else events
+        self.entries = []
+        self.risk_policies = []
+        self.loaded_at = None
+        # 限制类型 -> CidrTable，None 对应不区分限制类型的表
+        self._tables = {None: CidrTable()}
+        self._next_expire = None
+        # (ip, 限制类型) -> 判断结果，重建表时清空
+        self._decisions = {}
+        self._load_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    # ==== 加载 ====
+
+    def load(self):
+        """从服务端重新加载黑白名单和风险策略，加载完成后整体替换本地的表"""
+        with self._load_lock:
+            entries = []
+            for ip_type in (WHITE, BLACK):
+                entries.extend(self.__list_all(self.management_client.find_ip_list, ip_type=ip_type))
+            risk_policies = self.__list_all(self.management_client.find_risk_list_policy, opt_object="ip")
+            self.__build(entries)
+            self.risk_policies = risk_policies
+            self.loaded_at = time.time()
+        return self
+
+    refresh = load
+
+    def __list_all(self, method, **kwargs):
+        items = []
+        for _, page_items in iter_pages(lambda page, limit: method(page=page, limit=limit, **kwargs),
+                                        limit=self.page_size, max_workers=self.max_workers):
+            items.extend(page_items)
+        return items
+
+    def __build(self, entries):
+        now = time.time() * 1000
+        tables = {None: CidrTable()}
+        next_expire = None
+        active = []
+        # 白名单先插入，同一网段同时在黑白名单中时由黑名单覆盖
+        for entry in sorted(entries, key=lambda e: (e.get("ipType") or e.get("type") or "").upper() == BLACK):
+            expire_at = to_millis(entry.get("expireAt")) if entry.get("expireAt") else None
+            if expire_at is not None:
+                if expire_at <= now:
+                    continue
+                next_expire = expire_at if next_expire is None else min(next_expire, expire_at)
+            active.append(entry)
+            ip_type = (entry.get("ipType") or entry.get("type") or "").upper()
+            ips = entry.get("ips") or entry.get("ip") or ""
+            if isinstance(ips, str):
+                ips = ips.split(",")
+            for limit in [None] + list(entry.get("limitList") or []):
+                table = tables.setdefault(limit, CidrTable())
+                for network in ips:
+                    if not network.strip():
+                        continue
+                    try:
+                        table.insert(network, ip_type)
+                    except ValueError:
+                        continue
+        self.entries = active
+        self._tables = tables
+        self._decisions = {}
+        self._next_expire = next_expire
+
+    # ==== 判断 ====
+
+    def check(self, ip, limit=None):
+        """
+        返回与 ip 最长前缀匹配的名单类型 WHITE / BLACK，没有命中时返回 None。
+
+        Args:
+            ip (str): IPv4 或 IPv6 地址
+            limit (str): 限制类型，如 FORBID_LOGIN，不指定时匹配所有名单
+        """
+        if self._next_expire is not None and time.time() * 1000 >= self._next_expire:
+            self.__build(self.entries)
+        # 请求中的 IP 重复率很高，命中缓存时只需一次字典查找，省去解析 IP 的开销
+        decisions = self._decisions
+        decision = decisions.get((ip, limit), decisions)
+        if decision is not decisions:
+            return decision
+        table = self._tables.get(limit)
+        try:
+            decision = table.lookup(ip) if table is not None else None
+        except ValueError:
+            decision = None
+        if len(decisions) >= _MAX_DECISIONS:
+            decisions.clear()
+        decisions[(ip, limit)] = decision
+        return decision
+
+    def is_blocked(self, ip, limit="FORBID_LOGIN"):
+        return self.check(ip, limit) == BLACK
+
+    def is_whitelisted(self, ip, limit=None):
+        return self.check(ip, limit) == WHITE
+
+    def explain(self, ip, limit=None):
+        """返回 (命中的网段, 名单类型)，没有命中时返回 (None, None)"""
+        table = self._tables.get(limit)
+        if table is None:
+            return None, None
+        return table.match(ip)
+
+    def evaluate_log(self, lines, limit=None, field=None, separator=None, only=None):
+        """
+        逐行判断日志中的 IP，返回生成器，元素为 (行号, IP, 名单类型)，没有找到 IP 的行会被跳过。
+
+        Args:
+            lines: 文件路径，或可迭代的日志行（如已打开的文件）
+            limit (str): 限制类型
+            field (int): IP 所在的列下标，不指定时取每行中第一个有效的 IP 地址
+            separator (str): 按列切分时使用的分隔符，默认为空白字符
+            only (str): 只返回指定的名单类型，如 BLACK
+        """
+        if isinstance(lines, str):
+            with open(lines) as f:
+                for item in self.evaluate_log(f, limit, field, separator, only):
+                    yield item
+            return
+        check = self.check
+        for line_no, line in enumerate(lines, 1):
+            if field is not None:
+                columns = line.split(separator)
+                ip = columns[field].strip("[]\"") if len(columns) > field else None
+                if ip and not _valid_ip(ip):
+                    ip = None
+            else:
+                ip = next((found.group(0) for found in _IP_PATTERN.finditer(line) if _valid_ip(found.group(0))), None)
+            if not ip:
+                continue
+            decision = check(ip, limit)
+            if only is None or decision == only:
+                yield line_no, ip, decision
+
+    # ==== 修改 ====
+
+    def add_ips(self, ips, ip_type=BLACK, limit_list=None, expire_at=None, remove_type="MANUAL", add_type="MANUAL"):
+        """调用 add 创建 IP 名单，成功后重新加载，ips 为 IP / 网段列表或逗号分隔的字符串"""
+        if not isinstance(ips, str):
+            ips = ",".join(ips)
+        for network in ips.split(","):
+            parse_ip(network.split("/", 1)[0].split("-", 1)[0].strip())
+        data = get_response_data(self.management_client.add(
+            expire_at=expire_at, limit_list=limit_list or ["FORBID_LOGIN"], remove_type=remove_type,
+            add_type=add_type, ip_type=ip_type, ips=ips))
+        self.load()
+        return data
+
+    def delete_ip(self, id):
+        """调用 delete_by_id 删除 IP 名单，成功后重新加载"""
+        data = get_response_data(self.management_client.delete_by_id(id=id))
+        self.load()
+        return data
+
+    def on_event(self, message):
+        """事件回调，可直接传给 ManagementClient.sub_event，收到 events 中的事件时重新加载"""
+        try:
+            event = json.loads(message) if isinstance(message, (str, bytes)) else message
+        except ValueError:
+            return
+        if not isinstance(event, dict):
+            return
+        code = event.get("eventType") or event.get("eventCode") or event.get("eventName")
+        if code in self.events:
+            self.load()
+
+    # ==== 定时刷新 ====
+
+    def start(self):
+        """首次加载并启动定时刷新线程"""
+        if self._thread is not None:
+            return self
+        if self.loaded_at is None:
+            self.load()
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self.__run, name="authing-ip-policy")
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+
+    def __run(self):
+        while not self._stopped.wait(self.refresh_interval):
+            try:
+                self.load()
+            except Exception:
+                # 加载失败时保留上一次的名单，等待下一次刷新
+                continue
@@ -0,0 +1,211 @@
+# coding: utf-8
+
+import asyncio
+import heapq
+import itertools
+
+from .AuthingException import AuthingException
+
+# 到达以下状态后停止轮询
+TERMINAL_STATUSES = frozenset(["AUTHORIZED", "CANCELLED", "EXPIRED", "ERROR"])
+
+
+class _Watch(object):
+    def __init__(self, kind, code_id, until, deadline, future, interval):
+        self.kind = kind
+        self.code_id = code_id
+        self.until = until
+        self.deadline = deadline
+        self.future = future
+        self.interval = interval
+        self.status = None
+        self.token = None
+
+
+class LoginStatusWaiter(object):
+    """二维码登录、推送登录状态的异步等待器
+
+    所有待确认的二维码 / 推送码共用一个 asyncio 调度协程：按下一次轮询时间组织成最小堆，到期后在线程池中调用
+    check_qr_code_status、get_qr_code_status 或 check_push_code_status，并发数受 max_concurrency 限制。
+    轮询间隔自适应：状态未变化时按 backoff 倍数逐步放宽到 max_interval，状态变化（如变为已扫码）后恢复为 min_interval。
+    一个进程即可同时跟踪数万个待确认的登录，而不需要为每个登录占用一个线程。
+
+    如果已经通过 sub_event 等事件通道收到了状态变更，可以调用 notify 直接推送状态，无需等待下一次轮询。
+
+    示例::
+
+        waiter = LoginStatusWaiter(authentication_client)
+        data = await waiter.wait_qr_code(qrcode_id, timeout=120)
+    """
+
+    def __init__(self, authentication_client, min_interval=1.0, max_interval=10.0, backoff=1.5,
+                 max_concurrency=32):
+        """
+        Args:
+            authentication_client (AuthenticationClient): 认证客户端
+            min_interval (float): 最小轮询间隔，单位为秒
+            max_interval (float): 最大轮询间隔，单位为秒
+            backoff (float): 状态未变化时轮询间隔的增长倍数
+            max_concurrency (int): 同时进行的状态查询请求数上限
+        """
+        self.authentication_client = authentication_client
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.max_concurrency = max_concurrency
+        self._heap = []
+        self._watches = {}
+        self._counter = itertools.count()
+        self._wakeup = None
+        self._semaphore = None
+        self._scheduler = None
+
+    def __fetch(self, kind):
+        if kind == "qrcode":
+            return self.authentication_client.check_qr_code_status
+        if kind == "app_qrcode":
+            return self.authentication_client.get_qr_code_status
+        if kind == "pushcode":
+            return self.authentication_client.check_push_code_status
+        raise ValueError("unsupported kind: %s" % kind)
+
+    def watch(self, kind, code_id, timeout=None, until=None):
+        """开始跟踪一个二维码或推送码，返回 asyncio.Future，结果为最终状态对应的接口 data
+
+        Args:
+            kind (str): qrcode（check_qr_code_status）、app_qrcode（get_qr_code_status）或 pushcode（check_push_code_status）
+            code_id (str): 二维码 ID 或推送码 ID
+            timeout (float): 超时时间，单位为秒，超时后 Future 的结果为 {"status": "EXPIRED"}
+            until (set): 视为结束的状态，默认为 TERMINAL_STATUSES；如需在用户扫码后立即返回，可以加入 SCANNED
+        """
+        self.__fetch(kind)
+        loop = asyncio.get_running_loop()
+        self.__ensure_scheduler(loop)
+        key = (kind, code_id)
+        existing = self._watches.get(key)
+        if existing is not None and not existing.future.done():
+            return existing.future
+        deadline = loop.time() + timeout if timeout else None
+        watch = _Watch(kind, code_id, frozenset(until or TERMINAL_STATUSES), deadline, loop.create_future(),
+                       self.min_interval)
+        self._watches[key] = watch
+        self.__schedule(watch, loop.time())
+        return watch.future
+
+    async def wait_qr_code(self, qrcode_id, timeout=None, until=None):
+        """等待二维码（check_qr_code_status）到达最终状态"""
+        return await self.watch("qrcode", qrcode_id, timeout, until)
+
+    async def wait_app_qr_code(self, qrcode_id, timeout=None, until=None):
+        """等待个人中心快速认证二维码（get_qr_code_status）到达最终状态"""
+        return await self.watch("app_qrcode", qrcode_id, timeout, until)
+
+    async def wait_push_code(self, push_code_id, timeout=None, until=None):
+        """等待推送码（check_push_code_status）到达最终状态"""
+        return await self.watch("pushcode", push_code_id, timeout, until)
+
+    def notify(self, kind, code_id, data):
+        """由外部事件通道推送状态变更，data 为与状态查询接口 data 相同结构的 dict
+
+        可以在其他线程（如 sub_event 的回调）中调用。
+        """
+        watch = self._watches.get((kind, code_id))
+        if watch is not None:
+            loop = watch.future.get_loop()
+            loop.call_soon_threadsafe(lambda: self.__apply(watch, data, loop.time()))
+
+    def cancel(self, kind, code_id):
+        """停止跟踪并取消对应的 Future"""
+        watch = self.__remove((kind, code_id))
+        if watch is not None and not watch.future.done():
+            watch.future.cancel()
+
+    def __remove(self, key):
+        watch = self._watches.pop(key, None)
+        if watch is not None and self._wakeup is not None:
+            self._wakeup.set()
+        return watch
+
+    @property
+    def pending_count(self):
+        return len(self._watches)
+
+    def __ensure_scheduler(self, loop):
+        if self._scheduler is None or self._scheduler.done():
+            self._wakeup = asyncio.Event()
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._scheduler = loop.create_task(self.__run())
+
+    def __schedule(self, watch, due):
+        # 每次调度生成新的序号，堆中较早的条目随之失效，保证同一时刻每个 watch 只有一次轮询
+        watch.token = next(self._counter)
+        heapq.heappush(self._heap, (due, watch.token, watch))
+        self._wakeup.set()
+
+    async def __run(self):
+        loop = asyncio.get_running_loop()
+        while self._watches:
+            now = loop.time()
+            while self._heap and self._heap[0][0] <= now:
+                _, token, watch = heapq.heappop(self._heap)
+                if token != watch.token or self._watches.get((watch.kind, watch.code_id)) is not watch:
+                    continue
+                if watch.future.done():
+                    # 调用方已取消等待
+                    self._watches.pop((watch.kind, watch.code_id), None)
+                    continue
+                watch.token = None
+                if watch.deadline is not None and now >= watch.deadline:
+                    self.__finish(watch, {"status": "EXPIRED"})
+                    continue
+                loop.create_task(self.__poll(watch))
+            self._wakeup.clear()
+            delay = self._heap[0][0] - loop.time() if self._heap else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def __poll(self, watch):
+        loop = asyncio.get_running_loop()
+        async with self._semaphore:
+            try:
+                resp = await loop.run_in_executor(None, self.__fetch(watch.kind), watch.code_id)
+            except Exception:
+                # 网络错误时按当前间隔重试
+                self.__schedule(watch, loop.time() + watch.interval)
+                return
+        if resp.get("statusCode") != 200:
+            if not watch.future.done():
+                watch.future.set_exception(
+                    AuthingException(resp.get("statusCode"), resp.get("message"), resp.get("apiCode")))
+            self.__remove((watch.kind, watch.code_id))
+            return
+        self.__apply(watch, resp.get("data") or {}, loop.time())
+
+    def __apply(self, watch, data, now):
+        key = (watch.kind, watch.code_id)
+        if self._watches.get(key) is not watch:
+            return
+        if watch.future.done():
+            # 调用方在轮询进行中取消了等待，此时堆中没有该 watch 的条目，需在这里移除并唤醒调度协程检查是否退出
+            self.__remove(key)
+            return
+        status = data.get("status")
+        if status in watch.until:
+            self.__finish(watch, data)
+            return
+        if status != watch.status:
+            watch.status = status
+            watch.interval = self.min_interval
+        else:
+            watch.interval = min(self.max_interval, watch.interval * self.backoff)
+        due = now + watch.interval
+        if watch.deadline is not None:
+            due = min(due, watch.deadline)
+        self.__schedule(watch, due)
+
+    def __finish(self, watch, data):
+        self.__remove((watch.kind, watch.code_id))
+        if not watch.future.done():
+            watch.future.set_result(data)
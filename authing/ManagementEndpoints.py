@@ -0,0 +1,1383 @@
+# coding: utf-8
+
+# ManagementClient 的接口表，每项为 (方法名, HTTP 方法, 路径, 参数位置, 必填参数个数, 参数名, 字段名:参数名)，
+# 字段说明见 utils.endpoints.Endpoint，方法的签名和文档见 ManagementClient.pyi。
+MANAGEMENT_ENDPOINTS = (
+    ("list_row", "POST", "/api/v3/metadata/filter", "json", 1,
+     "model_id keywords conjunction conditions sort page limit fetch_all with_path show_field_id preview_relation "
+     "get_relation_field_detail scope filter_relation expand",
+     "modelId:model_id keywords conjunction conditions sort page limit fetchAll:fetch_all withPath:with_path "
+     "showFieldId:show_field_id previewRelation:preview_relation getRelationFieldDetail:get_relation_field_detail "
+     "scope filterRelation:filter_relation expand"),
+    ("get_row", "GET", "/api/v3/metadata/get-row", "params", 3,
+     "model_id row_id show_field_id",
+     "modelId:model_id rowId:row_id showFieldId:show_field_id"),
+    ("get_row_by_value", "GET", "/api/v3/metadata/get-row-by-value", "params", 4,
+     "model_id key value show_field_id",
+     "modelId:model_id key value showFieldId:show_field_id"),
+    ("get_row_batch", "POST", "/get-row-batch", "json", 2,
+     "row_ids model_id",
+     "rowIds:row_ids modelId:model_id"),
+    ("create_row", "POST", "/api/v3/metadata/create-row", "json", 2,
+     "data model_id row_id",
+     "data modelId:model_id rowId:row_id"),
+    ("update_row", "POST", "/api/v3/metadata/update-row", "json", 3,
+     "data row_id model_id show_field_id",
+     "data rowId:row_id modelId:model_id showFieldId:show_field_id"),
+    ("remove_row", "POST", "/api/v3/metadata/remove-row", "json", 2,
+     "row_id_list model_id recursive",
+     "rowIdList:row_id_list modelId:model_id recursive"),
+    ("create_model", "POST", "/api/v3/metadata/create-model", "json", 5,
+     "parent_key enable type description name data_type",
+     "parentKey:parent_key enable type description name dataType:data_type"),
+    ("get_model", "GET", "/api/v3/metadata/get-model", "params", 1,
+     "id",
+     "id"),
+    ("list_model", "GET", "/api/v3/metadata/list-model", None, 0,
+     "",
+     ""),
+    ("remove_model", "POST", "/api/v3/metadata/remove-model", "json", 1,
+     "id",
+     "id"),
+    ("update_model", "POST", "/api/v3/metadata/update-model", "json", 8,
+     "config field_order type parent_key enable description name id",
+     "config fieldOrder:field_order type parentKey:parent_key enable description name id"),
+    ("create_field", "POST", "/api/v3/metadata/create-field", "json", 23,
+     "user_visible relation_optional_range relation_show_key relation_multiple relation_type for_login fuzzy_search "
+     "drop_down format regexp min max max_length unique require default help editable show type key name model_id",
+     "userVisible:user_visible relationOptionalRange:relation_optional_range relationShowKey:relation_show_key "
+     "relationMultiple:relation_multiple relationType:relation_type forLogin:for_login fuzzySearch:fuzzy_search "
+     "dropDown:drop_down format regexp min max maxLength:max_length unique require default help editable show type "
+     "key name modelId:model_id"),
+    ("update_field", "POST", "/api/v3/metadata/update-field", "json", 20,
+     "user_visible relation_optional_range relation_show_key for_login fuzzy_search drop_down format regexp min max "
+     "max_length unique require default help editable show name model_id id",
+     "userVisible:user_visible relationOptionalRange:relation_optional_range relationShowKey:relation_show_key "
+     "forLogin:for_login fuzzySearch:fuzzy_search dropDown:drop_down format regexp min max maxLength:max_length "
+     "unique require default help editable show name modelId:model_id id"),
+    ("remote_field", "POST", "/api/v3/metadata/remove-field", "json", 2,
+     "model_id id",
+     "modelId:model_id id"),
+    ("list_field", "GET", "/api/v3/metadata/list-field", "params", 1,
+     "model_id",
+     "modelId:model_id"),
+    ("export_meatdata", "POST", "/api/v3/metadata/export", "json", 2,
+     "id_list model_id",
+     "idList:id_list modelId:model_id"),
+    ("import_metadata", "POST", "/api/v3/metadata/import", "json", 2,
+     "file model_id",
+     "file modelId:model_id"),
+    ("get_import_template", "GET", "/api/v3/metadata/get-import-template", "params", 1,
+     "model_id",
+     "modelId:model_id"),
+    ("create_operate", "POST", "/api/v3/metadata/create-operate", "json", 6,
+     "show icon config operate_name operate_key model_id",
+     "show icon config operateName:operate_name operateKey:operate_key modelId:model_id"),
+    ("remove_operate", "POST", "/api/v3/metadata/remove-operate", "json", 3,
+     "custom_config model_id id",
+     "customConfig:custom_config modelId:model_id id"),
+    ("execute_operate", "POST", "/api/v3/metadata/execute-operate", "json", 3,
+     "custom_config model_id id",
+     "customConfig:custom_config modelId:model_id id"),
+    ("copy_operate", "POST", "/api/v3/metadata/copy-operate", "json", 3,
+     "custom_config model_id id",
+     "customConfig:custom_config modelId:model_id id"),
+    ("list_operate", "GET", "/api/v3/metadata/list-operate", "params", 1,
+     "model_id keywords page limit",
+     "keywords modelId:model_id page limit"),
+    ("list_operate_all", "GET", "/api/v3/metadata/all-operate", "params", 1,
+     "model_id",
+     "modelId:model_id"),
+    ("update_operate", "POST", "/api/v3/metadata/update-operate", "json", 7,
+     "icon config operate_name operate_key show model_id id",
+     "icon config operateName:operate_name operateKey:operate_key show modelId:model_id id"),
+    ("get_relation_info", "POST", "/api/v3/metadata/get-relation-info", "json", 2,
+     "id_list model_id",
+     "idList:id_list modelId:model_id"),
+    ("create_row_relation", "POST", "/api/v3/metadata/create-row-relation", "json", 4,
+     "value_list row_id field_id model_id",
+     "valueList:value_list rowId:row_id fieldId:field_id modelId:model_id"),
+    ("get_relation_value", "GET", "/api/v3/metadata/get-row-relation", "params", 3,
+     "model_id field_id row_id page limit",
+     "modelId:model_id fieldId:field_id rowId:row_id page limit"),
+    ("remove_relation_value", "POST", "/api/v3/metadata/remove-row-relation", "json", 4,
+     "value field_ids row_id model_id",
+     "value fieldIds:field_ids rowId:row_id modelId:model_id"),
+    ("export_model", "POST", "/api/v3/metadata/export/model", "json", 1,
+     "model_id",
+     "modelId:model_id"),
+    ("import_model", "POST", "/api/v3/metadata/import/model", "json", 1,
+     "file",
+     "file"),
+    ("capture", "POST", "/api/v3/metadata/ueba/capture", "json", 1,
+     "data model_id",
+     "data modelId:model_id"),
+    ("post_list", "GET", "/api/v3/list-post", "params", 0,
+     "keywords skip_count page limit with_metadata with_custom_data flat_custom_data",
+     "keywords skipCount:skip_count page limit withMetadata:with_metadata withCustomData:with_custom_data "
+     "flatCustomData:flat_custom_data"),
+    ("get_post", "GET", "/api/v3/get-post", "params", 1,
+     "code with_custom_data",
+     "code withCustomData:with_custom_data"),
+    ("get_user_posts", "GET", "/api/v3/get-user-posts", "params", 1,
+     "user_id with_custom_data",
+     "userId:user_id withCustomData:with_custom_data"),
+    ("get_user_post", "GET", "/api/v3/get-user-post", "params", 1,
+     "user_id with_custom_data",
+     "userId:user_id withCustomData:with_custom_data"),
+    ("get_post_by_id", "POST", "/api/v3/get-post-by-id", "json", 0,
+     "id_list with_custom_data",
+     "idList:id_list withCustomData:with_custom_data"),
+    ("create_post", "POST", "/api/v3/create-post", "json", 2,
+     "code name description department_id_list",
+     "code name description departmentIdList:department_id_list"),
+    ("update_post", "POST", "/api/v3/update-post", "json", 2,
+     "code name description department_id_list",
+     "code name description departmentIdList:department_id_list"),
+    ("remove_post", "POST", "/api/v3/remove-post", "json", 1,
+     "code",
+     "code"),
+    ("set_user_posts", "POST", "/api/v3/set-user-posts", "json", 2,
+     "post_ids user_id",
+     "postIds:post_ids userId:user_id"),
+    ("user_connection_post", "POST", "/api/v3/user-connection-post", "json", 2,
+     "user_id post_id",
+     "userId:user_id postId:post_id"),
+    ("delete_device", "POST", "/api/v3/delete-device-by-user", "json", 2,
+     "user_id id",
+     "userId:user_id id"),
+    ("suspend_device", "POST", "/api/v3/suspend-device-by-user", "json", 3,
+     "end_time user_id id",
+     "endTime:end_time userId:user_id id"),
+    ("disable_device", "POST", "/api/v3/disable-device-by-user", "json", 2,
+     "id user_id",
+     "id userId:user_id"),
+    ("enable_device", "POST", "/api/v3/enable-device-by-user", "json", 2,
+     "id user_id",
+     "id userId:user_id"),
+    ("get_device_status", "POST", "/api/v3/device-status", "json", 1,
+     "id",
+     "id"),
+    ("list_public_accounts", "POST", "/api/v3/list-public-accounts", "json", 0,
+     "keywords advanced_filter search_query options",
+     "keywords advancedFilter:advanced_filter searchQuery:search_query options"),
+    ("get_public_account", "GET", "/api/v3/get-public-account", "params", 1,
+     "user_id user_id_type with_custom_data with_department_ids",
+     "userId:user_id userIdType:user_id_type withCustomData:with_custom_data withDepartmentIds:with_department_ids"),
+    ("get_public_account_batch", "GET", "/api/v3/get-public-account-batch", "params", 1,
+     "user_ids user_id_type with_custom_data with_department_ids",
+     "userIds:user_ids userIdType:user_id_type withCustomData:with_custom_data withDepartmentIds:with_department_ids"),
+    ("create_public_account", "POST", "/api/v3/create-public-account", "json", 0,
+     "status email phone phone_country_code username external_id name nickname photo gender email_verified "
+     "phone_verified birthdate country province city address street_address postal_code company browser device "
+     "given_name family_name middle_name profile preferred_username website zoneinfo locale formatted region "
+     "password salt otp department_ids custom_data identity_number options",
+     "status email phone phoneCountryCode:phone_country_code username externalId:external_id name nickname photo "
+     "gender emailVerified:email_verified phoneVerified:phone_verified birthdate country province city address "
+     "streetAddress:street_address postalCode:postal_code company browser device givenName:given_name "
+     "familyName:family_name middleName:middle_name profile preferredUsername:preferred_username website zoneinfo "
+     "locale formatted region password salt otp departmentIds:department_ids customData:custom_data "
+     "identityNumber:identity_number options"),
+    ("create_public_accounts_batch", "POST", "/api/v3/create-public-accounts-batch", "json", 1,
+     "list options",
+     "list options"),
+    ("update_public_account", "POST", "/api/v3/update-public-account", "json", 1,
+     "user_id phone_country_code name nickname photo external_id status email_verified phone_verified birthdate "
+     "country province city address street_address postal_code gender username email phone password company browser "
+     "device given_name family_name middle_name profile preferred_username website zoneinfo locale formatted region "
+     "identity_number custom_data options",
+     "userId:user_id phoneCountryCode:phone_country_code name nickname photo externalId:external_id status "
+     "emailVerified:email_verified phoneVerified:phone_verified birthdate country province city address "
+     "streetAddress:street_address postalCode:postal_code gender username email phone password company browser "
+     "device givenName:given_name familyName:family_name middleName:middle_name profile "
+     "preferredUsername:preferred_username website zoneinfo locale formatted region identityNumber:identity_number "
+     "customData:custom_data options"),
+    ("update_public_account_batch", "POST", "/api/v3/update-public-account-batch", "json", 1,
+     "list options",
+     "list options"),
+    ("delete_public_accounts_batch", "POST", "/api/v3/delete-public-accounts-batch", "json", 1,
+     "user_ids options",
+     "userIds:user_ids options"),
+    ("kick_public_accounts", "POST", "/api/v3/kick-public-accounts", "json", 2,
+     "app_ids user_id options",
+     "appIds:app_ids userId:user_id options"),
+    ("change_into_public_account", "POST", "/api/v3/transfer-into-public-account", "json", 1,
+     "user_id",
+     "userId:user_id"),
+    ("get_public_accounts_of_user", "GET", "/api/v3/get-public-accounts-of-user", "params", 1,
+     "user_id",
+     "userId:user_id"),
+    ("get_users_of_public_account", "GET", "/api/v3/get-users-of-public-account", "params", 1,
+     "public_account_id",
+     "publicAccountId:public_account_id"),
+    ("bind_users_public_account", "POST", "/api/v3/set-public-account-of-users", "json", 2,
+     "public_account_id user_ids",
+     "publicAccountId:public_account_id userIds:user_ids"),
+    ("setuser_of_public_account", "POST", "/api/v3/set-user-of-public-accounts", "json", 2,
+     "user_id public_account_ids",
+     "userId:user_id publicAccountIds:public_account_ids"),
+    ("unbind_users_public_account", "POST", "/api/v3/unbind-public-account-of-user", "json", 2,
+     "user_id public_account_id",
+     "userId:user_id publicAccountId:public_account_id"),
+    ("get_organization", "GET", "/api/v3/get-organization", "params", 1,
+     "organization_code with_custom_data with_post tenant_id",
+     "organizationCode:organization_code withCustomData:with_custom_data withPost:with_post tenantId:tenant_id"),
+    ("get_organizations_batch", "GET", "/api/v3/get-organization-batch", "params", 1,
+     "organization_code_list with_custom_data with_post tenant_id",
+     "organizationCodeList:organization_code_list withCustomData:with_custom_data withPost:with_post "
+     "tenantId:tenant_id"),
+    ("list_organizations", "GET", "/api/v3/list-organizations", "params", 0,
+     "page limit fetch_all with_custom_data with_post tenant_id status",
+     "page limit fetchAll:fetch_all withCustomData:with_custom_data withPost:with_post tenantId:tenant_id status"),
+    ("create_organization", "POST", "/api/v3/create-organization", "json", 3,
+     "metadata organization_name organization_code description open_department_id i18n tenant_id post_id_list",
+     "metadata organizationName:organization_name organizationCode:organization_code description "
+     "openDepartmentId:open_department_id i18n tenantId:tenant_id postIdList:post_id_list"),
+    ("update_organization", "POST", "/api/v3/update-organization", "json", 1,
+     "organization_code description open_department_id leader_user_ids i18n tenant_id organization_new_code "
+     "organization_name post_id_list",
+     "organizationCode:organization_code description openDepartmentId:open_department_id "
+     "leaderUserIds:leader_user_ids i18n tenantId:tenant_id organizationNewCode:organization_new_code "
+     "organizationName:organization_name postIdList:post_id_list"),
+    ("delete_organization", "POST", "/api/v3/delete-organization", "json", 1,
+     "organization_code tenant_id",
+     "organizationCode:organization_code tenantId:tenant_id"),
+    ("search_organizations", "GET", "/api/v3/search-organizations", "params", 1,
+     "keywords page limit with_custom_data tenant_id",
+     "keywords page limit withCustomData:with_custom_data tenantId:tenant_id"),
+    ("update_organization_status", "POST", "/api/v3/update-organization-status", "json", 1,
+     "root_node_id status",
+     "rootNodeId:root_node_id status"),
+    ("get_department", "GET", "/api/v3/get-department", "params", 0,
+     "organization_code department_id department_code department_id_type with_custom_data flat_custom_data tenant_id",
+     "organizationCode:organization_code departmentId:department_id departmentCode:department_code "
+     "departmentIdType:department_id_type withCustomData:with_custom_data flatCustomData:flat_custom_data "
+     "tenantId:tenant_id"),
+    ("create_department", "POST", "/api/v3/create-department", "json", 4,
+     "organization_code name parent_department_id metadata open_department_id description code is_virtual_node i18n "
+     "custom_data department_id_type post_id_list tenant_id",
+     "organizationCode:organization_code name parentDepartmentId:parent_department_id metadata "
+     "openDepartmentId:open_department_id description code isVirtualNode:is_virtual_node i18n customData:custom_data "
+     "departmentIdType:department_id_type postIdList:post_id_list tenantId:tenant_id"),
+    ("update_department", "POST", "/api/v3/update-department", "json", 2,
+     "organization_code department_id leader_user_ids description code i18n status name department_id_type "
+     "parent_department_id custom_data post_id_list tenant_id",
+     "organizationCode:organization_code departmentId:department_id leaderUserIds:leader_user_ids description code "
+     "i18n status name departmentIdType:department_id_type parentDepartmentId:parent_department_id "
+     "customData:custom_data postIdList:post_id_list tenantId:tenant_id"),
+    ("delete_department", "POST", "/api/v3/delete-department", "json", 2,
+     "organization_code department_id department_id_type tenant_id",
+     "organizationCode:organization_code departmentId:department_id departmentIdType:department_id_type "
+     "tenantId:tenant_id"),
+    ("search_departments", "POST", "/api/v3/search-departments", "json", 2,
+     "keywords organization_code with_custom_data tenant_id",
+     "keywords organizationCode:organization_code withCustomData:with_custom_data tenantId:tenant_id"),
+    ("search_departments_list", "POST", "/api/v3/search-departments-list", "json", 1,
+     "organization_code with_custom_data with_post page limit advanced_filter sort_by order_by sort tenant_id",
+     "organizationCode:organization_code withCustomData:with_custom_data withPost:with_post page limit "
+     "advancedFilter:advanced_filter sortBy:sort_by orderBy:order_by sort tenantId:tenant_id"),
+    ("list_children_departments", "GET", "/api/v3/list-children-departments", "params", 2,
+     "organization_code department_id status department_id_type exclude_virtual_node only_virtual_node "
+     "with_custom_data tenant_id",
+     "organizationCode:organization_code departmentId:department_id status departmentIdType:department_id_type "
+     "excludeVirtualNode:exclude_virtual_node onlyVirtualNode:only_virtual_node withCustomData:with_custom_data "
+     "tenantId:tenant_id"),
+    ("get_all_departments", "GET", "/api/v3/get-all-departments", "params", 1,
+     "organization_code department_id department_id_type with_custom_data",
+     "organizationCode:organization_code departmentId:department_id departmentIdType:department_id_type "
+     "withCustomData:with_custom_data"),
+    ("list_department_members", "GET", "/api/v3/list-department-members", "params", 2,
+     "organization_code department_id sort_by order_by department_id_type include_children_departments page limit "
+     "with_custom_data with_identities with_department_ids tenant_id",
+     "organizationCode:organization_code departmentId:department_id sortBy:sort_by orderBy:order_by "
+     "departmentIdType:department_id_type includeChildrenDepartments:include_children_departments page limit "
+     "withCustomData:with_custom_data withIdentities:with_identities withDepartmentIds:with_department_ids "
+     "tenantId:tenant_id"),
+    ("list_department_member_ids", "GET", "/api/v3/list-department-member-ids", "params", 2,
+     "organization_code department_id department_id_type tenant_id",
+     "organizationCode:organization_code departmentId:department_id departmentIdType:department_id_type "
+     "tenantId:tenant_id"),
+    ("search_department_members", "GET", "/api/v3/search-department-members", "params", 3,
+     "organization_code department_id keywords page limit department_id_type include_children_departments "
+     "with_custom_data with_identities with_department_ids tenant_id",
+     "organizationCode:organization_code departmentId:department_id keywords page limit "
+     "departmentIdType:department_id_type includeChildrenDepartments:include_children_departments "
+     "withCustomData:with_custom_data withIdentities:with_identities withDepartmentIds:with_department_ids "
+     "tenantId:tenant_id"),
+    ("add_department_members", "POST", "/api/v3/add-department-members", "json", 3,
+     "user_ids organization_code department_id department_id_type tenant_id",
+     "userIds:user_ids organizationCode:organization_code departmentId:department_id "
+     "departmentIdType:department_id_type tenantId:tenant_id"),
+    ("remove_department_members", "POST", "/api/v3/remove-department-members", "json", 3,
+     "user_ids organization_code department_id department_id_type tenant_id",
+     "userIds:user_ids organizationCode:organization_code departmentId:department_id "
+     "departmentIdType:department_id_type tenantId:tenant_id"),
+    ("get_parent_department", "GET", "/api/v3/get-parent-department", "params", 2,
+     "organization_code department_id department_id_type with_custom_data tenant_id",
+     "organizationCode:organization_code departmentId:department_id departmentIdType:department_id_type "
+     "withCustomData:with_custom_data tenantId:tenant_id"),
+    ("is_user_in_department", "GET", "/api/v3/is-user-in-department", "params", 3,
+     "user_id organization_code department_id department_id_type include_children_departments tenant_id",
+     "userId:user_id organizationCode:organization_code departmentId:department_id "
+     "departmentIdType:department_id_type includeChildrenDepartments:include_children_departments tenantId:tenant_id"),
+    ("get_department_by_id", "GET", "/api/v3/get-department-by-id", "params", 1,
+     "department_id tenant_id with_custom_data",
+     "departmentId:department_id tenantId:tenant_id withCustomData:with_custom_data"),
+    ("create_department_tree", "POST", "/api/v3/create-department-tree", "json", 1,
+     "name children members tenant_id",
+     "name children members tenantId:tenant_id"),
+    ("get_department_sync_relations", "GET", "/api/v3/get-department-sync-relations", "params", 1,
+     "organization_code department_id department_id_type with_custom_data tenant_id",
+     "organizationCode:organization_code departmentId:department_id departmentIdType:department_id_type "
+     "withCustomData:with_custom_data tenantId:tenant_id"),
+    ("delete_department_sync_relations", "POST", "/api/v3/delete-department-sync-relations", "json", 3,
+     "provider department_id organization_code department_id_type",
+     "provider departmentId:department_id organizationCode:organization_code departmentIdType:department_id_type"),
+    ("update_node_status", "POST", "/api/v3/update-department-status", "json", 2,
+     "status department_id",
+     "status departmentId:department_id"),
+    ("list_users", "POST", "/api/v3/list-users", "json", 0,
+     "keywords advanced_filter search_query options",
+     "keywords advancedFilter:advanced_filter searchQuery:search_query options"),
+    ("list_users_legacy", "GET", "/api/v3/list-users", "params", 0,
+     "page limit status updated_at_start updated_at_end with_custom_data with_post with_identities "
+     "with_department_ids",
+     "page limit status updatedAtStart:updated_at_start updatedAtEnd:updated_at_end withCustomData:with_custom_data "
+     "withPost:with_post withIdentities:with_identities withDepartmentIds:with_department_ids"),
+    ("get_user", "GET", "/api/v3/get-user", "params", 1,
+     "user_id user_id_type flat_custom_data with_custom_data with_post with_identities with_department_ids",
+     "userId:user_id userIdType:user_id_type flatCustomData:flat_custom_data withCustomData:with_custom_data "
+     "withPost:with_post withIdentities:with_identities withDepartmentIds:with_department_ids"),
+    ("get_user_batch", "GET", "/api/v3/get-user-batch", "params", 1,
+     "user_ids user_id_type with_custom_data flat_custom_data with_identities with_department_ids",
+     "userIds:user_ids userIdType:user_id_type withCustomData:with_custom_data flatCustomData:flat_custom_data "
+     "withIdentities:with_identities withDepartmentIds:with_department_ids"),
+    ("user_field_decrypt", "POST", "/api/v3/users/field/decrypt", "json", 2,
+     "data private_key",
+     "data privateKey:private_key"),
+    ("create_user", "POST", "/api/v3/create-user", "json", 0,
+     "status email phone phone_country_code username external_id name nickname photo gender email_verified "
+     "phone_verified birthdate country province city address street_address postal_code company browser device "
+     "given_name family_name middle_name profile preferred_username website zoneinfo locale formatted region "
+     "password salt tenant_ids otp department_ids custom_data metadata_source identities identity_number options",
+     "status email phone phoneCountryCode:phone_country_code username externalId:external_id name nickname photo "
+     "gender emailVerified:email_verified phoneVerified:phone_verified birthdate country province city address "
+     "streetAddress:street_address postalCode:postal_code company browser device givenName:given_name "
+     "familyName:family_name middleName:middle_name profile preferredUsername:preferred_username website zoneinfo "
+     "locale formatted region password salt tenantIds:tenant_ids otp departmentIds:department_ids "
+     "customData:custom_data metadataSource:metadata_source identities identityNumber:identity_number options"),
+    ("create_users_batch", "POST", "/api/v3/create-users-batch", "json", 1,
+     "list options",
+     "list options"),
+    ("update_user", "POST", "/api/v3/update-user", "json", 1,
+     "user_id phone_country_code name nickname photo external_id status email_verified phone_verified birthdate "
+     "country province city address street_address postal_code gender username email phone password company browser "
+     "device given_name family_name middle_name profile preferred_username website zoneinfo locale formatted region "
+     "identity_number custom_data options",
+     "userId:user_id phoneCountryCode:phone_country_code name nickname photo externalId:external_id status "
+     "emailVerified:email_verified phoneVerified:phone_verified birthdate country province city address "
+     "streetAddress:street_address postalCode:postal_code gender username email phone password company browser "
+     "device givenName:given_name familyName:family_name middleName:middle_name profile "
+     "preferredUsername:preferred_username website zoneinfo locale formatted region identityNumber:identity_number "
+     "customData:custom_data options"),
+    ("update_user_batch", "POST", "/api/v3/update-user-batch", "json", 1,
+     "list options",
+     "list options"),
+    ("delete_users_batch", "POST", "/api/v3/delete-users-batch", "json", 1,
+     "user_ids options",
+     "userIds:user_ids options"),
+    ("get_user_identities", "GET", "/api/v3/get-user-identities", "params", 1,
+     "user_id user_id_type",
+     "userId:user_id userIdType:user_id_type"),
+    ("get_user_roles", "GET", "/api/v3/get-user-roles", "params", 1,
+     "user_id user_id_type namespace",
+     "userId:user_id userIdType:user_id_type namespace"),
+    ("get_user_principal_authentication_info", "GET", "/api/v3/get-user-principal-authentication-info", "params", 1,
+     "user_id user_id_type",
+     "userId:user_id userIdType:user_id_type"),
+    ("reset_user_principal_authentication_info", "POST", "/api/v3/reset-user-principal-authentication-info", "json", 1,
+     "user_id options",
+     "userId:user_id options"),
+    ("get_user_departments", "GET", "/api/v3/get-user-departments", "params", 1,
+     "user_id user_id_type page limit with_custom_data with_department_paths sort_by order_by",
+     "userId:user_id userIdType:user_id_type page limit withCustomData:with_custom_data "
+     "withDepartmentPaths:with_department_paths sortBy:sort_by orderBy:order_by"),
+    ("set_user_departments", "POST", "/api/v3/set-user-departments", "json", 2,
+     "user_id departments options",
+     "userId:user_id departments options"),
+    ("get_user_groups", "GET", "/api/v3/get-user-groups", "params", 1,
+     "user_id user_id_type",
+     "userId:user_id userIdType:user_id_type"),
+    ("get_user_mfa_info", "GET", "/api/v3/get-user-mfa-info", "params", 1,
+     "user_id user_id_type",
+     "userId:user_id userIdType:user_id_type"),
+    ("list_archived_users", "GET", "/api/v3/list-archived-users", "params", 0,
+     "page limit start_at",
+     "page limit startAt:start_at"),
+    ("kick_users", "POST", "/api/v3/kick-users", "json", 2,
+     "app_ids user_id options",
+     "appIds:app_ids userId:user_id options"),
+    ("is_user_exists", "POST", "/api/v3/is-user-exists", "json", 0,
+     "username email phone external_id",
+     "username email phone externalId:external_id"),
+    ("get_user_accessible_apps", "GET", "/api/v3/get-user-accessible-apps", "params", 1,
+     "user_id user_id_type",
+     "userId:user_id userIdType:user_id_type"),
+    ("get_user_authorized_apps", "GET", "/api/v3/get-user-authorized-apps", "params", 1,
+     "user_id user_id_type",
+     "userId:user_id userIdType:user_id_type"),
+    ("has_any_role", "POST", "/api/v3/has-any-role", "json", 2,
+     "roles user_id options",
+     "roles userId:user_id options"),
+    ("get_user_login_history", "GET", "/api/v3/get-user-login-history", "params", 1,
+     "user_id user_id_type app_id client_ip start end page limit",
+     "userId:user_id userIdType:user_id_type appId:app_id clientIp:client_ip start end page limit"),
+    ("get_user_loggedin_apps", "GET", "/api/v3/get-user-loggedin-apps", "params", 1,
+     "user_id user_id_type",
+     "userId:user_id userIdType:user_id_type"),
+    ("get_user_loggedin_identities", "GET", "/api/v3/get-user-logged-in-identities", "params", 1,
+     "user_id user_id_type",
+     "userId:user_id userIdType:user_id_type"),
+    ("resign_user", "POST", "/api/v3/resign-user", "json", 1,
+     "user_id user_id_type",
+     "userId:user_id userIdType:user_id_type"),
+    ("resign_user_batch", "POST", "/api/v3/resign-user-batch", "json", 1,
+     "user_ids user_id_type",
+     "userIds:user_ids userIdType:user_id_type"),
+    ("get_user_authorized_resources", "GET", "/api/v3/get-user-authorized-resources", "params", 1,
+     "user_id user_id_type namespace resource_type",
+     "userId:user_id userIdType:user_id_type namespace resourceType:resource_type"),
+    ("check_session_status", "POST", "/api/v3/check-session-status", "json", 2,
+     "app_id user_id",
+     "appId:app_id userId:user_id"),
+    ("import_otp", "POST", "/api/v3/import-otp", "json", 1,
+     "list",
+     "list"),
+    ("get_otp_secret_by_user", "GET", "/api/v3/get-otp-secret-by-user", "params", 1,
+     "user_id user_id_type",
+     "userId:user_id userIdType:user_id_type"),
+    ("get_user_password_ciphertext", "POST", "/api/v3/get-user-password-ciphertext", "json", 1,
+     "user_id user_id_type",
+     "userId:user_id userIdType:user_id_type"),
+    ("link_identity", "POST", "/api/v3/link-identity", "json", 3,
+     "user_id_in_idp user_id ext_idp_id type is_social",
+     "userIdInIdp:user_id_in_idp userId:user_id extIdpId:ext_idp_id type isSocial:is_social"),
+    ("unlink_identity", "POST", "/api/v3/unlink-identity", "json", 2,
+     "user_id ext_idp_id type is_social",
+     "userId:user_id extIdpId:ext_idp_id type isSocial:is_social"),
+    ("set_users_mfa_status", "POST", "/api/v3/set-mfa-status", "json", 2,
+     "mfa_trigger_data user_id user_id_type",
+     "mfaTriggerData:mfa_trigger_data userId:user_id userIdType:user_id_type"),
+    ("get_user_mfa_status", "GET", "/api/v3/get-mfa-status", "params", 1,
+     "user_id user_id_type",
+     "userId:user_id userIdType:user_id_type"),
+    ("get_user_sync_relations", "GET", "/api/v3/get-user-sync-relations", "params", 1,
+     "user_id user_id_type",
+     "userId:user_id userIdType:user_id_type"),
+    ("delete_user_sync_relations", "POST", "/api/v3/delete-user-sync-relations", "json", 2,
+     "provider user_id user_id_type",
+     "provider userId:user_id userIdType:user_id_type"),
+    ("get_public_account_roles", "GET", "/api/v3/get-roles-of-public-account", "params", 1,
+     "user_id user_id_type namespace",
+     "userId:user_id userIdType:user_id_type namespace"),
+    ("get_public_accounts_of_role", "GET", "/api/v3/get-public-accounts-of-role", "params", 1,
+     "role_id",
+     "roleId:role_id"),
+    ("bind_public_account_of_roles", "POST", "/api/v3/set-public-account-of-roles", "json", 2,
+     "role_ids user_id",
+     "roleIds:role_ids userId:user_id"),
+    ("get_public_accounts_of_group", "GET", "/api/v3/get-public-accounts-of-group", "params", 1,
+     "group_id",
+     "groupId:group_id"),
+    ("get_groups_of_public_account", "GET", "/api/v3/get-groups-of-public-account", "params", 1,
+     "user_id user_id_type",
+     "userId:user_id userIdType:user_id_type"),
+    ("get_public_account_of_groups", "POST", "/api/v3/set-public-account-of-groups", "json", 2,
+     "group_ids user_id",
+     "groupIds:group_ids userId:user_id"),
+    ("get_public_accounts_of_department", "GET", "/api/v3/get-public-accounts-of-department", "params", 1,
+     "department_id",
+     "departmentId:department_id"),
+    ("get_public_account_departments", "GET", "/api/v3/get-departments-of-public-account", "params", 1,
+     "user_id user_id_type page limit with_custom_data with_department_paths sort_by order_by",
+     "userId:user_id userIdType:user_id_type page limit withCustomData:with_custom_data "
+     "withDepartmentPaths:with_department_paths sortBy:sort_by orderBy:order_by"),
+    ("set_public_account_of_departments", "POST", "/api/v3/set-public-account-of-departments", "json", 2,
+     "user_id departments options",
+     "userId:user_id departments options"),
+    ("resign_public_account_batch", "POST", "/api/v3/resign-public-account-batch", "json", 1,
+     "user_ids user_id_type",
+     "userIds:user_ids userIdType:user_id_type"),
+    ("get_post_of_public_user", "GET", "/api/v3/get-post-of-public-account", "params", 1,
+     "user_id",
+     "userId:user_id"),
+    ("get_public_accounts_of_post", "GET", "/api/v3/get-public-accounts-of-post", "params", 1,
+     "post_id",
+     "postId:post_id"),
+    ("set_public_account_ofn_post", "POST", "/api/v3/set-public-account-of-post", "json", 2,
+     "user_id post_id",
+     "userId:user_id postId:post_id"),
+    ("unbind_public_account_of_post", "POST", "/api/v3/unbind-public-account-of-post", "json", 2,
+     "user_id post_id",
+     "userId:user_id postId:post_id"),
+    ("get_sync_task", "GET", "/api/v3/get-sync-task", "params", 1,
+     "sync_task_id",
+     "syncTaskId:sync_task_id"),
+    ("list_sync_tasks", "GET", "/api/v3/list-sync-tasks", "params", 0,
+     "page limit",
+     "page limit"),
+    ("create_sync_task", "POST", "/api/v3/create-sync-task", "json", 6,
+     "field_mapping sync_task_trigger sync_task_flow client_config sync_task_type sync_task_name organization_code "
+     "provisioning_scope timed_scheduler",
+     "fieldMapping:field_mapping syncTaskTrigger:sync_task_trigger syncTaskFlow:sync_task_flow "
+     "clientConfig:client_config syncTaskType:sync_task_type syncTaskName:sync_task_name "
+     "organizationCode:organization_code provisioningScope:provisioning_scope timedScheduler:timed_scheduler"),
+    ("update_sync_task", "POST", "/api/v3/update-sync-task", "json", 1,
+     "sync_task_id sync_task_name sync_task_type client_config sync_task_flow sync_task_trigger organization_code "
+     "provisioning_scope field_mapping timed_scheduler",
+     "syncTaskId:sync_task_id syncTaskName:sync_task_name syncTaskType:sync_task_type clientConfig:client_config "
+     "syncTaskFlow:sync_task_flow syncTaskTrigger:sync_task_trigger organizationCode:organization_code "
+     "provisioningScope:provisioning_scope fieldMapping:field_mapping timedScheduler:timed_scheduler"),
+    ("trigger_sync_task", "POST", "/api/v3/trigger-sync-task", "json", 1,
+     "sync_task_id",
+     "syncTaskId:sync_task_id"),
+    ("get_sync_job", "GET", "/api/v3/get-sync-job", "params", 1,
+     "sync_job_id",
+     "syncJobId:sync_job_id"),
+    ("list_sync_jobs", "GET", "/api/v3/list-sync-jobs", "params", 1,
+     "sync_task_id page limit sync_trigger",
+     "syncTaskId:sync_task_id page limit syncTrigger:sync_trigger"),
+    ("list_sync_job_logs", "GET", "/api/v3/list-sync-job-logs", "params", 1,
+     "sync_job_id page limit success action object_type",
+     "syncJobId:sync_job_id page limit success action objectType:object_type"),
+    ("list_sync_risk_operations", "GET", "/api/v3/list-sync-risk-operations", "params", 1,
+     "sync_task_id page limit status object_type",
+     "syncTaskId:sync_task_id page limit status objectType:object_type"),
+    ("trigger_sync_risk_operations", "POST", "/api/v3/trigger-sync-risk-operations", "json", 1,
+     "sync_risk_operation_ids",
+     "syncRiskOperationIds:sync_risk_operation_ids"),
+    ("cancel_sync_risk_operation", "POST", "/api/v3/cancel-sync-risk-operation", "json", 1,
+     "sync_risk_operation_ids",
+     "syncRiskOperationIds:sync_risk_operation_ids"),
+    ("get_group", "GET", "/api/v3/get-group", "params", 1,
+     "code with_custom_data",
+     "code withCustomData:with_custom_data"),
+    ("list_groups", "GET", "/api/v3/list-groups", "params", 0,
+     "keywords page limit with_metadata with_custom_data flat_custom_data",
+     "keywords page limit withMetadata:with_metadata withCustomData:with_custom_data flatCustomData:flat_custom_data"),
+    ("get_all_groups", "GET", "/api/v3/get-all-groups", "params", 0,
+     "fetch_members with_custom_data",
+     "fetchMembers:fetch_members withCustomData:with_custom_data"),
+    ("create_group", "POST", "/api/v3/create-group", "json", 4,
+     "type description name code custom_data",
+     "type description name code customData:custom_data"),
+    ("create_or_update_group", "POST", "/api/v3/create-or-update-group", "json", 4,
+     "type description name code",
+     "type description name code"),
+    ("create_groups_batch", "POST", "/api/v3/create-groups-batch", "json", 1,
+     "list",
+     "list"),
+    ("update_group", "POST", "/api/v3/update-group", "json", 2,
+     "description code name new_code custom_data",
+     "description code name newCode:new_code customData:custom_data"),
+    ("delete_groups_batch", "POST", "/api/v3/delete-groups-batch", "json", 1,
+     "code_list",
+     "codeList:code_list"),
+    ("add_group_members", "POST", "/api/v3/add-group-members", "json", 2,
+     "user_ids code",
+     "userIds:user_ids code"),
+    ("remove_group_members", "POST", "/api/v3/remove-group-members", "json", 2,
+     "user_ids code",
+     "userIds:user_ids code"),
+    ("list_group_members", "GET", "/api/v3/list-group-members", "params", 1,
+     "code page limit with_custom_data with_identities with_department_ids",
+     "code page limit withCustomData:with_custom_data withIdentities:with_identities "
+     "withDepartmentIds:with_department_ids"),
+    ("get_group_authorized_resources", "GET", "/api/v3/get-group-authorized-resources", "params", 1,
+     "code namespace resource_type",
+     "code namespace resourceType:resource_type"),
+    ("get_role", "GET", "/api/v3/get-role", "params", 1,
+     "code namespace",
+     "code namespace"),
+    ("assign_role", "POST", "/api/v3/assign-role", "json", 2,
+     "targets code end_time enable_time namespace",
+     "targets code endTime:end_time enableTime:enable_time namespace"),
+    ("assign_role_batch", "POST", "/api/v3/assign-role-batch", "json", 2,
+     "targets roles",
+     "targets roles"),
+    ("revoke_role", "POST", "/api/v3/revoke-role", "json", 2,
+     "targets code namespace",
+     "targets code namespace"),
+    ("revoke_role_batch", "POST", "/api/v3/revoke-role-batch", "json", 2,
+     "targets roles",
+     "targets roles"),
+    ("get_role_authorized_resources", "GET", "/api/v3/get-role-authorized-resources", "params", 1,
+     "code namespace resource_type",
+     "code namespace resourceType:resource_type"),
+    ("list_role_members", "GET", "/api/v3/list-role-members", "params", 1,
+     "code page limit with_custom_data with_identities with_department_ids namespace",
+     "page limit withCustomData:with_custom_data withIdentities:with_identities "
+     "withDepartmentIds:with_department_ids code namespace"),
+    ("list_role_departments", "GET", "/api/v3/list-role-departments", "params", 1,
+     "code namespace page limit",
+     "code namespace page limit"),
+    ("create_role", "POST", "/api/v3/create-role", "json", 1,
+     "code name namespace description disable_time",
+     "code name namespace description disableTime:disable_time"),
+    ("list_roles", "GET", "/api/v3/list-roles", "params", 0,
+     "page limit keywords namespace",
+     "page limit keywords namespace"),
+    ("delete_roles_batch", "POST", "/api/v3/delete-roles-batch", "json", 1,
+     "code_list namespace",
+     "codeList:code_list namespace"),
+    ("create_roles_batch", "POST", "/api/v3/create-roles-batch", "json", 1,
+     "list",
+     "list"),
+    ("update_role", "POST", "/api/v3/update-role", "json", 3,
+     "name new_code code namespace description status disable_time",
+     "name newCode:new_code code namespace description status disableTime:disable_time"),
+    ("delete_roles", "POST", "/api/v3/multiple-namespace-delete-roles-batch", "json", 1,
+     "role_list",
+     "roleList:role_list"),
+    ("check_params_namespace", "POST", "/api/v3/check-role-params", "json", 2,
+     "code namespace name",
+     "code namespace name"),
+    ("list_role_assignments", "GET", "/api/v3/list-role-assignments", "params", 1,
+     "role_code page limit query namespace_code target_type",
+     "page limit query roleCode:role_code namespaceCode:namespace_code targetType:target_type"),
+    ("create_admin_role", "POST", "/api/v3/create-admin-role", "json", 2,
+     "name code description",
+     "name code description"),
+    ("delete_admin_roles_batch", "POST", "/api/v3/delete-admin-roles", "json", 1,
+     "code_list",
+     "codeList:code_list"),
+    ("list_ext_idp", "GET", "/api/v3/list-ext-idp", "params", 0,
+     "tenant_id app_id",
+     "tenantId:tenant_id appId:app_id"),
+    ("get_ext_idp", "GET", "/api/v3/get-ext-idp", "params", 1,
+     "id tenant_id app_id type",
+     "tenantId:tenant_id appId:app_id id type"),
+    ("create_ext_idp", "POST", "/api/v3/create-ext-idp", "json", 2,
+     "name type tenant_id",
+     "name type tenantId:tenant_id"),
+    ("update_ext_idp", "POST", "/api/v3/update-ext-idp", "json", 2,
+     "name id tenant_id",
+     "name id tenantId:tenant_id"),
+    ("delete_ext_idp", "POST", "/api/v3/delete-ext-idp", "json", 1,
+     "id tenant_id",
+     "id tenantId:tenant_id"),
+    ("create_ext_idp_conn", "POST", "/api/v3/create-ext-idp-conn", "json", 5,
+     "ext_idp_id type identifier display_name fields login_only logo tenant_id",
+     "extIdpId:ext_idp_id type identifier displayName:display_name fields loginOnly:login_only logo "
+     "tenantId:tenant_id"),
+    ("update_ext_idp_conn", "POST", "/api/v3/update-ext-idp-conn", "json", 3,
+     "id display_name fields logo login_only tenant_id",
+     "id displayName:display_name fields logo loginOnly:login_only tenantId:tenant_id"),
+    ("delete_ext_idp_conn", "POST", "/api/v3/delete-ext-idp-conn", "json", 1,
+     "id tenant_id",
+     "id tenantId:tenant_id"),
+    ("change_ext_idp_conn_state", "POST", "/api/v3/change-ext-idp-conn-state", "json", 3,
+     "id enabled app_id tenant_id app_ids",
+     "id enabled appId:app_id tenantId:tenant_id appIds:app_ids"),
+    ("change_ext_idp_conn_association_state", "POST", "/api/v3/change-ext-idp-conn-association-state", "json", 2,
+     "id association tenant_id",
+     "id association tenantId:tenant_id"),
+    ("list_tenant_ext_idp", "GET", "/api/v3/list-tenant-ext-idp", "params", 0,
+     "tenant_id app_id type page limit",
+     "tenantId:tenant_id appId:app_id type page limit"),
+    ("ext_idp_conn_state_by_apps", "GET", "/api/v3/ext-idp-conn-apps", "params", 1,
+     "id tenant_id app_id type",
+     "tenantId:tenant_id appId:app_id id type"),
+    ("get_user_base_fields", "GET", "/api/v3/get-user-base-fields", None, 0,
+     "",
+     ""),
+    ("list_user_base_fields", "GET", "/api/v3/list-user-base-fields", "params", 2,
+     "target_type data_type tenant_id page limit user_visible admin_visible access_control keyword lang",
+     "tenantId:tenant_id targetType:target_type dataType:data_type page limit userVisible:user_visible "
+     "adminVisible:admin_visible accessControl:access_control keyword lang"),
+    ("set_user_base_fields", "POST", "/api/v3/set-user-base-fields", "json", 1,
+     "list",
+     "list"),
+    ("get_custom_fields", "GET", "/api/v3/get-custom-fields", "params", 1,
+     "target_type tenant_id",
+     "targetType:target_type tenantId:tenant_id"),
+    ("list_cust_fields", "GET", "/api/v3/list-custom-fields", "params", 2,
+     "target_type data_type tenant_id page limit user_visible admin_visible access_control keyword lang",
+     "tenantId:tenant_id targetType:target_type dataType:data_type page limit userVisible:user_visible "
+     "adminVisible:admin_visible accessControl:access_control keyword lang"),
+    ("set_custom_fields", "POST", "/api/v3/set-custom-fields", "json", 1,
+     "list tenant_id",
+     "list tenantId:tenant_id"),
+    ("delete_custom_fields", "POST", "/api/v3/delete-custom-fields", "json", 2,
+     "tenant_id list",
+     "tenantId:tenant_id list"),
+    ("set_custom_data", "POST", "/api/v3/set-custom-data", "json", 3,
+     "list target_identifier target_type tenant_id namespace",
+     "list targetIdentifier:target_identifier targetType:target_type tenantId:tenant_id namespace"),
+    ("get_custom_data", "GET", "/api/v3/get-custom-data", "params", 3,
+     "tenant_id target_type target_identifier namespace",
+     "tenantId:tenant_id targetType:target_type targetIdentifier:target_identifier namespace"),
+    ("create_resource", "POST", "/api/v3/create-resource", "json", 2,
+     "type code description name actions api_identifier namespace",
+     "type code description name actions apiIdentifier:api_identifier namespace"),
+    ("create_resources_batch", "POST", "/api/v3/create-resources-batch", "json", 1,
+     "list namespace",
+     "list namespace"),
+    ("get_resource", "GET", "/api/v3/get-resource", "params", 1,
+     "code namespace",
+     "code namespace"),
+    ("get_resources_batch", "GET", "/api/v3/get-resources-batch", "params", 1,
+     "code_list namespace",
+     "namespace codeList:code_list"),
+    ("list_common_resource", "GET", "/api/v3/list-common-resource", "params", 0,
+     "page limit keyword namespace_code_list",
+     "page limit keyword namespaceCodeList:namespace_code_list"),
+    ("list_resources", "GET", "/api/v3/list-resources", "params", 0,
+     "namespace type page limit",
+     "namespace type page limit"),
+    ("update_resource", "POST", "/api/v3/update-resource", "json", 1,
+     "code description name actions api_identifier namespace type",
+     "code description name actions apiIdentifier:api_identifier namespace type"),
+    ("delete_resource", "POST", "/api/v3/delete-resource", "json", 1,
+     "code namespace",
+     "code namespace"),
+    ("delete_resources_batch", "POST", "/api/v3/delete-resources-batch", "json", 0,
+     "namespace code_list ids",
+     "namespace codeList:code_list ids"),
+    ("batch_delete_common_resource", "POST", "/api/v3/delete-common-resources-batch", "json", 1,
+     "ids",
+     "ids"),
+    ("associate_tenant_resource", "POST", "/api/v3/associate-tenant-resource", "json", 3,
+     "code association app_id tenant_id",
+     "code association appId:app_id tenantId:tenant_id"),
+    ("create_namespace", "POST", "/api/v3/create-namespace", "json", 1,
+     "code name description",
+     "code name description"),
+    ("create_namespaces_batch", "POST", "/api/v3/create-namespaces-batch", "json", 1,
+     "list",
+     "list"),
+    ("get_namespace", "GET", "/api/v3/get-namespace", "params", 1,
+     "code",
+     "code"),
+    ("get_namespaces_batch", "GET", "/api/v3/get-namespaces-batch", "params", 1,
+     "code_list",
+     "codeList:code_list"),
+    ("update_namespace", "POST", "/api/v3/update-namespace", "json", 1,
+     "code description name new_code",
+     "code description name newCode:new_code"),
+    ("delete_namespace", "POST", "/api/v3/delete-namespace", "json", 1,
+     "code",
+     "code"),
+    ("delete_namespaces_batch", "POST", "/api/v3/delete-namespaces-batch", "json", 1,
+     "code_list",
+     "codeList:code_list"),
+    ("list_namespaces", "GET", "/api/v3/list-namespaces", "params", 0,
+     "page limit keywords",
+     "page limit keywords"),
+    ("list_namespace_roles", "GET", "/api/v3/list-namespace-roles", "params", 1,
+     "code page limit keywords",
+     "page limit code keywords"),
+    ("authorize_resources", "POST", "/api/v3/authorize-resources", "json", 1,
+     "list namespace",
+     "list namespace"),
+    ("get_authorized_resources", "GET", "/api/v3/get-authorized-resources", "params", 2,
+     "target_type target_identifier namespace resource_type resource_list with_denied",
+     "targetType:target_type targetIdentifier:target_identifier namespace resourceType:resource_type "
+     "resourceList:resource_list withDenied:with_denied"),
+    ("is_action_allowed", "POST", "/api/v3/is-action-allowed", "json", 3,
+     "user_id action resource namespace",
+     "userId:user_id action resource namespace"),
+    ("get_resource_authorized_targets", "POST", "/api/v3/get-resource-authorized-targets", "json", 1,
+     "resource namespace target_type page limit",
+     "resource namespace targetType:target_type page limit"),
+    ("get_user_action_logs", "POST", "/api/v3/get-user-action-logs", "json", 0,
+     "request_id client_ip event_type user_id app_id start end success pagination",
+     "requestId:request_id clientIp:client_ip eventType:event_type userId:user_id appId:app_id start end success "
+     "pagination"),
+    ("get_admin_audit_logs", "POST", "/api/v3/get-admin-audit-logs", "json", 0,
+     "request_id client_ip operation_type resource_type user_id success start end pagination",
+     "requestId:request_id clientIp:client_ip operationType:operation_type resourceType:resource_type userId:user_id "
+     "success start end pagination"),
+    ("get_email_templates", "GET", "/api/v3/get-email-templates", None, 0,
+     "",
+     ""),
+    ("update_email_template", "POST", "/api/v3/update-email-template", "json", 6,
+     "content sender subject name customize_enabled type expires_in redirect_to tpl_engine",
+     "content sender subject name customizeEnabled:customize_enabled type expiresIn:expires_in "
+     "redirectTo:redirect_to tplEngine:tpl_engine"),
+    ("preview_email_template", "POST", "/api/v3/preview-email-template", "json", 1,
+     "type content subject sender expires_in tpl_engine",
+     "type content subject sender expiresIn:expires_in tplEngine:tpl_engine"),
+    ("get_email_provider", "GET", "/api/v3/get-email-provider", None, 0,
+     "",
+     ""),
+    ("config_email_provider", "POST", "/api/v3/config-email-provider", "json", 2,
+     "type enabled smtp_config send_grid_config ali_exmail_config tencent_exmail_config",
+     "type enabled smtpConfig:smtp_config sendGridConfig:send_grid_config aliExmailConfig:ali_exmail_config "
+     "tencentExmailConfig:tencent_exmail_config"),
+    ("get_application", "GET", "/api/v3/get-application", "params", 1,
+     "app_id",
+     "appId:app_id"),
+    ("detail_auth_subject", "GET", "/api/v3/get-subject-auth-detail", "params", 3,
+     "target_id target_type app_id",
+     "targetId:target_id targetType:target_type appId:app_id"),
+    ("list_auth_subject", "POST", "/api/v3/list-subject-auth", "json", 2,
+     "target_type target_id app_name app_type_list effect enabled",
+     "targetType:target_type targetId:target_id appName:app_name appTypeList:app_type_list effect enabled"),
+    ("list_auth_application", "POST", "/api/v3/list-applications-auth", "json", 1,
+     "app_id page limit target_name target_type_list effect enabled",
+     "appId:app_id page limit targetName:target_name targetTypeList:target_type_list effect enabled"),
+    ("enabled_auth", "POST", "/api/v3/update-auth-enabled", "json", 2,
+     "enabled id",
+     "enabled id"),
+    ("delete_auth", "DELETE", "/api/v3/batch-applications-auth", "params", 1,
+     "auth_ids",
+     "authIds:auth_ids"),
+    ("list_applications", "GET", "/api/v3/list-applications", "params", 0,
+     "page limit is_integrate_app is_self_built_app sso_enabled keywords all",
+     "page limit isIntegrateApp:is_integrate_app isSelfBuiltApp:is_self_built_app ssoEnabled:sso_enabled keywords "
+     "all"),
+    ("get_application_simple_info", "GET", "/api/v3/get-application-simple-info", "params", 1,
+     "app_id",
+     "appId:app_id"),
+    ("list_application_simple_info", "GET", "/api/v3/list-application-simple-info", "params", 0,
+     "page limit is_integrate_app is_self_built_app sso_enabled keywords",
+     "page limit isIntegrateApp:is_integrate_app isSelfBuiltApp:is_self_built_app ssoEnabled:sso_enabled keywords"),
+    ("create_application", "POST", "/api/v3/create-application", "json", 1,
+     "app_name template template_data app_identifier app_logo app_description app_type default_protocol "
+     "redirect_uris logout_redirect_uris init_login_uri sso_enabled oidc_config saml_provider_enabled saml_config "
+     "oauth_provider_enabled oauth_config cas_provider_enabled cas_config login_config register_config "
+     "branding_config",
+     "appName:app_name template templateData:template_data appIdentifier:app_identifier appLogo:app_logo "
+     "appDescription:app_description appType:app_type defaultProtocol:default_protocol redirectUris:redirect_uris "
+     "logoutRedirectUris:logout_redirect_uris initLoginUri:init_login_uri ssoEnabled:sso_enabled "
+     "oidcConfig:oidc_config samlProviderEnabled:saml_provider_enabled samlConfig:saml_config "
+     "oauthProviderEnabled:oauth_provider_enabled oauthConfig:oauth_config casProviderEnabled:cas_provider_enabled "
+     "casConfig:cas_config loginConfig:login_config registerConfig:register_config brandingConfig:branding_config"),
+    ("delete_application", "POST", "/api/v3/delete-application", "json", 1,
+     "app_id",
+     "appId:app_id"),
+    ("get_application_secret", "GET", "/api/v3/get-application-secret", "params", 1,
+     "app_id",
+     "appId:app_id"),
+    ("refresh_application_secret", "POST", "/api/v3/refresh-application-secret", "json", 1,
+     "app_id",
+     "appId:app_id"),
+    ("list_application_active_users", "POST", "/api/v3/list-application-active-users", "json", 1,
+     "app_id options",
+     "appId:app_id options"),
+    ("get_application_permission_strategy", "GET", "/api/v3/get-application-permission-strategy", "params", 1,
+     "app_id",
+     "appId:app_id"),
+    ("update_application_permission_strategy", "POST", "/api/v3/update-application-permission-strategy", "json", 2,
+     "permission_strategy app_id",
+     "permissionStrategy:permission_strategy appId:app_id"),
+    ("authorize_application_access", "POST", "/api/v3/authorize-application-access", "json", 2,
+     "app_id list",
+     "appId:app_id list"),
+    ("revoke_application_access", "POST", "/api/v3/revoke-application-access", "json", 2,
+     "app_id list",
+     "appId:app_id list"),
+    ("check_domain_available", "POST", "/api/v3/check-domain-available", "json", 1,
+     "domain",
+     "domain"),
+    ("list_tenant_applications", "GET", "/api/v3/list-tenant-applications", "params", 4,
+     "page limit keywords sso_enabled",
+     "page limit keywords sso_enabled"),
+    ("update_login_page_config", "POST", "/api/v3/update-login-page-config", "json", 1,
+     "update",
+     "update"),
+    ("userpoll_tenant_config", "GET", "/api/v3/userpool-tenant-config", None, 0,
+     "",
+     ""),
+    ("update_user_pool_tenant_config", "POST", "/api/v3/update-userpool-tenant-config", "json", 1,
+     "update",
+     "update"),
+    ("update_tenant_qr_code_state", "POST", "/api/v3/update-userpool-tenant-appqrcode-state", "json", 1,
+     "enabled",
+     "enabled"),
+    ("change_userpool_tenan_ext_idp_conn_state", "POST", "/api/v3/change-userpool-tenant-ext-idp-conn-state", "json", 2,
+     "enabled conn_ids",
+     "enabled connIds:conn_ids"),
+    ("update_application_mfa_settings", "POST", "/api/v3/update-application-mfa-settings", "json", 1,
+     "app_id enabled_factors disabled_factors",
+     "appId:app_id enabledFactors:enabled_factors disabledFactors:disabled_factors"),
+    ("get_mfa_trigger_data", "GET", "/api/v3/get-mfa-trigger-data", "params", 2,
+     "app_id user_id user_id_type",
+     "appId:app_id userId:user_id userIdType:user_id_type"),
+    ("create_asa_account", "POST", "/api/v3/create-asa-account", "json", 2,
+     "account_info app_id",
+     "accountInfo:account_info appId:app_id"),
+    ("create_asa_account_batch", "POST", "/api/v3/create-asa-accounts-batch", "json", 2,
+     "list app_id",
+     "list appId:app_id"),
+    ("update_asa_account", "POST", "/api/v3/update-asa-account", "json", 3,
+     "account_info account_id app_id",
+     "accountInfo:account_info accountId:account_id appId:app_id"),
+    ("list_asa_account", "GET", "/api/v3/list-asa-accounts", "params", 1,
+     "app_id page limit",
+     "appId:app_id page limit"),
+    ("get_asa_account", "GET", "/api/v3/get-asa-account", "params", 2,
+     "app_id account_id",
+     "appId:app_id accountId:account_id"),
+    ("get_asa_account_batch", "POST", "/api/v3/get-asa-accounts-batch", "json", 2,
+     "account_ids app_id",
+     "accountIds:account_ids appId:app_id"),
+    ("delete_asa_account", "POST", "/api/v3/delete-asa-account", "json", 2,
+     "account_id app_id",
+     "accountId:account_id appId:app_id"),
+    ("delete_asa_account_batch", "POST", "/api/v3/delete-asa-accounts-batch", "json", 2,
+     "account_ids app_id",
+     "accountIds:account_ids appId:app_id"),
+    ("assign_asa_account", "POST", "/api/v3/assign-asa-account", "json", 3,
+     "app_id account_id targets",
+     "appId:app_id accountId:account_id targets"),
+    ("unassign_asa_account", "POST", "/api/v3/unassign-asa-account", "json", 3,
+     "app_id account_id targets",
+     "appId:app_id accountId:account_id targets"),
+    ("get_asa_account_assigned_targets", "GET", "/api/v3/get-asa-account-assigned-targets", "params", 2,
+     "app_id account_id page limit",
+     "appId:app_id accountId:account_id page limit"),
+    ("get_assigned_account", "GET", "/api/v3/get-assigned-account", "params", 3,
+     "app_id target_type target_identifier",
+     "appId:app_id targetType:target_type targetIdentifier:target_identifier"),
+    ("get_security_settings", "GET", "/api/v3/get-security-settings", None, 0,
+     "",
+     ""),
+    ("update_security_settings", "POST", "/api/v3/update-security-settings", "json", 0,
+     "allowed_origins authing_token_expires_in verify_code_length verify_code_max_attempts change_email_strategy "
+     "change_phone_strategy cookie_settings register_disabled register_anomaly_detection "
+     "complete_password_after_pass_code_login login_anomaly_detection login_require_email_verified "
+     "self_unlock_account enable_login_account_switch qrcode_login_strategy",
+     "allowedOrigins:allowed_origins authingTokenExpiresIn:authing_token_expires_in "
+     "verifyCodeLength:verify_code_length verifyCodeMaxAttempts:verify_code_max_attempts "
+     "changeEmailStrategy:change_email_strategy changePhoneStrategy:change_phone_strategy "
+     "cookieSettings:cookie_settings registerDisabled:register_disabled "
+     "registerAnomalyDetection:register_anomaly_detection "
+     "completePasswordAfterPassCodeLogin:complete_password_after_pass_code_login "
+     "loginAnomalyDetection:login_anomaly_detection loginRequireEmailVerified:login_require_email_verified "
+     "selfUnlockAccount:self_unlock_account enableLoginAccountSwitch:enable_login_account_switch "
+     "qrcodeLoginStrategy:qrcode_login_strategy"),
+    ("get_global_mfa_settings", "GET", "/api/v3/get-global-mfa-settings", None, 0,
+     "",
+     ""),
+    ("update_global_mfa_settings", "POST", "/api/v3/update-global-mfa-settings", "json", 1,
+     "enabled_factors",
+     "enabledFactors:enabled_factors"),
+    ("create_tenant", "POST", "/api/v3/create-tenant", "json", 2,
+     "name app_ids logo description reject_hint source_app_id enterprise_domains expire_time mau_amount "
+     "member_amount admin_amount",
+     "name appIds:app_ids logo description rejectHint:reject_hint sourceAppId:source_app_id "
+     "enterpriseDomains:enterprise_domains expireTime:expire_time mauAmount:mau_amount memberAmount:member_amount "
+     "adminAmount:admin_amount"),
+    ("update_tenant", "POST", "/api/v3/update-tenant", "json", 1,
+     "tenant_id name app_ids logo description reject_hint source_app_id",
+     "tenantId:tenant_id name appIds:app_ids logo description rejectHint:reject_hint sourceAppId:source_app_id"),
+    ("delete_tenant", "POST", "/api/v3/delete-tenant", "json", 1,
+     "tenant_id",
+     "tenantId:tenant_id"),
+    ("list_tenants", "GET", "/api/v3/list-tenants", "params", 0,
+     "keywords with_members_count with_app_detail with_creator_detail with_source_app_detail page limit source",
+     "keywords withMembersCount:with_members_count withAppDetail:with_app_detail "
+     "withCreatorDetail:with_creator_detail withSourceAppDetail:with_source_app_detail page limit source"),
+    ("get_tenant_little_info", "GET", "/api/v3/get-tenant-little-info", "params", 1,
+     "tenant_id with_members_count with_app_detail with_creator_detail with_source_app_detail",
+     "tenantId:tenant_id withMembersCount:with_members_count withAppDetail:with_app_detail "
+     "withCreatorDetail:with_creator_detail withSourceAppDetail:with_source_app_detail"),
+    ("get_tenant", "GET", "/api/v3/get-tenant", "params", 1,
+     "tenant_id with_members_count with_app_detail with_creator_detail with_source_app_detail",
+     "tenantId:tenant_id withMembersCount:with_members_count withAppDetail:with_app_detail "
+     "withCreatorDetail:with_creator_detail withSourceAppDetail:with_source_app_detail"),
+    ("import_tenant", "POST", "/api/v3/import-tenant", "json", 1,
+     "excel_url",
+     "excelUrl:excel_url"),
+    ("import_tenant_history", "GET", "/api/v3/import-tenant-history", "params", 0,
+     "page limit",
+     "page limit"),
+    ("import_tenant_notify_user", "GET", "/api/v3/import-tenant-notify-user", "params", 1,
+     "import_id page limit",
+     "importId:import_id page limit"),
+    ("send_email_batch", "POST", "/api/v3/send-email-batch", "json", 3,
+     "admin_name import_id users",
+     "adminName:admin_name importId:import_id users"),
+    ("send_sms_batch", "POST", "/api/v3/send-sms-batch", "json", 3,
+     "admin_name import_id users",
+     "adminName:admin_name importId:import_id users"),
+    ("list_tenant_admin", "POST", "/api/v3/list-tenant-admin", "json", 1,
+     "tenant_id keywords page limit",
+     "tenantId:tenant_id keywords page limit"),
+    ("set_tenant_admin", "POST", "/api/v3/set-tenant-admin", "json", 1,
+     "tenant_id link_user_ids member_ids",
+     "tenantId:tenant_id linkUserIds:link_user_ids memberIds:member_ids"),
+    ("delete_tenant_admin", "POST", "/api/v3/delete-tenant-admin", "json", 1,
+     "tenant_id link_user_id member_id",
+     "tenantId:tenant_id linkUserId:link_user_id memberId:member_id"),
+    ("delete_tenant_user", "POST", "/api/v3/delete-tenant-user", "json", 1,
+     "tenant_id link_user_ids member_ids",
+     "tenantId:tenant_id linkUserIds:link_user_ids memberIds:member_ids"),
+    ("generate_invite_tenant_user_link", "POST", "/api/v3/generate-invite-tenant-user-link", "json", 3,
+     "validity_term emails app_id tenant_id",
+     "validityTerm:validity_term emails appId:app_id tenantId:tenant_id"),
+    ("list_invite_tennat_user_records", "GET", "/api/v3/list-invite-tenant-user-records", "params", 3,
+     "keywords page limit",
+     "keywords page limit"),
+    ("list_multiple_tenant_admin", "GET", "/api/v3/list-multiple-tenant-admins", "params", 0,
+     "keywords page limit",
+     "keywords page limit"),
+    ("create_multiple_tenant_admin", "POST", "/api/v3/create-multiple-tenant-admin", "json", 2,
+     "tenant_ids user_id api_authorized send_phone_notification send_email_notification",
+     "tenantIds:tenant_ids userId:user_id apiAuthorized:api_authorized sendPhoneNotification:send_phone_notification "
+     "sendEmailNotification:send_email_notification"),
+    ("get_multiple_tenant_admin", "GET", "/api/v3/get-multiple-tenant-admin", "params", 1,
+     "user_id",
+     "userId:user_id"),
+    ("list_tenant_cooperators", "GET", "/api/v3/list-tenant-cooperators", "params", 0,
+     "keywords external page limit",
+     "keywords external page limit"),
+    ("get_tenant_cooperator", "GET", "/api/v3/get-tenant-cooperator", "params", 1,
+     "user_id",
+     "userId:user_id"),
+    ("get_tenant_cooperator_menu", "GET", "/api/v3/get-tenant-cooperator-menu", "params", 1,
+     "user_id",
+     "userId:user_id"),
+    ("create_tenant_cooperator", "POST", "/api/v3/create-tenant-cooperator", "json", 2,
+     "policies user_id api_authorized send_phone_notification send_email_notification",
+     "policies userId:user_id apiAuthorized:api_authorized sendPhoneNotification:send_phone_notification "
+     "sendEmailNotification:send_email_notification"),
+    ("get_tenant_by_code", "GET", "/api/v3/get-tenant-by-code", "params", 1,
+     "code",
+     "code"),
+    ("send_invite_tenant_user_email", "POST", "/api/v3/send-invite-tenant-user-email", "json", 0,
+     "",
+     ""),
+    ("add_tenant_users", "POST", "/api/v3/add-tenant-users", "json", 2,
+     "link_user_ids tenant_id",
+     "linkUserIds:link_user_ids tenantId:tenant_id"),
+    ("remove_tenant_users", "POST", "/api/v3/remove-tenant-users", "json", 1,
+     "tenant_id link_user_ids member_ids",
+     "tenantId:tenant_id linkUserIds:link_user_ids memberIds:member_ids"),
+    ("update_tenant_user", "POST", "/api/v3/update-tenant-user", "json", 2,
+     "updates tenant_id link_user_id member_id",
+     "updates tenantId:tenant_id linkUserId:link_user_id memberId:member_id"),
+    ("create_tenant_user", "POST", "/api/v3/create-tenant-user", "json", 2,
+     "tenant_id gender email phone phone_country_code username name nickname photo birthdate country province city "
+     "address street_address postal_code given_name family_name middle_name preferred_username password salt options",
+     "tenantId:tenant_id gender email phone phoneCountryCode:phone_country_code username name nickname photo "
+     "birthdate country province city address streetAddress:street_address postalCode:postal_code "
+     "givenName:given_name familyName:family_name middleName:middle_name preferredUsername:preferred_username "
+     "password salt options"),
+    ("list_tenant_users", "POST", "/api/v3/list-tenant-users", "json", 1,
+     "tenant_id keywords options",
+     "tenantId:tenant_id keywords options"),
+    ("get_tenant_user", "GET", "/api/v3/get-tenant-user", "params", 1,
+     "tenant_id link_user_id member_id",
+     "tenantId:tenant_id linkUserId:link_user_id memberId:member_id"),
+    ("add_tenant_department_members", "POST", "/api/v3/add-tenant-department-members", "json", 2,
+     "organization_code department_id department_id_type link_user_ids member_ids tenant_id",
+     "organizationCode:organization_code departmentId:department_id departmentIdType:department_id_type "
+     "linkUserIds:link_user_ids memberIds:member_ids tenantId:tenant_id"),
+    ("remove_tenant_department_members", "POST", "/api/v3/remove-tenant-department-members", "json", 2,
+     "organization_code department_id department_id_type link_user_ids member_ids tenant_id",
+     "organizationCode:organization_code departmentId:department_id departmentIdType:department_id_type "
+     "linkUserIds:link_user_ids memberIds:member_ids tenantId:tenant_id"),
+    ("create_permission_namespace", "POST", "/api/v3/create-permission-namespace", "json", 2,
+     "name code description",
+     "name code description"),
+    ("create_permission_namespaces_batch", "POST", "/api/v3/create-permission-namespaces-batch", "json", 1,
+     "list",
+     "list"),
+    ("get_permission_namespace", "GET", "/api/v3/get-permission-namespace", "params", 1,
+     "code",
+     "code"),
+    ("get_permission_namespaces_batch", "GET", "/api/v3/get-permission-namespaces-batch", "params", 1,
+     "codes",
+     "codes"),
+    ("list_permission_namespaces", "GET", "/api/v3/list-permission-namespaces", "params", 0,
+     "page limit query",
+     "page limit query"),
+    ("update_permission_namespace", "POST", "/api/v3/update-permission-namespace", "json", 1,
+     "code name new_code description",
+     "code name newCode:new_code description"),
+    ("delete_permission_namespace", "POST", "/api/v3/delete-permission-namespace", "json", 1,
+     "code",
+     "code"),
+    ("delete_permission_namespaces_batch", "POST", "/api/v3/delete-permission-namespaces-batch", "json", 1,
+     "codes",
+     "codes"),
+    ("check_permission_namespace_exists", "POST", "/api/v3/check-permission-namespace-exists", "json", 0,
+     "code name",
+     "code name"),
+    ("list_permission_namespace_roles", "GET", "/api/v3/list-permission-namespace-roles", "params", 1,
+     "code page limit query",
+     "page limit code query"),
+    ("create_data_resource", "POST", "/api/v3/create-data-resource", "json", 6,
+     "actions struct type resource_code resource_name namespace_code description",
+     "actions struct type resourceCode:resource_code resourceName:resource_name namespaceCode:namespace_code "
+     "description"),
+    ("create_data_resource_by_string", "POST", "/api/v3/create-string-data-resource", "json", 5,
+     "actions struct resource_code resource_name namespace_code description",
+     "actions struct resourceCode:resource_code resourceName:resource_name namespaceCode:namespace_code description"),
+    ("create_data_resource_by_array", "POST", "/api/v3/create-array-data-resource", "json", 5,
+     "actions struct resource_code resource_name namespace_code description",
+     "actions struct resourceCode:resource_code resourceName:resource_name namespaceCode:namespace_code description"),
+    ("create_data_resource_by_tree", "POST", "/api/v3/create-tree-data-resource", "json", 5,
+     "actions struct resource_code resource_name namespace_code description",
+     "actions struct resourceCode:resource_code resourceName:resource_name namespaceCode:namespace_code description"),
+    ("list_data_resources", "GET", "/api/v3/list-data-resources", "params", 0,
+     "page limit query namespace_codes",
+     "page limit query namespaceCodes:namespace_codes"),
+    ("get_data_resource", "GET", "/api/v3/get-data-resource", "params", 2,
+     "namespace_code resource_code",
+     "namespaceCode:namespace_code resourceCode:resource_code"),
+    ("update_data_resource", "POST", "/api/v3/update-data-resource", "json", 2,
+     "resource_code namespace_code resource_name description struct actions",
+     "resourceCode:resource_code namespaceCode:namespace_code resourceName:resource_name description struct actions"),
+    ("delete_data_resource", "POST", "/api/v3/delete-data-resource", "json", 2,
+     "resource_code namespace_code",
+     "resourceCode:resource_code namespaceCode:namespace_code"),
+    ("check_data_resource_exists", "GET", "/api/v3/check-data-resource-exists", "params", 1,
+     "namespace_code resource_name resource_code",
+     "namespaceCode:namespace_code resourceName:resource_name resourceCode:resource_code"),
+    ("create_data_policy", "POST", "/api/v3/create-data-policy", "json", 2,
+     "statement_list policy_name description",
+     "statementList:statement_list policyName:policy_name description"),
+    ("list_data_polices", "GET", "/api/v3/list-data-policies", "params", 0,
+     "page limit query",
+     "page limit query"),
+    ("list_simple_data_polices", "GET", "/api/v3/list-simple-data-policies", "params", 0,
+     "page limit query",
+     "page limit query"),
+    ("get_data_policy", "GET", "/api/v3/get-data-policy", "params", 1,
+     "policy_id",
+     "policyId:policy_id"),
+    ("update_data_policy", "POST", "/api/v3/update-data-policy", "json", 1,
+     "policy_id policy_name description statement_list",
+     "policyId:policy_id policyName:policy_name description statementList:statement_list"),
+    ("delete_data_policy", "POST", "/api/v3/delete-data-policy", "json", 1,
+     "policy_id",
+     "policyId:policy_id"),
+    ("check_data_policy_exists", "GET", "/api/v3/check-data-policy-exists", "params", 1,
+     "policy_name",
+     "policyName:policy_name"),
+    ("list_data_policy_targets", "GET", "/api/v3/list-data-policy-targets", "params", 1,
+     "policy_id page limit query target_type",
+     "policyId:policy_id page limit query targetType:target_type"),
+    ("authorize_data_policies", "POST", "/api/v3/authorize-data-policies", "json", 2,
+     "target_list policy_ids",
+     "targetList:target_list policyIds:policy_ids"),
+    ("revoke_data_policy", "POST", "/api/v3/revoke-data-policy", "json", 3,
+     "target_type target_identifier policy_id",
+     "targetType:target_type targetIdentifier:target_identifier policyId:policy_id"),
+    ("get_user_permission_list", "POST", "/api/v3/get-user-permission-list", "json", 1,
+     "user_ids namespace_codes",
+     "userIds:user_ids namespaceCodes:namespace_codes"),
+    ("check_permission", "POST", "/api/v3/check-permission", "json", 4,
+     "resources action user_id namespace_code judge_condition_enabled auth_env_params",
+     "resources action userId:user_id namespaceCode:namespace_code judgeConditionEnabled:judge_condition_enabled "
+     "authEnvParams:auth_env_params"),
+    ("check_external_user_permission", "POST", "/api/v3/check-external-user-permission", "json", 4,
+     "resources action external_id namespace_code judge_condition_enabled auth_env_params",
+     "resources action externalId:external_id namespaceCode:namespace_code "
+     "judgeConditionEnabled:judge_condition_enabled authEnvParams:auth_env_params"),
+    ("get_user_resource_permission_list", "POST", "/api/v3/get-user-resource-permission-list", "json", 3,
+     "resources user_id namespace_code",
+     "resources userId:user_id namespaceCode:namespace_code"),
+    ("list_resource_targets", "POST", "/api/v3/list-resource-targets", "json", 3,
+     "resources actions namespace_code",
+     "resources actions namespaceCode:namespace_code"),
+    ("get_user_resource_struct", "POST", "/api/v3/get-user-resource-struct", "json", 3,
+     "resource_code user_id namespace_code",
+     "resourceCode:resource_code userId:user_id namespaceCode:namespace_code"),
+    ("get_external_user_resource_struct", "POST", "/api/v3/get-external-user-resource-struct", "json", 3,
+     "resource_code external_id namespace_code",
+     "resourceCode:resource_code externalId:external_id namespaceCode:namespace_code"),
+    ("check_user_same_level_permission", "POST", "/api/v3/check-user-same-level-permission", "json", 5,
+     "resource_node_codes resource action user_id namespace_code judge_condition_enabled auth_env_params",
+     "resourceNodeCodes:resource_node_codes resource action userId:user_id namespaceCode:namespace_code "
+     "judgeConditionEnabled:judge_condition_enabled authEnvParams:auth_env_params"),
+    ("list_permission_view", "POST", "/api/v3/list-permission-view/data", "json", 0,
+     "page limit keyword",
+     "page limit keyword"),
+    ("get_current_package_info", "GET", "/api/v3/get-current-package-info", None, 0,
+     "",
+     ""),
+    ("get_usage_info", "GET", "/api/v3/get-usage-info", None, 0,
+     "",
+     ""),
+    ("get_mau_period_usage_history", "GET", "/api/v3/get-mau-period-usage-history", "params", 2,
+     "start_time end_time",
+     "startTime:start_time endTime:end_time"),
+    ("get_all_rights_item", "GET", "/api/v3/get-all-rights-items", None, 0,
+     "",
+     ""),
+    ("get_orders", "GET", "/api/v3/get-orders", "params", 0,
+     "page limit",
+     "page limit"),
+    ("get_order_detail", "GET", "/api/v3/get-order-detail", "params", 1,
+     "order_no",
+     "orderNo:order_no"),
+    ("get_order_pay_detail", "GET", "/api/v3/get-order-pay-detail", "params", 1,
+     "order_no",
+     "orderNo:order_no"),
+    ("create_event_app", "POST", "/api/v3/create-event-app", "json", 3,
+     "logo name identifier",
+     "logo name identifier"),
+    ("list_event_apps", "GET", "/api/v3/list-event-apps", None, 0,
+     "",
+     ""),
+    ("list_events", "GET", "/api/v3/list-events", "params", 0,
+     "page limit app",
+     "page limit app"),
+    ("define_event", "POST", "/api/v3/define-event", "json", 2,
+     "event_description event_type",
+     "eventDescription:event_description eventType:event_type"),
+    ("verify_event", "POST", "/api/v3/pub-event", "json", 2,
+     "event_type event_data",
+     "eventType:event_type eventData:event_data"),
+    ("pub_user_event", "POST", "/api/v3/pub-userEvent", "json", 2,
+     "event_type event_data",
+     "eventType:event_type eventData:event_data"),
+    ("add_whitelist", "POST", "/api/v3/add-whitelist", "json", 1,
+     "type list",
+     "type list"),
+    ("list_whitelists", "GET", "/api/v3/list-whitelist", "params", 1,
+     "type",
+     "type"),
+    ("delete_whitelist", "POST", "/api/v3/delete-whitelist", "json", 1,
+     "type list",
+     "type list"),
+    ("find_ip_list", "GET", "/api/v3/ip-list", "params", 1,
+     "ip_type page limit",
+     "page limit ipType:ip_type"),
+    ("add", "POST", "/api/v3/ip-list", "json", 6,
+     "expire_at limit_list remove_type add_type ip_type ips",
+     "expireAt:expire_at limitList:limit_list removeType:remove_type addType:add_type ipType:ip_type ips"),
+    ("delete_by_id", "DELETE", "/api/v3/ip-list/{id}", None, 1,
+     "id",
+     ""),
+    ("find_user_list", "GET", "/api/v3/user-list", "params", 1,
+     "user_list_type page limit",
+     "page limit userListType:user_list_type"),
+    ("add_user", "POST", "/api/v3/user-list", "json", 6,
+     "expire_at limit_list remove_type add_type user_list_type user_ids",
+     "expireAt:expire_at limitList:limit_list removeType:remove_type addType:add_type userListType:user_list_type "
+     "userIds:user_ids"),
+    ("delete_user_list_by_id", "DELETE", "/api/v3/user-list/{id}", None, 1,
+     "id",
+     ""),
+    ("find_risk_list_policy", "GET", "/api/v3/risk-list-policy", "params", 1,
+     "opt_object page limit",
+     "page limit optObject:opt_object"),
+    ("add_risk_list_policy", "POST", "/api/v3/risk-list-policy", "json", 11,
+     "limit_list action remove_type event_state_type count_thr time_range user_cond ip_cond user_range ip_range "
+     "opt_object",
+     "limitList:limit_list action removeType:remove_type eventStateType:event_state_type countThr:count_thr "
+     "timeRange:time_range userCond:user_cond ipCond:ip_cond userRange:user_range ipRange:ip_range "
+     "optObject:opt_object"),
+    ("delete_risk_list_policy_by_id", "DELETE", "/api/v3/risk-list-policy/{id}", None, 1,
+     "id",
+     ""),
+    ("create_device", "POST", "/api/v3/create-device", "json", 3,
+     "device_unique_id type custom_data name version hks fde hor sn producer mod os imei meid description language "
+     "cookie user_agent",
+     "deviceUniqueId:device_unique_id type customData:custom_data name version hks fde hor sn producer mod os imei "
+     "meid description language cookie userAgent:user_agent"),
+    ("find_last_login_apps_by_device_ids", "POST", "/api/v3/get-last-login-apps-by-deviceIds", "json", 1,
+     "device_ids user_id",
+     "deviceIds:device_ids userId:user_id"),
+    ("create_verify_device", "POST", "/api/v3/authing-verify/create-device", "json", 3,
+     "device_unique_id type custom_data name version hks fde hor sn producer mod os imei meid description language "
+     "cookie user_agent",
+     "deviceUniqueId:device_unique_id type customData:custom_data name version hks fde hor sn producer mod os imei "
+     "meid description language cookie userAgent:user_agent"),
+    ("create_pipeline_function", "POST", "/api/v3/create-pipeline-function", "json", 3,
+     "source_code scene func_name func_description is_asynchronous timeout terminate_on_timeout enabled",
+     "sourceCode:source_code scene funcName:func_name funcDescription:func_description "
+     "isAsynchronous:is_asynchronous timeout terminateOnTimeout:terminate_on_timeout enabled"),
+    ("get_pipeline_function", "GET", "/api/v3/get-pipeline-function", "params", 1,
+     "func_id",
+     "funcId:func_id"),
+    ("reupload_pipeline_function", "POST", "/api/v3/reupload-pipeline-function", "json", 1,
+     "func_id",
+     "funcId:func_id"),
+    ("update_pipeline_function", "POST", "/api/v3/update-pipeline-function", "json", 1,
+     "func_id func_name func_description source_code is_asynchronous timeout terminate_on_timeout enabled",
+     "funcId:func_id funcName:func_name funcDescription:func_description sourceCode:source_code "
+     "isAsynchronous:is_asynchronous timeout terminateOnTimeout:terminate_on_timeout enabled"),
+    ("update_pipeline_order", "POST", "/api/v3/update-pipeline-order", "json", 2,
+     "order scene",
+     "order scene"),
+    ("delete_pipeline_function", "POST", "/api/v3/delete-pipeline-function", "json", 1,
+     "func_id",
+     "funcId:func_id"),
+    ("list_pipeline_functions", "GET", "/api/v3/list-pipeline-functions", "params", 1,
+     "scene",
+     "scene"),
+    ("get_pipeline_logs", "GET", "/api/v3/get-pipeline-logs", "params", 1,
+     "func_id page limit",
+     "funcId:func_id page limit"),
+    ("create_webhook", "POST", "/api/v3/create-webhook", "json", 4,
+     "content_type events url name enabled secret",
+     "contentType:content_type events url name enabled secret"),
+    ("list_webhooks", "GET", "/api/v3/list-webhooks", "params", 0,
+     "page limit",
+     "page limit"),
+    ("update_webhook", "POST", "/api/v3/update-webhook", "json", 1,
+     "webhook_id name url events content_type enabled secret",
+     "webhookId:webhook_id name url events contentType:content_type enabled secret"),
+    ("delete_webhook", "POST", "/api/v3/delete-webhook", "json", 1,
+     "webhook_ids",
+     "webhookIds:webhook_ids"),
+    ("get_webhook_logs", "POST", "/api/v3/get-webhook-logs", "json", 1,
+     "webhook_id page limit",
+     "webhookId:webhook_id page limit"),
+    ("trigger_webhook", "POST", "/api/v3/trigger-webhook", "json", 1,
+     "webhook_id request_headers request_body",
+     "webhookId:webhook_id requestHeaders:request_headers requestBody:request_body"),
+    ("get_webhook", "GET", "/api/v3/get-webhook", "params", 1,
+     "webhook_id",
+     "webhookId:webhook_id"),
+    ("get_webhook_event_list", "GET", "/api/v3/get-webhook-event-list", None, 0,
+     "",
+     ""),
+    ("get_bind_pwd", "GET", "/api/v3/get-ldap-server-random-pwd", None, 0,
+     "",
+     ""),
+    ("query_ldap_config_info", "GET", "/api/v3/get-ldap-server-config", None, 0,
+     "",
+     ""),
+    ("update_ldap_config_info", "POST", "/api/v3/update-ldap-server-config", "json", 0,
+     "bind_pwd",
+     "bindPwd:bind_pwd"),
+    ("save_ldap_config_info", "POST", "/api/v3/enable-ldap-server", "json", 1,
+     "ldap_domain link_url",
+     "ldapDomain:ldap_domain linkUrl:link_url"),
+    ("disable_ldap_server", "POST", "/api/v3/disable-ldap-server", "json", 1,
+     "enabled",
+     "enabled"),
+    ("query_ldap_log", "GET", "/api/v3/get-ldap-server-log", "params", 3,
+     "type page limit connection operation_number error_code message start_time end_time",
+     "type connection operationNumber:operation_number errorCode:error_code message startTime:start_time "
+     "endTime:end_time page limit"),
+    ("query_ldap_sub_entries", "GET", "/api/v3/get-ldap-sub-entries", "params", 2,
+     "page limit dn",
+     "dn page limit"),
+    ("get_access_key_list", "GET", "/api/v3/list-access-key", "params", 0,
+     "user_id tenant_id type status",
+     "userId:user_id tenantId:tenant_id type status"),
+    ("get_access_key", "GET", "/api/v3/get-access-key", "params", 2,
+     "user_id access_key_id",
+     "userId:user_id accessKeyId:access_key_id"),
+    ("create_access_key", "POST", "/api/v3/create-access-key", "json", 1,
+     "type user_id tenant_id",
+     "type userId:user_id tenantId:tenant_id"),
+    ("delete_access_key", "POST", "/api/v3/delete-access-key", "json", 1,
+     "access_key_id",
+     "accessKeyId:access_key_id"),
+    ("update_access_key", "POST", "/api/v3/update-access-key", "json", 2,
+     "enable access_key_id",
+     "enable accessKeyId:access_key_id"),
+    ("get_verify_config_app", "GET", "/api/v3/verify-config-app", "params", 0,
+     "keywords",
+     "keywords"),
+)
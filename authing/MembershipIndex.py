@@ -0,0 +1,401 @@
+# coding: utf-8
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .utils import get_response_data
+from .utils.pagination import iter_pages
+
+# 默认处理的事件编码及其含义，可通过 events 参数修改，事件数据中需包含 userId（或 userIds）和角色 / 分组 code
+DEFAULT_MEMBERSHIP_EVENTS = {
+    "authing.role.assigned": ("role", True),
+    "authing.role.revoked": ("role", False),
+    "authing.group.member.added": ("group", True),
+    "authing.group.member.removed": ("group", False),
+}
+
+_DEFAULT_NAMESPACE = "default"
+
+
+def _iter_bits(bits):
+    """依次返回位图中为 1 的位的下标"""
+    # bin 和 str.find 都在 C 中执行，比逐位移位快得多
+    text = bin(bits)[:1:-1]
+    i = text.find("1")
+    while i >= 0:
+        yield i
+        i = text.find("1", i + 1)
+
+
+def _bit_count(value):
+    try:
+        return value.bit_count()
+    except AttributeError:
+        return bin(value).count("1")
+
+
+class MembershipIndex(object):
+    """角色、分组成员关系的本地位图索引
+
+    每个用户映射为一个整数下标，每个角色 / 分组的成员保存为一个 Python 整数位图（第 i 位表示下标为 i 的用户），
+    每个用户的角色 / 分组也保存为位图（第 j 位表示下标为 j 的角色 / 分组）。因此：
+
+    - has_any_role / has_all_roles / is_in_any_group 只需一次按位与，与角色数无关；
+    - users_with_any_role、users_with_all_roles、users_in_groups 等集合查询是整数位图的按位或 / 与，
+      由解释器按机器字批量计算，比逐个集合求交集快得多。
+
+    通过 load 从 list_roles / list_role_members、list_groups / list_group_members 分页加载；
+    通过本类的 assign_role、revoke_role、assign_role_batch、revoke_role_batch、add_group_members、remove_group_members
+    修改时，会在调用接口成功后增量更新索引；on_event 可作为 sub_event 的回调，处理其他途径产生的成员变更。
+
+    角色以 (namespace, code) 区分，namespace 为空时视为 default。只记录直接授权给用户的角色，
+    授权给部门等其他主体时，会重新拉取该角色的成员列表。
+    """
+
+    def __init__(self, management_client, max_workers=8, page_size=50, events=None):
+        """
+        Args:
+            management_client (ManagementClient): 管理客户端
+            max_workers (int): 并发拉取成员列表的最大线程数
+            page_size (int): 每页数目
+            events (dict): 事件编码 -> ("role" 或 "group", 是否为加入)，默认为 DEFAULT_MEMBERSHIP_EVENTS
+        """
+        self.management_client = management_client
+        self.max_workers = max_workers
+        self.page_size = page_size
+        self.events = DEFAULT_MEMBERSHIP_EVENTS if events is None else events
+        self._lock = threading.RLock()
+        self.__reset()
+
+    def __reset(self):
+        # 用户 ID <-> 下标
+        self._user_index = {}
+        self._users = []
+        # 角色 / 分组 key <-> 下标，角色 key 为 (namespace, code)，分组 key 为 code
+        self._key_index = {"role": {}, "group": {}}
+        self._keys = {"role": [], "group": []}
+        # 角色 / 分组下标 -> 成员位图
+        self._members = {"role": [], "group": []}
+        # 用户下标 -> 角色 / 分组位图
+        self._memberships = {"role": [], "group": []}
+
+    # ==== 加载 ====
+
+    def load(self, roles=None, groups=None):
+        """从服务端全量加载，roles 为 (namespace, code) 或 code 列表，groups 为分组 code 列表，不传时加载全部"""
+        if roles is None:
+            roles = [(r.get("namespace"), r["code"]) for r in self.__list_all(self.management_client.list_roles)]
+        if groups is None:
+            groups = [g["code"] for g in self.__list_all(self.management_client.list_groups)]
+        roles = [self.__role_key(role) for role in roles]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            role_members = list(executor.map(lambda key: self.__fetch_role_members(*key), roles))
+            group_members = list(executor.map(self.__fetch_group_members, groups))
+
+        with self._lock:
+            self.__reset()
+            for key, user_ids in zip(roles, role_members):
+                self.__set_members("role", key, user_ids)
+            for code, user_ids in zip(groups, group_members):
+                self.__set_members("group", code, user_ids)
+        return self
+
+    def refresh_role(self, code, namespace=None):
+        """从服务端重新拉取单个角色的成员"""
+        key = self.__role_key((namespace, code))
+        user_ids = self.__fetch_role_members(*key)
+        with self._lock:
+            self.__set_members("role", key, user_ids)
+
+    def refresh_group(self, code):
+        """从服务端重新拉取单个分组的成员"""
+        user_ids = self.__fetch_group_members(code)
+        with self._lock:
+            self.__set_members("group", code, user_ids)
+
+    def __list_all(self, method):
+        items = []
+        for _, page_items in iter_pages(lambda page, limit: method(page=page, limit=limit),
+                                        limit=self.page_size, max_workers=self.max_workers):
+            items.extend(page_items)
+        return items
+
+    def __fetch_role_members(self, namespace, code):
+        def fetch_page(page, limit):
+            return self.management_client.list_role_members(
+                code=code, namespace=None if namespace == _DEFAULT_NAMESPACE else namespace, page=page, limit=limit)
+        return [u["userId"] for _, items in iter_pages(fetch_page, limit=self.page_size, max_workers=2)
+                for u in items]
+
+    def __fetch_group_members(self, code):
+        def fetch_page(page, limit):
+            return self.management_client.list_group_members(code=code, page=page, limit=limit)
+        return [u["userId"] for _, items in iter_pages(fetch_page, limit=self.page_size, max_workers=2)
+                for u in items]
+
+    # ==== 内部结构 ====
+
+    @staticmethod
+    def __role_key(role):
+        if isinstance(role, (tuple, list)):
+            namespace, code = role
+        else:
+            namespace, code = None, role
+        return namespace or _DEFAULT_NAMESPACE, code
+
+    def __user(self, user_id, create=False):
+        index = self._user_index.get(user_id)
+        if index is None and create:
+            index = self._user_index[user_id] = len(self._users)
+            self._users.append(user_id)
+            self._memberships["role"].append(0)
+            self._memberships["group"].append(0)
+        return index
+
+    def __key(self, kind, key, create=False):
+        index = self._key_index[kind].get(key)
+        if index is None and create:
+            index = self._key_index[kind][key] = len(self._keys[kind])
+            self._keys[kind].append(key)
+            self._members[kind].append(0)
+        return index
+
+    def __add(self, kind, key, user_id):
+        k = self.__key(kind, key, create=True)
+        u = self.__user(user_id, create=True)
+        self._members[kind][k] |= 1 << u
+        self._memberships[kind][u] |= 1 << k
+
+    def __remove(self, kind, key, user_id):
+        k = self.__key(kind, key)
+        u = self.__user(user_id)
+        if k is None or u is None:
+            return
+        self._members[kind][k] &= ~(1 << u)
+        self._memberships[kind][u] &= ~(1 << k)
+
+    def __set_members(self, kind, key, user_ids):
+        k = self.__key(kind, key, create=True)
+        for u in _iter_bits(self._members[kind][k]):
+            self._memberships[kind][u] &= ~(1 << k)
+        # 逐个 |= 1 << u 每次都要复制整个位图，批量写入时先在 bytearray 中置位再一次性转换
+        flag = 1 << k
+        indexes = []
+        for user_id in user_ids:
+            u = self.__user(user_id, create=True)
+            self._memberships[kind][u] |= flag
+            indexes.append(u)
+        buf = bytearray((max(indexes) >> 3) + 1 if indexes else 0)
+        for u in indexes:
+            buf[u >> 3] |= 1 << (u & 7)
+        self._members[kind][k] = int.from_bytes(bytes(buf), "little")
+
+    def __mask(self, kind, keys):
+        mask = 0
+        for key in keys:
+            k = self._key_index[kind].get(self.__role_key(key) if kind == "role" else key)
+            if k is not None:
+                mask |= 1 << k
+        return mask
+
+    def __users_of(self, bits):
+        return [self._users[u] for u in _iter_bits(bits)]
+
+    def __combine(self, kind, keys, all_of):
+        members = self._members[kind]
+        result = None
+        for key in keys:
+            k = self._key_index[kind].get(self.__role_key(key) if kind == "role" else key)
+            bits = members[k] if k is not None else 0
+            if result is None:
+                result = bits
+            elif all_of:
+                result &= bits
+            else:
+                result |= bits
+        return result or 0
+
+    # ==== 查询 ====
+
+    def role_mask(self, roles):
+        """预先计算角色集合的位图，可传给 has_any_role / has_all_roles 以免每次重新计算"""
+        with self._lock:
+            return self.__mask("role", roles)
+
+    def group_mask(self, groups):
+        """预先计算分组集合的位图，可传给 is_in_any_group / is_in_all_groups"""
+        with self._lock:
+            return self.__mask("group", groups)
+
+    def __test(self, kind, user_id, keys, all_of):
+        u = self._user_index.get(user_id)
+        mask = keys if isinstance(keys, int) else self.__mask(kind, keys)
+        if u is None or not mask:
+            return False
+        bits = self._memberships[kind][u] & mask
+        return bits == mask if all_of else bits != 0
+
+    def has_any_role(self, user_id, roles):
+        """用户是否拥有 roles 中的任意一个角色，roles 为 (namespace, code) / code 列表或 role_mask 的返回值"""
+        return self.__test("role", user_id, roles, False)
+
+    def has_all_roles(self, user_id, roles):
+        """用户是否拥有 roles 中的全部角色"""
+        return self.__test("role", user_id, roles, True)
+
+    def is_in_any_group(self, user_id, groups):
+        """用户是否属于 groups 中的任意一个分组"""
+        return self.__test("group", user_id, groups, False)
+
+    def is_in_all_groups(self, user_id, groups):
+        """用户是否属于 groups 中的全部分组"""
+        return self.__test("group", user_id, groups, True)
+
+    def get_user_roles(self, user_id):
+        """返回用户的角色 (namespace, code) 列表"""
+        with self._lock:
+            u = self._user_index.get(user_id)
+            if u is None:
+                return []
+            return [self._keys["role"][k] for k in _iter_bits(self._memberships["role"][u])]
+
+    def get_user_groups(self, user_id):
+        """返回用户的分组 code 列表"""
+        with self._lock:
+            u = self._user_index.get(user_id)
+            if u is None:
+                return []
+            return [self._keys["group"][k] for k in _iter_bits(self._memberships["group"][u])]
+
+    def list_role_members(self, code, namespace=None):
+        with self._lock:
+            return self.__users_of(self.__combine("role", [(namespace, code)], False))
+
+    def list_group_members(self, code):
+        with self._lock:
+            return self.__users_of(self.__combine("group", [code], False))
+
+    def users_with_any_role(self, roles):
+        with self._lock:
+            return self.__users_of(self.__combine("role", roles, False))
+
+    def users_with_all_roles(self, roles):
+        with self._lock:
+            return self.__users_of(self.__combine("role", roles, True))
+
+    def users_in_any_group(self, groups):
+        with self._lock:
+            return self.__users_of(self.__combine("group", groups, False))
+
+    def users_in_all_groups(self, groups):
+        with self._lock:
+            return self.__users_of(self.__combine("group", groups, True))
+
+    def users_with_roles_in_groups(self, roles, groups, all_roles=False, all_groups=False):
+        """同时满足角色条件和分组条件的用户"""
+        with self._lock:
+            bits = self.__combine("role", roles, all_roles) & self.__combine("group", groups, all_groups)
+            return self.__users_of(bits)
+
+    def count_role_members(self, code, namespace=None):
+        with self._lock:
+            return _bit_count(self.__combine("role", [(namespace, code)], False))
+
+    def count_group_members(self, code):
+        with self._lock:
+            return _bit_count(self.__combine("group", [code], False))
+
+    # ==== 写入 ====
+
+    def __apply_targets(self, targets, roles, added):
+        user_ids = [t.get("targetIdentifier") for t in targets if (t.get("targetType") or "USER").upper() == "USER"]
+        others = len(user_ids) != len(targets)
+        for role in roles:
+            key = self.__role_key(role)
+            if others:
+                # 授权给部门等主体时无法在本地展开，重新拉取成员
+                self.refresh_role(key[1], key[0])
+                continue
+            with self._lock:
+                for user_id in user_ids:
+                    if added:
+                        self.__add("role", key, user_id)
+                    else:
+                        self.__remove("role", key, user_id)
+
+    def assign_role(self, targets, code, namespace=None, **kwargs):
+        """分配角色并更新本地索引，参数同 ManagementClient.assign_role"""
+        resp = self.management_client.assign_role(targets=targets, code=code, namespace=namespace, **kwargs)
+        get_response_data(resp)
+        self.__apply_targets(targets, [(namespace, code)], True)
+        return resp
+
+    def revoke_role(self, targets, code, namespace=None):
+        """移除角色并更新本地索引，参数同 ManagementClient.revoke_role"""
+        resp = self.management_client.revoke_role(targets=targets, code=code, namespace=namespace)
+        get_response_data(resp)
+        self.__apply_targets(targets, [(namespace, code)], False)
+        return resp
+
+    def assign_role_batch(self, targets, roles):
+        """批量分配角色并更新本地索引，roles 中的元素为 {"code": ..., "namespace": ...}"""
+        resp = self.management_client.assign_role_batch(targets=targets, roles=roles)
+        get_response_data(resp)
+        self.__apply_targets(targets, [(r.get("namespace"), r["code"]) for r in roles], True)
+        return resp
+
+    def revoke_role_batch(self, targets, roles):
+        """批量移除角色并更新本地索引"""
+        resp = self.management_client.revoke_role_batch(targets=targets, roles=roles)
+        get_response_data(resp)
+        self.__apply_targets(targets, [(r.get("namespace"), r["code"]) for r in roles], False)
+        return resp
+
+    def add_group_members(self, user_ids, code):
+        """添加分组成员并更新本地索引"""
+        resp = self.management_client.add_group_members(user_ids=user_ids, code=code)
+        get_response_data(resp)
+        with self._lock:
+            for user_id in user_ids:
+                self.__add("group", code, user_id)
+        return resp
+
+    def remove_group_members(self, user_ids, code):
+        """移除分组成员并更新本地索引"""
+        resp = self.management_client.remove_group_members(user_ids=user_ids, code=code)
+        get_response_data(resp)
+        with self._lock:
+            for user_id in user_ids:
+                self.__remove("group", code, user_id)
+        return resp
+
+    def on_event(self, message):
+        """事件回调，可直接传给 ManagementClient.sub_event"""
+        try:
+            event = json.loads(message) if isinstance(message, (str, bytes)) else message
+        except ValueError:
+            return
+        if not isinstance(event, dict):
+            return
+        code = event.get("eventType") or event.get("eventCode") or event.get("eventName")
+        if code not in self.events:
+            return
+        kind, added = self.events[code]
+        data = event.get("data") if isinstance(event.get("data"), dict) else event
+        user_ids = data.get("userIds") or ([data["userId"]] if data.get("userId") else [])
+        if kind == "role":
+            code = data.get("roleCode") or data.get("code")
+            # 没有角色 code 时不能生成 (namespace, None) 这样的 key
+            key = self.__role_key((data.get("namespace"), code)) if code else None
+        else:
+            key = data.get("groupCode") or data.get("code")
+        if not key or not user_ids:
+            return
+        with self._lock:
+            for user_id in user_ids:
+                if added:
+                    self.__add(kind, key, user_id)
+                else:
+                    self.__remove(kind, key, user_id)
@@ -0,0 +1,199 @@
+# coding: utf-8
+
+import bisect
+import threading
+
+from .utils.pagination import iter_pages
+
+
+class MetadataRowScanner(object):
+    """数据对象行扫描器
+
+    list_row 每页最多 50 条，本类在 max_workers 个线程内并发拉取后续分页，按页码顺序流式返回行数据。
+    """
+
+    def __init__(self, management_client, model_id, page_size=50, max_workers=8):
+        """
+        Args:
+            management_client (ManagementClient): 管理客户端
+            model_id (str): 功能 id
+            page_size (int): 每页数目，最大不能超过 50
+            max_workers (int): 最大并发请求数
+        """
+        self.management_client = management_client
+        self.model_id = model_id
+        self.page_size = page_size
+        self.max_workers = max_workers
+
+    def iter_pages(self, **kwargs):
+        """按页返回 (page, rows)，kwargs 透传给 list_row，如 conditions、sort、keywords"""
+        def fetch_page(page, limit):
+            return self.management_client.list_row(model_id=self.model_id, page=page, limit=limit, **kwargs)
+
+        return iter_pages(fetch_page, limit=self.page_size, max_workers=self.max_workers)
+
+    def iter_rows(self, **kwargs):
+        """逐行返回数据对象的所有行，kwargs 透传给 list_row"""
+        for _, rows in self.iter_pages(**kwargs):
+            for row in rows:
+                yield row
+
+    def load_cache(self, id_key="id", **kwargs):
+        """扫描全部行并构建本地列式缓存 MetadataRowCache"""
+        cache = MetadataRowCache(id_key=id_key)
+        for _, rows in self.iter_pages(**kwargs):
+            cache.extend(rows)
+        return cache
+
+
+_MISSING = object()
+
+
+class MetadataRowCache(object):
+    """数据对象行的本地列式缓存
+
+    行数据按列存储，EQUAL / IN 条件使用按需构建的哈希索引，GREATER / LESS 等范围条件使用按需构建的有序索引，
+    从而在本地执行与 list_row 相同结构的 conditions / sort 查询，无需每次请求服务端。
+
+    conditions 中每一项形如 {"key": 字段 key, "operator": 操作符, "value": 值}，支持的操作符：
+    EQUAL、NOT_EQUAL、IN、NOT_IN、CONTAINS、NOT_CONTAINS、GREATER、GREATER_OR_EQUAL、LESS、LESS_OR_EQUAL、
+    IS_NULL、NOT_NULL。sort 中每一项形如 {"key": 字段 key, "value": "asc" 或 "desc"}。
+    """
+
+    def __init__(self, id_key="id"):
+        self.id_key = id_key
+        self._columns = {}
+        self._size = 0
+        self._positions = {}
+        self._hash_indexes = {}
+        self._sorted_indexes = {}
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return self._size
+
+    def extend(self, rows):
+        """追加或覆盖行数据，按 id_key 判断是否为已有行"""
+        with self._lock:
+            for row in rows:
+                row_id = row.get(self.id_key)
+                position = self._positions.get(row_id) if row_id is not None else None
+                if position is None:
+                    position = self._size
+                    self._size += 1
+                    for column in self._columns.values():
+                        column.append(_MISSING)
+                    if row_id is not None:
+                        self._positions[row_id] = position
+                for key, value in row.items():
+                    column = self._columns.get(key)
+                    if column is None:
+                        column = self._columns[key] = [_MISSING] * self._size
+                    column[position] = value
+            self._hash_indexes.clear()
+            self._sorted_indexes.clear()
+
+    def get(self, row_id):
+        """按行 id 获取行数据"""
+        position = self._positions.get(row_id)
+        return None if position is None else self.__row(position)
+
+    def __row(self, position):
+        return {k: c[position] for k, c in self._columns.items() if c[position] is not _MISSING}
+
+    def __hash_index(self, key):
+        index = self._hash_indexes.get(key)
+        if index is None:
+            index = {}
+            for position, value in enumerate(self._columns.get(key, ())):
+                if value is _MISSING or isinstance(value, (list, dict)):
+                    continue
+                index.setdefault(value, []).append(position)
+            self._hash_indexes[key] = index
+        return index
+
+    def __sorted_index(self, key, numeric):
+        # 数值和字符串分别建立索引，避免不同类型之间比较
+        index = self._sorted_indexes.get((key, numeric))
+        if index is None:
+            types = (int, float) if numeric else (str,)
+            pairs = sorted(
+                (value, position) for position, value in enumerate(self._columns.get(key, ()))
+                if isinstance(value, types) and not isinstance(value, bool)
+            )
+            index = ([p[0] for p in pairs], [p[1] for p in pairs])
+            self._sorted_indexes[(key, numeric)] = index
+        return index
+
+    def __match(self, condition):
+        key, operator, value = condition.get("key"), condition.get("operator", "EQUAL"), condition.get("value")
+        column = self._columns.get(key, [_MISSING] * self._size)
+        if operator == "EQUAL":
+            return set(self.__hash_index(key).get(value, ()))
+        if operator == "IN":
+            index = self.__hash_index(key)
+            return set(p for v in value for p in index.get(v, ()))
+        if operator in ("GREATER", "GREATER_OR_EQUAL", "LESS", "LESS_OR_EQUAL"):
+            values, positions = self.__sorted_index(key, isinstance(value, (int, float)))
+            if operator == "GREATER":
+                return set(positions[bisect.bisect_right(values, value):])
+            if operator == "GREATER_OR_EQUAL":
+                return set(positions[bisect.bisect_left(values, value):])
+            if operator == "LESS":
+                return set(positions[:bisect.bisect_left(values, value)])
+            return set(positions[:bisect.bisect_right(values, value)])
+        everything = set(range(self._size))
+        if operator == "NOT_EQUAL":
+            return everything - set(self.__hash_index(key).get(value, ()))
+        if operator == "NOT_IN":
+            return everything - self.__match({"key": key, "operator": "IN", "value": value})
+        if operator in ("CONTAINS", "NOT_CONTAINS"):
+            matched = set(p for p, v in enumerate(column) if v is not _MISSING and v is not None and value in v)
+            return matched if operator == "CONTAINS" else everything - matched
+        if operator == "IS_NULL":
+            return set(p for p, v in enumerate(column) if v is _MISSING or v is None)
+        if operator == "NOT_NULL":
+            return set(p for p, v in enumerate(column) if v is not _MISSING and v is not None)
+        raise ValueError("unsupported operator: %s" % operator)
+
+    def query(self, conditions=None, conjunction="and", sort=None, page=None, limit=None):
+        """在本地执行条件查询
+
+        Args:
+            conditions (list): 搜索条件
+            conjunction (str): 多个搜索条件的关系，and 或 or
+            sort (list): 排序条件
+            page (int): 当前页数，从 1 开始，不填则返回全部
+            limit (int): 每页数目
+
+        Returns:
+            dict: {"totalCount": 命中总数, "list": 当前页的行数据}
+        """
+        with self._lock:
+            if conditions:
+                matched = None
+                for condition in conditions:
+                    positions = self.__match(condition)
+                    if matched is None:
+                        matched = positions
+                    elif conjunction == "or":
+                        matched |= positions
+                    else:
+                        matched &= positions
+                positions = sorted(matched)
+            else:
+                positions = list(range(self._size))
+
+            for item in reversed(sort or []):
+                column = self._columns.get(item["key"], [_MISSING] * self._size)
+                descending = str(item.get("value", "asc")).lower() == "desc"
+                # 缺失值和 None 始终排在最后
+                present = [p for p in positions if column[p] is not _MISSING and column[p] is not None]
+                absent = [p for p in positions if column[p] is _MISSING or column[p] is None]
+                present.sort(key=lambda p: column[p], reverse=descending)
+                positions = present + absent
+
+            total = len(positions)
+            if page and limit:
+                positions = positions[(page - 1) * limit:page * limit]
+            return {"totalCount": total, "list": [self.__row(p) for p in positions]}
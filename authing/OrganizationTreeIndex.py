@@ -0,0 +1,318 @@
+# coding: utf-8
+
+import bisect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .utils import get_response_data
+
+
+class OrganizationTreeIndex(object):
+    """组织机构树本地索引
+
+    基于 get_all_departments 和 list_department_member_ids 在本地构建组织机构树，
+    使用欧拉序（Euler tour）区间表示每个部门的子树：部门 D 的子树即 tin[D] <= tin[X] < tout[D] 的所有部门 X。
+    因此「部门 X 是否在部门 D 之下」为 O(1)，「部门 D 子树下的成员数」为 O(log n)。
+
+    通过本类的 create_department、update_department、delete_department 方法修改部门时，
+    会在调用接口成功后增量更新本地索引，无需重新拉取整棵树。
+    """
+
+    def __init__(self, management_client, organization_code, root_department_id="root", with_members=True,
+                 max_workers=8, tenant_id=None):
+        """
+        Args:
+            management_client (ManagementClient): 管理客户端
+            organization_code (str): 组织 code
+            root_department_id (str): 根部门 ID，默认为 `root`
+            with_members (bool): 是否同时加载部门直属成员
+            max_workers (int): 并发拉取部门成员时的最大线程数
+            tenant_id (str): 租户 ID
+        """
+        self.management_client = management_client
+        self.organization_code = organization_code
+        self.root_department_id = root_department_id
+        self.with_members = with_members
+        self.max_workers = max_workers
+        self.tenant_id = tenant_id
+        self._lock = threading.RLock()
+        self._departments = {}
+        self._parent = {}
+        self._children = {}
+        self._members = {}
+        self._user_departments = {}
+        self._dirty = True
+        self._tin = {}
+        self._tout = {}
+        self._order = []
+        self._member_tins = []
+
+    # ==== 构建与刷新 ====
+
+    def load(self):
+        """从服务端全量加载组织机构树及部门成员"""
+        departments = get_response_data(self.management_client.get_all_departments(
+            organization_code=self.organization_code,
+            department_id=self.root_department_id,
+        )) or []
+        flat = []
+        self.__flatten(departments, None, flat)
+
+        members = {}
+        if self.with_members:
+            department_ids = [d["departmentId"] for d in flat]
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for department_id, user_ids in zip(
+                        department_ids, executor.map(self.__fetch_member_ids, department_ids)):
+                    members[department_id] = set(user_ids)
+
+        with self._lock:
+            self._departments = {}
+            self._parent = {}
+            self._children = {}
+            self._members = {}
+            self._user_departments = {}
+            for department in flat:
+                self.__add_department(department)
+            for department_id, user_ids in members.items():
+                for user_id in user_ids:
+                    self.__add_member(department_id, user_id)
+            self._dirty = True
+        return self
+
+    def refresh_department(self, department_id):
+        """从服务端重新拉取单个部门的信息及其直属成员，并增量更新索引"""
+        department = get_response_data(self.management_client.get_department(
+            organization_code=self.organization_code,
+            department_id=department_id,
+            tenant_id=self.tenant_id,
+        ))
+        user_ids = self.__fetch_member_ids(department_id) if self.with_members else []
+        with self._lock:
+            self.__upsert_department(department)
+            for user_id in list(self._members.get(department_id, ())):
+                self.__remove_member(department_id, user_id)
+            for user_id in user_ids:
+                self.__add_member(department_id, user_id)
+        return department
+
+    def __fetch_member_ids(self, department_id):
+        return get_response_data(self.management_client.list_department_member_ids(
+            organization_code=self.organization_code,
+            department_id=department_id,
+            tenant_id=self.tenant_id,
+        )) or []
+
+    def __flatten(self, departments, parent_id, result):
+        # 兼容平铺列表和带 children 的嵌套结构
+        for department in departments:
+            department = dict(department)
+            children = department.pop("children", None) or []
+            if parent_id is not None and not department.get("parentDepartmentId"):
+                department["parentDepartmentId"] = parent_id
+            result.append(department)
+            if children and isinstance(children[0], dict):
+                self.__flatten(children, department["departmentId"], result)
+
+    def __add_department(self, department):
+        department_id = department["departmentId"]
+        parent_id = department.get("parentDepartmentId")
+        self._departments[department_id] = department
+        self._parent[department_id] = parent_id
+        self._children.setdefault(department_id, [])
+        if parent_id:
+            self._children.setdefault(parent_id, []).append(department_id)
+        self._dirty = True
+
+    def __upsert_department(self, department):
+        department_id = department["departmentId"]
+        old_parent = self._parent.get(department_id)
+        if department_id in self._departments and old_parent in self._children:
+            siblings = self._children[old_parent]
+            if department_id in siblings:
+                siblings.remove(department_id)
+        self.__add_department(department)
+
+    def __add_member(self, department_id, user_id):
+        self._members.setdefault(department_id, set()).add(user_id)
+        self._user_departments.setdefault(user_id, set()).add(department_id)
+        self._dirty = True
+
+    def __remove_member(self, department_id, user_id):
+        self._members.get(department_id, set()).discard(user_id)
+        departments = self._user_departments.get(user_id)
+        if departments is not None:
+            departments.discard(department_id)
+            if not departments:
+                del self._user_departments[user_id]
+        self._dirty = True
+
+    def __remove_subtree(self, department_id):
+        stack = [department_id]
+        while stack:
+            current = stack.pop()
+            stack.extend(self._children.pop(current, []))
+            for user_id in list(self._members.pop(current, ())):
+                self.__remove_member(current, user_id)
+            self._departments.pop(current, None)
+            self._parent.pop(current, None)
+        for siblings in self._children.values():
+            if department_id in siblings:
+                siblings.remove(department_id)
+        self._dirty = True
+
+    def __ensure_index(self):
+        # 调用方需持有锁
+        if not self._dirty:
+            return
+        tin, tout, order = {}, {}, []
+        roots = [d for d, p in self._parent.items() if not p or p not in self._departments]
+        for root in roots:
+            stack = [(root, False)]
+            while stack:
+                department_id, visited = stack.pop()
+                if visited:
+                    tout[department_id] = len(order)
+                    continue
+                tin[department_id] = len(order)
+                order.append(department_id)
+                stack.append((department_id, True))
+                for child in reversed(self._children.get(department_id, [])):
+                    if child not in tin:
+                        stack.append((child, False))
+        member_tins = sorted(
+            tin[department_id]
+            for department_id, user_ids in self._members.items()
+            if department_id in tin
+            for _ in user_ids
+        )
+        self._tin, self._tout, self._order, self._member_tins = tin, tout, order, member_tins
+        self._dirty = False
+
+    # ==== 查询 ====
+
+    def get_department(self, department_id):
+        """获取本地缓存的部门信息，不存在时返回 None"""
+        return self._departments.get(department_id)
+
+    def is_descendant(self, department_id, ancestor_id, include_self=True):
+        """判断 department_id 是否位于 ancestor_id 的子树中，O(1)"""
+        with self._lock:
+            self.__ensure_index()
+            if department_id not in self._tin or ancestor_id not in self._tin:
+                return False
+            if department_id == ancestor_id:
+                return include_self
+            return self._tin[ancestor_id] <= self._tin[department_id] < self._tout[ancestor_id]
+
+    def is_user_in_subtree(self, user_id, department_id):
+        """判断用户是否为部门 department_id 或其任一子部门的成员"""
+        with self._lock:
+            self.__ensure_index()
+            if department_id not in self._tin:
+                return False
+            start, end = self._tin[department_id], self._tout[department_id]
+            for member_department in self._user_departments.get(user_id, ()):
+                position = self._tin.get(member_department)
+                if position is not None and start <= position < end:
+                    return True
+            return False
+
+    def get_ancestors(self, department_id):
+        """获取从根部门到 department_id 父部门的路径"""
+        with self._lock:
+            path = []
+            current = self._parent.get(department_id)
+            while current and current in self._departments:
+                path.append(current)
+                current = self._parent.get(current)
+            path.reverse()
+            return path
+
+    def list_descendants(self, department_id, include_self=False):
+        """列出 department_id 子树中的所有部门 ID，按欧拉序排列"""
+        with self._lock:
+            self.__ensure_index()
+            if department_id not in self._tin:
+                return []
+            start = self._tin[department_id] if include_self else self._tin[department_id] + 1
+            return self._order[start:self._tout[department_id]]
+
+    def list_members(self, department_id, recursive=False):
+        """列出部门成员 ID，recursive 为 True 时包含所有子部门成员（去重）"""
+        with self._lock:
+            if not recursive:
+                return set(self._members.get(department_id, ()))
+            result = set()
+            for descendant in self.list_descendants(department_id, include_self=True):
+                result.update(self._members.get(descendant, ()))
+            return result
+
+    def count_members(self, department_id, recursive=True, distinct=False):
+        """统计部门成员数
+
+        recursive 为 True 且 distinct 为 False 时，按「部门-成员」关系计数（同一用户属于多个子部门会重复计数），O(log n)；
+        distinct 为 True 时返回去重后的用户数。
+        """
+        if not recursive:
+            return len(self._members.get(department_id, ()))
+        if distinct:
+            return len(self.list_members(department_id, recursive=True))
+        with self._lock:
+            self.__ensure_index()
+            if department_id not in self._tin:
+                return 0
+            return (bisect.bisect_left(self._member_tins, self._tout[department_id]) -
+                    bisect.bisect_left(self._member_tins, self._tin[department_id]))
+
+    def get_user_departments(self, user_id):
+        """获取用户直属的部门 ID 集合"""
+        return set(self._user_departments.get(user_id, ()))
+
+    # ==== 写操作：调用接口后增量更新索引 ====
+
+    def create_department(self, name, parent_department_id, metadata=None, **kwargs):
+        """创建部门并将其加入本地索引，参数同 ManagementClient.create_department"""
+        resp = self.management_client.create_department(
+            organization_code=self.organization_code,
+            name=name,
+            parent_department_id=parent_department_id,
+            metadata=metadata,
+            **kwargs
+        )
+        department = get_response_data(resp)
+        if department:
+            department = dict(department)
+            department.setdefault("parentDepartmentId", parent_department_id)
+            with self._lock:
+                self.__upsert_department(department)
+        return resp
+
+    def update_department(self, department_id, **kwargs):
+        """修改部门并更新本地索引，参数同 ManagementClient.update_department"""
+        resp = self.management_client.update_department(
+            organization_code=self.organization_code,
+            department_id=department_id,
+            **kwargs
+        )
+        department = get_response_data(resp)
+        with self._lock:
+            current = dict(self._departments.get(department_id) or {"departmentId": department_id})
+            if department:
+                current.update(department)
+            if kwargs.get("parent_department_id"):
+                current["parentDepartmentId"] = kwargs["parent_department_id"]
+            self.__upsert_department(current)
+        return resp
+
+    def delete_department(self, department_id, **kwargs):
+        """删除部门并从本地索引中移除其整棵子树，参数同 ManagementClient.delete_department"""
+        resp = self.management_client.delete_department(
+            organization_code=self.organization_code,
+            department_id=department_id,
+            **kwargs
+        )
+        get_response_data(resp)
+        with self._lock:
+            self.__remove_subtree(department_id)
+        return resp
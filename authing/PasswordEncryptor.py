@@ -0,0 +1,116 @@
+# coding: utf-8
+
+import base64
+import threading
+import time
+
+from .constants import DEFAULT_RSA_PUBLICKEY
+from .utils import get_response_data
+
+try:
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import padding
+except ImportError:
+    serialization = None
+
+try:
+    from gmssl import sm2
+except ImportError:
+    sm2 = None
+
+
+class PasswordEncryptor(object):
+    """passwordEncryptType 为 rsa / sm2 时使用的密码加密器
+
+    公钥只解析一次并缓存在实例上，之后每次加密都复用已解析的公钥对象；指定 client 和 key_ttl 后，
+    缓存过期时会通过 get_system_info 重新获取服务端公钥，以支持密钥轮换。
+
+    - rsa: 使用 RSA 公钥、PKCS#1 v1.5 填充加密，结果为 base64 字符串，需要安装 cryptography；
+    - sm2: 使用国密 SM2 公钥、C1C3C2 模式加密，结果为以 04 开头的 hex 字符串，需要安装 gmssl。
+    """
+
+    def __init__(self, client=None, rsa_public_key=None, sm2_public_key=None, key_ttl=None):
+        """
+        Args:
+            client (AuthenticationClient): 用于调用 get_system_info 获取服务端公钥，不传时使用 rsa_public_key / sm2_public_key
+            rsa_public_key (str): PEM 格式的 RSA 公钥，默认为 constants.DEFAULT_RSA_PUBLICKEY
+            sm2_public_key (str): hex 格式的 SM2 公钥
+            key_ttl (int): 公钥缓存时间，单位为秒，不填则不过期
+        """
+        self.client = client
+        self.key_ttl = key_ttl
+        self._pem = {"rsa": rsa_public_key, "sm2": sm2_public_key}
+        self._keys = {}
+        self._loaded_at = None
+        self._lock = threading.Lock()
+
+    def refresh_keys(self):
+        """通过 get_system_info 重新获取服务端公钥，并清空已解析的公钥缓存"""
+        info = get_response_data(self.client.get_system_info()) or {}
+        with self._lock:
+            self._pem = {
+                "rsa": (info.get("rsa") or {}).get("publicKey") or self._pem.get("rsa"),
+                "sm2": (info.get("sm2") or {}).get("publicKey") or self._pem.get("sm2"),
+            }
+            self._keys = {}
+            self._loaded_at = time.time()
+
+    def __get_key(self, encrypt_type):
+        if self.client is not None and (
+                self._loaded_at is None or
+                (self.key_ttl and time.time() - self._loaded_at >= self.key_ttl)):
+            self.refresh_keys()
+        with self._lock:
+            key = self._keys.get(encrypt_type)
+            if key is None:
+                key = self._keys[encrypt_type] = self.__load_key(encrypt_type, self._pem.get(encrypt_type))
+            return key
+
+    @staticmethod
+    def __load_key(encrypt_type, pem):
+        if encrypt_type == "rsa":
+            if serialization is None:
+                raise ImportError("rsa password encryption requires cryptography, please run: pip install cryptography")
+            pem = (pem or DEFAULT_RSA_PUBLICKEY).strip()
+            return serialization.load_pem_public_key(pem.encode(), backend=default_backend())
+        if encrypt_type == "sm2":
+            if sm2 is None:
+                raise ImportError("sm2 password encryption requires gmssl, please run: pip install gmssl")
+            if not pem:
+                raise ValueError("sm2 public key is not configured")
+            public_key = pem.strip()
+            # 去掉未压缩点的 04 前缀
+            if len(public_key) == 130 and public_key.startswith("04"):
+                public_key = public_key[2:]
+            return sm2.CryptSM2(private_key=None, public_key=public_key, mode=1)
+        raise ValueError("unsupported password encrypt type: %s" % encrypt_type)
+
+    def encrypt(self, password, encrypt_type="rsa"):
+        """加密单个密码，encrypt_type 为 none 时原样返回"""
+        if not encrypt_type or encrypt_type == "none" or password is None:
+            return password
+        key = self.__get_key(encrypt_type)
+        if encrypt_type == "rsa":
+            return base64.b64encode(key.encrypt(password.encode("utf-8"), padding.PKCS1v15())).decode()
+        return "04" + key.encrypt(password.encode("utf-8")).hex()
+
+    def encrypt_many(self, passwords, encrypt_type="rsa"):
+        """批量加密密码，公钥只解析一次"""
+        return [self.encrypt(password, encrypt_type) for password in passwords]
+
+    def encrypt_users(self, users, encrypt_type="rsa", options=None):
+        """加密用户列表中的 password 字段，用于 create_users_batch
+
+        Returns:
+            tuple: (加密后的用户列表, 带 passwordEncryptType 的 options)，可直接传给 create_users_batch
+        """
+        encrypted = []
+        for user in users:
+            user = dict(user)
+            if user.get("password") is not None:
+                user["password"] = self.encrypt(user["password"], encrypt_type)
+            encrypted.append(user)
+        options = dict(options or {})
+        options["passwordEncryptType"] = encrypt_type
+        return encrypted, options
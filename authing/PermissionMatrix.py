@@ -0,0 +1,219 @@
+# coding: utf-8
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .utils import get_response_data
+from .utils.pagination import iter_pages
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# 可以通过 get_user_permission_list 在本地判断的数据资源类型，其余类型（TREE）及未知类型以 check_permission 为准
+_LISTABLE_TYPES = frozenset(["STRING", "ARRAY"])
+
+
+def _dedupe(items):
+    seen = set()
+    result = []
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            result.append(item)
+    return result
+
+
+def _chunks(items, size):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+class PermissionMatrixResult(object):
+    """权限矩阵：matrix[i][j] 表示 users[i] 是否拥有 resources[j] 的 action 权限
+
+    安装了 NumPy 时 matrix 为 bool 类型的 numpy.ndarray，否则为 list of list。
+    """
+
+    def __init__(self, users, resources, action, matrix):
+        self.users = users
+        self.resources = resources
+        self.action = action
+        self.matrix = matrix
+        self._user_index = dict((u, i) for i, u in enumerate(users))
+        self._resource_index = dict((r, j) for j, r in enumerate(resources))
+
+    def allowed(self, user_id, resource):
+        return bool(self.matrix[self._user_index[user_id]][self._resource_index[resource]])
+
+    def allowed_resources(self, user_id):
+        row = self.matrix[self._user_index[user_id]]
+        return [r for r, enabled in zip(self.resources, row) if enabled]
+
+    def allowed_users(self, resource):
+        j = self._resource_index[resource]
+        return [u for u, row in zip(self.users, self.matrix) if row[j]]
+
+    def to_dict(self):
+        """{user_id: {resource: bool}}"""
+        return dict((u, dict((r, bool(enabled)) for r, enabled in zip(self.resources, row)))
+                    for u, row in zip(self.users, self.matrix))
+
+
+class PermissionMatrix(object):
+    """批量计算「多个用户 × 多个资源」对同一操作的权限
+
+    用户和资源先去重，然后：
+
+    - 字符串、数组类型资源：按 user_chunk_size 个用户一批调用 get_user_permission_list，在本地展开每个用户拥有的
+      资源和操作，请求数为 用户数 / user_chunk_size；
+    - 树类型资源（节点权限可能继承自上级节点）、类型未知的资源、或开启了条件判断（judge_condition_enabled）时：
+      对每个用户按 resource_chunk_size 个资源一批调用 check_permission，以服务端的判断为准。
+
+    资源类型通过 list_data_resources 获取，每个权限空间只加载一次，资源类型变化后可调用 refresh_resource_types；
+    树类型资源的节点 code 路径（如 root/child）按其第一段（树资源的 code）确定类型。
+
+    所有请求在线程池中并发执行。指定 cache（如 utils.lru.LRUCache）时，以 (namespace_code, user_id, action, resource)
+    为 key 缓存单个判断结果：已缓存的 (用户, 资源) 不再请求，新的判断结果写回 cache。开启条件判断时结果取决于
+    auth_env_params，不读写 cache。
+    """
+
+    def __init__(self, management_client, max_workers=8, user_chunk_size=50, resource_chunk_size=50, cache=None,
+                 cache_ttl=60, page_size=50):
+        """
+        Args:
+            management_client (ManagementClient): 管理客户端
+            max_workers (int): 最大并发请求数
+            user_chunk_size (int): 每次调用 get_user_permission_list 的用户数
+            resource_chunk_size (int): 每次调用 check_permission 的资源数
+            cache: 可选的判断结果缓存，需实现 get(key) 和 set(key, value, ttl=None)
+            cache_ttl (int): 写入 cache 的结果的有效期，单位为秒
+            page_size (int): 加载资源类型时 list_data_resources 的每页数目
+        """
+        self.management_client = management_client
+        self.max_workers = max_workers
+        self.user_chunk_size = user_chunk_size
+        self.resource_chunk_size = resource_chunk_size
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+        self.page_size = page_size
+        # 权限空间 code -> {资源 code: 资源类型}
+        self._resource_types = {}
+
+    def resource_types(self, namespace_code):
+        """返回权限空间内 {资源 code: 资源类型（STRING / ARRAY / TREE）}，首次调用时分页加载"""
+        types = self._resource_types.get(namespace_code)
+        if types is None:
+            types = {}
+
+            def fetch_page(page, limit):
+                return self.management_client.list_data_resources(page=page, limit=limit,
+                                                                  namespace_codes=[namespace_code])
+
+            for _, items in iter_pages(fetch_page, limit=self.page_size, max_workers=self.max_workers):
+                for item in items:
+                    if item.get("namespaceCode") in (None, namespace_code) and item.get("resourceCode"):
+                        types[item["resourceCode"]] = (item.get("type") or item.get("resourceType") or "").upper()
+            self._resource_types[namespace_code] = types
+        return types
+
+    def refresh_resource_types(self, namespace_code=None):
+        """清空已加载的资源类型，不传时清空全部权限空间"""
+        if namespace_code is None:
+            self._resource_types.clear()
+        else:
+            self._resource_types.pop(namespace_code, None)
+
+    @staticmethod
+    def __is_listable(types, resource):
+        resource_type = types.get(resource)
+        if resource_type is None and "/" in resource:
+            resource_type = types.get(resource.split("/", 1)[0])
+        return resource_type in _LISTABLE_TYPES
+
+    def evaluate(self, user_ids, resources, action, namespace_code, judge_condition_enabled=None,
+                 auth_env_params=None):
+        """
+        Args:
+            user_ids (list): 用户 ID 列表
+            resources (list): 资源 code 列表，树类型资源的节点为完整的 code 路径
+            action (str): 操作
+            namespace_code (str): 权限空间 code
+            judge_condition_enabled (bool): 是否开启条件判断
+            auth_env_params (dict): 条件判断的环境信息
+
+        Returns:
+            PermissionMatrixResult
+        """
+        users = _dedupe(user_ids)
+        resources = _dedupe(resources)
+        user_index = dict((u, i) for i, u in enumerate(users))
+        resource_index = dict((r, j) for j, r in enumerate(resources))
+        decisions = {}
+
+        # 开启条件判断时结果与环境信息有关，不使用缓存
+        cache = self.cache if not judge_condition_enabled else None
+
+        # 先查缓存，只请求未命中的 (用户, 资源)
+        missing = {}
+        for user_id in users:
+            for resource in resources:
+                cached = cache.get((namespace_code, user_id, action, resource)) if cache is not None else None
+                if cached is None:
+                    missing.setdefault(user_id, []).append(resource)
+                else:
+                    decisions[(user_id, resource)] = cached
+
+        types = self.resource_types(namespace_code) if missing and not judge_condition_enabled else {}
+        listed = {}
+        checked = {}
+        for user_id, user_resources in missing.items():
+            for resource in user_resources:
+                if judge_condition_enabled or not self.__is_listable(types, resource):
+                    checked.setdefault(user_id, []).append(resource)
+                else:
+                    listed.setdefault(user_id, []).append(resource)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = []
+            for chunk in _chunks(list(listed), self.user_chunk_size):
+                futures.append(executor.submit(self.__list, chunk, namespace_code, action, listed))
+            for user_id, user_resources in checked.items():
+                for chunk in _chunks(user_resources, self.resource_chunk_size):
+                    futures.append(executor.submit(self.__check, user_id, chunk, namespace_code, action,
+                                                   judge_condition_enabled, auth_env_params))
+            for future in futures:
+                for (user_id, resource), enabled in future.result():
+                    decisions[(user_id, resource)] = enabled
+                    if cache is not None:
+                        cache.set((namespace_code, user_id, action, resource), enabled, ttl=self.cache_ttl)
+
+        if numpy is not None:
+            matrix = numpy.zeros((len(users), len(resources)), dtype=bool)
+        else:
+            matrix = [[False] * len(resources) for _ in users]
+        for (user_id, resource), enabled in decisions.items():
+            if enabled:
+                matrix[user_index[user_id]][resource_index[resource]] = True
+        return PermissionMatrixResult(users, resources, action, matrix)
+
+    def __list(self, user_ids, namespace_code, action, listed):
+        data = get_response_data(self.management_client.get_user_permission_list(
+            user_ids=user_ids, namespace_codes=[namespace_code])) or {}
+        allowed = dict((user_id, set()) for user_id in user_ids)
+        for item in data.get("userPermissionList") or []:
+            if item.get("namespaceCode") not in (None, namespace_code) or item.get("userId") not in allowed:
+                continue
+            for resource in item.get("resourceList") or []:
+                authorize = resource.get("strAuthorize") or resource.get("arrAuthorize") or {}
+                if action in (authorize.get("actions") or []):
+                    allowed[item["userId"]].add(resource.get("resourceCode"))
+        return [((user_id, resource), resource in allowed[user_id])
+                for user_id in user_ids for resource in listed[user_id]]
+
+    def __check(self, user_id, resources, namespace_code, action, judge_condition_enabled, auth_env_params):
+        data = get_response_data(self.management_client.check_permission(
+            resources=resources, action=action, user_id=user_id, namespace_code=namespace_code,
+            judge_condition_enabled=judge_condition_enabled, auth_env_params=auth_env_params)) or {}
+        enabled = dict((r.get("resource"), bool(r.get("enabled"))) for r in data.get("checkResultList") or [])
+        return [((user_id, resource), enabled.get(resource, False)) for resource in resources]
@@ -0,0 +1,180 @@
+# coding: utf-8
+
+import json
+import threading
+import time
+
+import jwt
+
+from .utils import get_response_data
+
+# 默认视为「用户下线」的事件编码，可通过 user_events 参数修改
+DEFAULT_USER_EVENTS = frozenset([
+    "authing.user.kicked",
+    "authing.user.logout",
+    "authing.user.resigned",
+    "authing.user.deleted",
+    "authing.user.blocked",
+])
+
+# 默认视为「Token 被撤销」的事件编码，事件数据中需包含 jti 或 sessionId
+DEFAULT_TOKEN_EVENTS = frozenset([
+    "authing.token.revoked",
+])
+
+
+class RevocationTracker(object):
+    """本地维护的 Token 吊销列表，供 AuthenticationClient.introspect_token_offline 在验签后查询
+
+    吊销分两类：
+
+    - 单个 Token / Session：按 jti 或 session id 记录在字典中，查询只需一次字典查找。记录在 Token 的 exp 之后清理；
+    - 用户：kick_users、resign_user 或 check_session_status 发现已下线后，记录该用户的吊销时间，
+      签发时间（iat）不晚于该时间的 Token 均视为已吊销，可按 app_id 限定范围。记录保留到吊销时间加上 Token 的最长有效期，
+      最长有效期由 max_token_lifetime 指定，未指定时取见过的 Token 的最大 exp - iat；两者都没有时不清理。
+
+    数据来源：
+
+    - AuthenticationClient.revoke_token 在设置了 revocation_tracker 时会自动记录；
+    - on_event 可直接作为 ManagementClient.sub_event 的回调，处理用户下线、Token 撤销等事件；
+    - sync_session 调用 check_session_status，用户已无登录态时记录吊销；
+    - 也可以直接调用 revoke / revoke_token / revoke_user。
+
+    示例::
+
+        tracker = RevocationTracker()
+        authentication_client.revocation_tracker = tracker
+        threading.Thread(target=management_client.sub_event, args=("authing.user.kicked", tracker.on_event)).start()
+        authentication_client.introspect_token_offline(token)  # 已吊销时抛出 jwt.InvalidTokenError
+    """
+
+    def __init__(self, capacity=100000, default_ttl=86400, max_token_lifetime=None, user_events=None,
+                 token_events=None):
+        """
+        Args:
+            capacity (int): 吊销记录数超过该值时清理已过期的记录
+            default_ttl (int): 无法得知 Token exp 时 jti / session id 吊销记录的保留时长，单位为秒
+            max_token_lifetime (int): Token 的最长有效期，单位为秒，决定用户吊销记录的保留时长
+            user_events (set): 视为用户下线的事件编码，默认为 DEFAULT_USER_EVENTS
+            token_events (set): 视为 Token 撤销的事件编码，默认为 DEFAULT_TOKEN_EVENTS
+        """
+        self.capacity = capacity
+        self.default_ttl = default_ttl
+        self.max_token_lifetime = max_token_lifetime
+        # 见过的 Token 的最大 exp - iat，未指定 max_token_lifetime 时用于清理用户吊销记录
+        self._seen_lifetime = 0
+        self.user_events = DEFAULT_USER_EVENTS if user_events is None else frozenset(user_events)
+        self.token_events = DEFAULT_TOKEN_EVENTS if token_events is None else frozenset(token_events)
+        # 记录数超过该值时清理，清理后按剩余记录数翻倍，避免每次写入都清理
+        self._prune_at = capacity
+        # jti / session id -> 过期时间
+        self._revoked = {}
+        # user_id -> {app_id 或 None: 吊销时间}
+        self._users = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._revoked)
+
+    # ==== 写入 ====
+
+    def revoke(self, jti=None, session_id=None, expires_at=None):
+        """吊销指定 jti 或 session id，expires_at 为 Token 过期时间（秒级时间戳）"""
+        expires_at = expires_at or time.time() + self.default_ttl
+        with self._lock:
+            for key in (jti, session_id):
+                if key:
+                    self._revoked[key] = max(expires_at, self._revoked.get(key, 0))
+            if len(self._revoked) > self._prune_at:
+                self.__prune()
+
+    def revoke_token(self, token):
+        """吊销 Token（不校验签名，只读取其中的 jti、sid 和 exp）"""
+        try:
+            payload = jwt.decode(token, options={"verify_signature": False})
+        except jwt.InvalidTokenError:
+            return
+        self.__observe(payload)
+        self.revoke(payload.get("jti"), self.__session_id(payload), payload.get("exp"))
+
+    def revoke_user(self, user_id, app_ids=None, revoked_at=None):
+        """吊销用户在 revoked_at（默认为当前时间）之前签发的 Token，app_ids 为空时对所有应用生效"""
+        revoked_at = revoked_at or time.time()
+        with self._lock:
+            apps = self._users.setdefault(user_id, {})
+            for app_id in app_ids or [None]:
+                apps[app_id] = max(revoked_at, apps.get(app_id, 0))
+
+    def on_event(self, message):
+        """事件回调，可直接传给 ManagementClient.sub_event / AuthenticationClient.sub_event"""
+        try:
+            event = json.loads(message) if isinstance(message, (str, bytes)) else message
+        except ValueError:
+            return
+        if not isinstance(event, dict):
+            return
+        code = event.get("eventType") or event.get("eventCode") or event.get("eventName")
+        data = event.get("data") if isinstance(event.get("data"), dict) else event
+        if code in self.token_events:
+            self.revoke(data.get("jti"), data.get("sessionId") or data.get("sid"), data.get("exp"))
+        elif code in self.user_events:
+            user_id = data.get("userId") or data.get("id") or (data.get("user") or {}).get("userId")
+            if user_id:
+                app_ids = data.get("appIds") or ([data["appId"]] if data.get("appId") else None)
+                self.revoke_user(user_id, app_ids)
+
+    def sync_session(self, management_client, app_id, user_id):
+        """通过 check_session_status 检查用户登录态，已无登录态时吊销该用户在该应用下的 Token，返回是否仍在登录"""
+        data = get_response_data(management_client.check_session_status(app_id=app_id, user_id=user_id))
+        valid = data.get("isValid") if isinstance(data, dict) else bool(data)
+        if not valid:
+            self.revoke_user(user_id, [app_id])
+        return bool(valid)
+
+    # ==== 查询 ====
+
+    def is_revoked(self, payload):
+        """payload 为验签后的 Token 内容"""
+        self.__observe(payload)
+        for key in (payload.get("jti"), self.__session_id(payload)):
+            if key and key in self._revoked:
+                return True
+        apps = self._users.get(payload.get("sub"))
+        if apps:
+            issued_at = payload.get("iat") or 0
+            audience = payload.get("aud")
+            audiences = audience if isinstance(audience, list) else [audience]
+            for app_id, revoked_at in list(apps.items()):
+                if issued_at <= revoked_at and (app_id is None or app_id in audiences):
+                    return True
+        return False
+
+    def prune(self):
+        """清理已过期的吊销记录"""
+        with self._lock:
+            self.__prune()
+
+    def __prune(self):
+        # 调用方需持有 self._lock
+        now = time.time()
+        self._revoked = dict((k, v) for k, v in self._revoked.items() if v > now)
+        self._prune_at = max(self.capacity, len(self._revoked) * 2)
+        lifetime = self.max_token_lifetime or self._seen_lifetime
+        if lifetime:
+            # 吊销时间之前签发的 Token 最晚在 吊销时间 + 最长有效期 过期，之后记录才可以删除
+            horizon = now - lifetime
+            for user_id in list(self._users):
+                apps = dict((a, t) for a, t in self._users[user_id].items() if t > horizon)
+                if apps:
+                    self._users[user_id] = apps
+                else:
+                    del self._users[user_id]
+
+    def __observe(self, payload):
+        exp, iat = payload.get("exp"), payload.get("iat")
+        if isinstance(exp, (int, float)) and isinstance(iat, (int, float)) and exp - iat > self._seen_lifetime:
+            self._seen_lifetime = exp - iat
+
+    @staticmethod
+    def __session_id(payload):
+        return payload.get("sid") or payload.get("session_id")
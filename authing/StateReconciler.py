@@ -0,0 +1,383 @@
+# coding: utf-8
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .utils import get_response_data
+from .utils.pagination import iter_pages, parse_page
+
+_DEFAULT_NAMESPACE = "default"
+
+# 执行阶段，后一阶段依赖前一阶段的结果：先创建 / 修改角色和分组，再调整成员和授权，最后删除多余的角色和分组
+PHASES = ("create", "update", "members", "authorize", "delete")
+
+
+def _chunks(items, size):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _namespace(namespace):
+    return None if namespace in (None, _DEFAULT_NAMESPACE) else namespace
+
+
+class PlanStep(object):
+    """计划中的一次接口调用"""
+
+    def __init__(self, phase, method, kwargs, summary):
+        self.phase = phase
+        self.method = method
+        self.kwargs = kwargs
+        self.summary = summary
+        self.result = None
+        self.error = None
+
+    def __repr__(self):
+        return "<PlanStep %s %s>" % (self.method, self.summary)
+
+
+class ReconcilePlan(object):
+    """期望状态与当前状态的差异，以及消除差异所需的接口调用
+
+    warnings 中记录无法通过接口消除的差异，如多余的资源授权（authorize_resources 只能追加授权）。
+    """
+
+    def __init__(self, steps=None, warnings=None):
+        self.steps = steps or []
+        self.warnings = warnings or []
+
+    def __len__(self):
+        return len(self.steps)
+
+    def __bool__(self):
+        return bool(self.steps)
+
+    __nonzero__ = __bool__
+
+    def phases(self):
+        """按执行顺序返回 (阶段, 该阶段的步骤列表)，跳过空阶段"""
+        for phase in PHASES:
+            steps = [step for step in self.steps if step.phase == phase]
+            if steps:
+                yield phase, steps
+
+    def format(self):
+        """返回便于阅读的计划文本，用于 dry-run 输出"""
+        if not self.steps and not self.warnings:
+            return "No changes."
+        lines = []
+        for phase, steps in self.phases():
+            lines.append("[%s]" % phase)
+            for step in steps:
+                lines.append("  %s: %s" % (step.method, step.summary))
+        for warning in self.warnings:
+            lines.append("! %s" % warning)
+        lines.append("%d call(s) planned." % len(self.steps))
+        return "\n".join(lines)
+
+    def __str__(self):
+        return self.format()
+
+
+class StateReconciler(object):
+    """把角色、分组、部门成员和资源授权调整到声明的期望状态
+
+    期望状态文档的格式为：
+
+        {
+            "roles": [{"code": "admin", "namespace": "default", "name": "管理员", "description": "",
+                       "members": ["userId1"], "resources": [{"resourceType": "DATA", "code": "books",
+                                                              "actions": ["read"]}]}],
+            "groups": [{"code": "dev", "name": "开发", "description": "", "type": "static", "members": ["userId1"],
+                        "resources": [...]}],
+            "departments": [{"organizationCode": "org", "departmentId": "xxx", "members": ["userId1"]}]
+        }
+
+    文档中没有出现的字段不做调整，如不写 members 时不修改该角色的成员。
+    plan 通过分页接口并发读取当前状态并计算最小差异，只生成需要的 create / update / assign_role / revoke_role /
+    add_*_members / remove_*_members / authorize_resources 调用；prune 为 True 时还会删除文档中没有的角色和分组
+    （只在文档中出现过的权限分组内删除角色）。apply 按阶段依次执行，同一阶段内的调用并发执行，最多同时 max_workers 个。
+    """
+
+    def __init__(self, management_client, max_workers=8, page_size=50, batch_size=50, prune=False):
+        """
+        Args:
+            management_client (ManagementClient): 管理客户端
+            max_workers (int): 读取状态和执行调用时的最大并发数
+            page_size (int): 分页读取时每页数目
+            batch_size (int): 单次调用中最多包含的用户数 / 角色数 / 分组数
+            prune (bool): 是否删除期望状态中没有的角色和分组
+        """
+        self.management_client = management_client
+        self.max_workers = max_workers
+        self.page_size = page_size
+        self.batch_size = batch_size
+        self.prune = prune
+
+    def reconcile(self, desired, dry_run=False):
+        """计算计划并执行，dry_run 为 True 时只返回计划"""
+        plan = self.plan(desired)
+        if not dry_run:
+            self.apply(plan)
+        return plan
+
+    # ==== 读取当前状态 ====
+
+    def load_state(self, desired):
+        """读取与期望状态相关的当前状态"""
+        desired_roles = [dict(r, namespace=r.get("namespace") or _DEFAULT_NAMESPACE)
+                         for r in desired.get("roles") or []]
+        desired_groups = desired.get("groups") or []
+        desired_departments = desired.get("departments") or []
+        namespaces = sorted(set(r["namespace"] for r in desired_roles))
+        if "roles" in desired and not namespaces:
+            namespaces = [_DEFAULT_NAMESPACE]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            role_lists = list(executor.map(self.__list_roles, namespaces))
+            roles = {}
+            for namespace, items in zip(namespaces, role_lists):
+                for role in items:
+                    roles[(namespace, role["code"])] = role
+            groups = {}
+            if "groups" in desired:
+                groups = dict((g["code"], g) for g in self.__list_all(self.management_client.list_groups))
+
+            # 只读取期望状态中声明了成员 / 授权且已存在的角色和分组
+            jobs = {}
+            for r in desired_roles:
+                key = (r["namespace"], r["code"])
+                if key in roles and r.get("members") is not None:
+                    jobs[("role_members", key)] = executor.submit(self.__role_members, *key)
+                if key in roles and r.get("resources") is not None:
+                    jobs[("role_resources", key)] = executor.submit(self.__role_resources, *key)
+            for g in desired_groups:
+                if g["code"] in groups and g.get("members") is not None:
+                    jobs[("group_members", g["code"])] = executor.submit(self.__group_members, g["code"])
+                if g["code"] in groups and g.get("resources") is not None:
+                    jobs[("group_resources", g["code"])] = executor.submit(self.__group_resources, g["code"])
+            for d in desired_departments:
+                key = (d["organizationCode"], d["departmentId"])
+                if d.get("members") is not None:
+                    jobs[("department_members", key)] = executor.submit(
+                        self.__department_members, d["organizationCode"], d["departmentId"],
+                        d.get("departmentIdType"), d.get("tenantId"))
+            results = dict((key, future.result()) for key, future in jobs.items())
+
+        state = {"roles": roles, "groups": groups, "role_members": {}, "role_resources": {}, "group_members": {},
+                 "group_resources": {}, "department_members": {}}
+        for (kind, key), value in results.items():
+            state[kind][key] = value
+        return state
+
+    def __list_all(self, method, **kwargs):
+        items = []
+        for _, page_items in iter_pages(lambda page, limit: method(page=page, limit=limit, **kwargs),
+                                        limit=self.page_size, max_workers=self.max_workers):
+            items.extend(page_items)
+        return items
+
+    def __list_roles(self, namespace):
+        return self.__list_all(self.management_client.list_roles, namespace=_namespace(namespace))
+
+    def __role_members(self, namespace, code):
+        def fetch_page(page, limit):
+            return self.management_client.list_role_members(
+                code=code, namespace=_namespace(namespace), page=page, limit=limit)
+        return set(u["userId"] for _, items in iter_pages(fetch_page, limit=self.page_size, max_workers=2)
+                   for u in items)
+
+    def __group_members(self, code):
+        def fetch_page(page, limit):
+            return self.management_client.list_group_members(code=code, page=page, limit=limit)
+        return set(u["userId"] for _, items in iter_pages(fetch_page, limit=self.page_size, max_workers=2)
+                   for u in items)
+
+    def __department_members(self, organization_code, department_id, department_id_type, tenant_id):
+        return set(get_response_data(self.management_client.list_department_member_ids(
+            organization_code=organization_code, department_id=department_id,
+            department_id_type=department_id_type, tenant_id=tenant_id)) or [])
+
+    def __role_resources(self, namespace, code):
+        items, _ = parse_page(self.management_client.get_role_authorized_resources(
+            code=code, namespace=_namespace(namespace)))
+        return self.__resource_actions(items)
+
+    def __group_resources(self, code):
+        items, _ = parse_page(self.management_client.get_group_authorized_resources(code=code))
+        return self.__resource_actions(items)
+
+    @staticmethod
+    def __resource_actions(items):
+        actions = {}
+        for item in items:
+            code = item.get("resourceCode") or item.get("code")
+            actions.setdefault(code, set()).update(item.get("actions") or [])
+        return actions
+
+    # ==== 计算差异 ====
+
+    def plan(self, desired, state=None):
+        """计算把当前状态调整为期望状态所需的调用，state 默认通过 load_state 读取"""
+        if state is None:
+            state = self.load_state(desired)
+        plan = ReconcilePlan()
+        self.__plan_roles(plan, desired, state)
+        self.__plan_groups(plan, desired, state)
+        for d in desired.get("departments") or []:
+            if d.get("members") is None:
+                continue
+            key = (d["organizationCode"], d["departmentId"])
+            current = state["department_members"].get(key, set())
+            wanted = set(d["members"])
+            extra = {"organization_code": d["organizationCode"], "department_id": d["departmentId"],
+                     "department_id_type": d.get("departmentIdType"), "tenant_id": d.get("tenantId")}
+            label = "department %s/%s" % key
+            self.__plan_members(plan, "add_department_members", "remove_department_members", wanted - current,
+                                current - wanted, label, lambda user_ids: dict(extra, user_ids=user_ids))
+        return plan
+
+    def __plan_roles(self, plan, desired, state):
+        wanted_keys = set()
+        creates = {}
+        for r in desired.get("roles") or []:
+            namespace = r.get("namespace") or _DEFAULT_NAMESPACE
+            key = (namespace, r["code"])
+            wanted_keys.add(key)
+            label = "role %s:%s" % key
+            current = state["roles"].get(key)
+            if current is None:
+                creates.setdefault(namespace, []).append(dict(
+                    (k, v) for k, v in (("code", r["code"]), ("name", r.get("name")),
+                                        ("namespace", _namespace(namespace)), ("description", r.get("description")))
+                    if v is not None))
+            elif self.__changed(r, current, ("name", "description")):
+                plan.steps.append(PlanStep("update", "update_role", {
+                    "code": r["code"], "new_code": r["code"], "namespace": _namespace(namespace),
+                    "name": r.get("name", current.get("name")),
+                    "description": r.get("description", current.get("description"))}, label))
+
+            if r.get("members") is not None:
+                current_members = state["role_members"].get(key, set())
+                wanted = set(r["members"])
+                self.__plan_members(
+                    plan, "assign_role", "revoke_role", wanted - current_members, current_members - wanted, label,
+                    lambda user_ids, key=key: {"code": key[1], "namespace": _namespace(key[0]),
+                                               "targets": [{"targetType": "USER", "targetIdentifier": u}
+                                                           for u in user_ids]})
+            if r.get("resources") is not None:
+                self.__plan_resources(plan, "ROLE", r["code"], _namespace(namespace), r["resources"],
+                                      state["role_resources"].get(key, {}), label)
+
+        for namespace, items in sorted(creates.items()):
+            for chunk in _chunks(items, self.batch_size):
+                plan.steps.append(PlanStep("create", "create_roles_batch", {"list": chunk},
+                                           "roles %s" % ", ".join("%s:%s" % (namespace, i["code"]) for i in chunk)))
+
+        if self.prune and "roles" in desired:
+            removed = {}
+            for namespace, code in sorted(state["roles"]):
+                if (namespace, code) not in wanted_keys:
+                    removed.setdefault(namespace, []).append(code)
+            for namespace, codes in sorted(removed.items()):
+                for chunk in _chunks(codes, self.batch_size):
+                    plan.steps.append(PlanStep("delete", "delete_roles_batch",
+                                               {"code_list": chunk, "namespace": _namespace(namespace)},
+                                               "roles %s" % ", ".join("%s:%s" % (namespace, c) for c in chunk)))
+
+    def __plan_groups(self, plan, desired, state):
+        wanted_codes = set()
+        creates = []
+        for g in desired.get("groups") or []:
+            code = g["code"]
+            wanted_codes.add(code)
+            label = "group %s" % code
+            current = state["groups"].get(code)
+            if current is None:
+                creates.append({"code": code, "name": g.get("name") or code, "description": g.get("description", ""),
+                                "type": g.get("type", "static")})
+            elif self.__changed(g, current, ("name", "description")):
+                plan.steps.append(PlanStep("update", "update_group", {
+                    "code": code, "name": g.get("name", current.get("name")),
+                    "description": g.get("description", current.get("description"))}, label))
+
+            if g.get("members") is not None:
+                current_members = state["group_members"].get(code, set())
+                wanted = set(g["members"])
+                self.__plan_members(plan, "add_group_members", "remove_group_members", wanted - current_members,
+                                    current_members - wanted, label,
+                                    lambda user_ids, code=code: {"code": code, "user_ids": user_ids})
+            if g.get("resources") is not None:
+                self.__plan_resources(plan, "GROUP", code, g.get("namespace"), g["resources"],
+                                      state["group_resources"].get(code, {}), label)
+
+        for chunk in _chunks(creates, self.batch_size):
+            plan.steps.append(PlanStep("create", "create_groups_batch", {"list": chunk},
+                                       "groups %s" % ", ".join(i["code"] for i in chunk)))
+
+        if self.prune and "groups" in desired:
+            removed = sorted(code for code in state["groups"] if code not in wanted_codes)
+            for chunk in _chunks(removed, self.batch_size):
+                plan.steps.append(PlanStep("delete", "delete_groups_batch", {"code_list": chunk},
+                                           "groups %s" % ", ".join(chunk)))
+
+    def __plan_members(self, plan, add_method, remove_method, added, removed, label, make_kwargs):
+        for chunk in _chunks(sorted(added), self.batch_size):
+            plan.steps.append(PlanStep("members", add_method, make_kwargs(chunk),
+                                       "%s +%d user(s)" % (label, len(chunk))))
+        for chunk in _chunks(sorted(removed), self.batch_size):
+            plan.steps.append(PlanStep("members", remove_method, make_kwargs(chunk),
+                                       "%s -%d user(s)" % (label, len(chunk))))
+
+    @staticmethod
+    def __plan_resources(plan, target_type, target_identifier, namespace, resources, current, label):
+        missing = []
+        wanted_codes = set()
+        for resource in resources:
+            wanted_codes.add(resource["code"])
+            actions = set(resource.get("actions") or [])
+            have = current.get(resource["code"], set())
+            if actions - have:
+                missing.append(dict(resource, actions=sorted(actions | have)))
+            elif have - actions:
+                plan.warnings.append("%s has extra actions %s on %s" % (
+                    label, ", ".join(sorted(have - actions)), resource["code"]))
+        for code in sorted(set(current) - wanted_codes):
+            plan.warnings.append("%s has extra resource %s" % (label, code))
+        if missing:
+            plan.steps.append(PlanStep("authorize", "authorize_resources", {
+                "namespace": namespace,
+                "list": [{"targetType": target_type, "targetIdentifiers": [target_identifier], "resources": missing}]},
+                "%s %s" % (label, ", ".join(r["code"] for r in missing))))
+
+    @staticmethod
+    def __changed(desired, current, fields):
+        return any(field in desired and desired[field] != current.get(field) for field in fields)
+
+    # ==== 执行 ====
+
+    def apply(self, plan, stop_on_error=True):
+        """
+        按阶段执行计划，每个步骤的返回值或异常记录在 step.result / step.error 中。
+
+        Args:
+            plan (ReconcilePlan): plan 返回的计划
+            stop_on_error (bool): 某一阶段有调用失败时，是否跳过后续阶段；为 True 时抛出第一个异常
+
+        Returns:
+            失败的步骤列表
+        """
+        failed = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for _, steps in plan.phases():
+                futures = [(step, executor.submit(self.__run, step)) for step in steps]
+                for step, future in futures:
+                    try:
+                        step.result = future.result()
+                    except Exception as e:
+                        step.error = e
+                        failed.append(step)
+                if failed and stop_on_error:
+                    raise failed[0].error
+        return failed
+
+    def __run(self, step):
+        return get_response_data(getattr(self.management_client, step.method)(**step.kwargs))
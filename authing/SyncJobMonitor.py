@@ -0,0 +1,247 @@
+# coding: utf-8
+
+import heapq
+import itertools
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from .AuthingException import AuthingException
+from .utils import get_response_data
+from .utils.pagination import iter_pages
+
+# 同步作业到达以下状态后停止跟踪
+TERMINAL_JOB_STATUSES = frozenset(["SUCCESS", "FAILED", "CANCELLED", "CANCELED", "TIMEOUT", "ERROR"])
+
+_END = object()
+
+
+class _Job(object):
+    def __init__(self, sync_job_id, sync_task_id, interval):
+        self.sync_job_id = sync_job_id
+        self.sync_task_id = sync_task_id
+        self.interval = interval
+        self.future = Future()
+        self.logs = queue.Queue()
+        self.seen_logs = 0
+        self.polls = 0
+        self.errors = 0
+        self.started_at = time.time()
+        self.finished_at = None
+        self.job = None
+
+
+class SyncJobMonitor(object):
+    """同步作业监控
+
+    在一个调度线程中同时跟踪多个同步作业，到期的作业交给线程池并发调用 get_sync_job 和 list_sync_job_logs：
+
+    - 每次只拉取新增的日志分页，新日志通过 on_log 回调或 iter_logs 迭代器增量返回；
+    - 有新日志时轮询间隔恢复为 min_interval，否则按 backoff 倍数逐步放宽到 max_interval；
+    - track / trigger 返回 concurrent.futures.Future，作业结束时结果为 get_sync_job 的 data；
+    - 网络错误、超时及服务端 429 / 5xx 错误视为暂时性错误，按 backoff 放宽间隔后重试，连续 max_errors 次失败后
+      作业的 Future 才以最后一次的异常结束；其他接口错误（如作业不存在）立即结束；
+    - metrics 返回每个作业的轮询次数、日志数和日志吞吐（条/秒）；
+    - 指定 risk_rule 时，作业结束后会拉取该同步任务的风险操作，对 risk_rule(operation) 返回 True 的操作
+      调用 trigger_sync_risk_operations 自动执行。
+    """
+
+    def __init__(self, management_client, on_log=None, risk_rule=None, min_interval=2.0, max_interval=30.0,
+                 backoff=1.5, max_workers=8, log_page_size=50, max_errors=5):
+        """
+        Args:
+            management_client (ManagementClient): 管理客户端
+            on_log (callable): on_log(sync_job_id, logs)，有新日志时调用
+            risk_rule (callable): risk_rule(operation) -> bool，决定是否自动执行某个风险操作
+            min_interval (float): 最小轮询间隔，单位为秒
+            max_interval (float): 最大轮询间隔，单位为秒
+            backoff (float): 没有新日志时轮询间隔的增长倍数
+            max_workers (int): 并发请求的最大线程数
+            log_page_size (int): 拉取日志时的每页数目
+            max_errors (int): 连续出现暂时性错误的最大次数，超过后作业以该错误结束
+        """
+        self.management_client = management_client
+        self.on_log = on_log
+        self.risk_rule = risk_rule
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.log_page_size = log_page_size
+        self.max_errors = max_errors
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._jobs = {}
+        self._heap = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._scheduler = None
+        self._closed = False
+
+    def trigger(self, sync_task_id):
+        """执行同步任务并开始跟踪其同步作业，返回 Future"""
+        data = get_response_data(self.management_client.trigger_sync_task(sync_task_id=sync_task_id)) or {}
+        return self.track(data.get("syncJobId"), sync_task_id)
+
+    def track(self, sync_job_id, sync_task_id=None):
+        """开始跟踪同步作业，返回 Future"""
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("SyncJobMonitor is closed")
+            job = self._jobs.get(sync_job_id)
+            if job is not None:
+                return job.future
+            job = self._jobs[sync_job_id] = _Job(sync_job_id, sync_task_id, self.min_interval)
+            self.__schedule(job, time.time())
+            if self._scheduler is None:
+                self._scheduler = threading.Thread(target=self.__run, name="authing-sync-job-monitor")
+                self._scheduler.daemon = True
+                self._scheduler.start()
+        return job.future
+
+    def iter_logs(self, sync_job_id, timeout=None):
+        """增量迭代同步作业的日志，作业结束且日志读完后停止"""
+        job = self._jobs[sync_job_id]
+        while True:
+            log = job.logs.get(timeout=timeout)
+            if log is _END:
+                job.logs.put(_END)
+                return
+            yield log
+
+    def metrics(self):
+        """返回每个同步作业的监控指标"""
+        result = {}
+        for sync_job_id, job in list(self._jobs.items()):
+            elapsed = (job.finished_at or time.time()) - job.started_at
+            result[sync_job_id] = {
+                "status": (job.job or {}).get("jobStatus"),
+                "polls": job.polls,
+                "errors": job.errors,
+                "logs": job.seen_logs,
+                "elapsed": elapsed,
+                "logs_per_second": job.seen_logs / elapsed if elapsed > 0 else 0.0,
+                "done": job.future.done(),
+            }
+        return result
+
+    def close(self):
+        """停止调度线程和线程池，未结束的作业不再跟踪：其 Future 被取消，iter_logs 读完已有日志后停止"""
+        with self._condition:
+            self._closed = True
+            self._heap = []
+            for job in self._jobs.values():
+                if job.future.cancel():
+                    job.logs.put(_END)
+                    job.finished_at = time.time()
+            self._condition.notify_all()
+        self._executor.shutdown(wait=False)
+
+    def __schedule(self, job, due):
+        # 调用方需持有 self._condition
+        heapq.heappush(self._heap, (due, next(self._counter), job))
+        self._condition.notify()
+
+    def __run(self):
+        while True:
+            with self._condition:
+                while not self._closed and (not self._heap or self._heap[0][0] > time.time()):
+                    if not self._heap and all(j.future.done() for j in self._jobs.values()):
+                        # 在持有锁时退出，track 发现 _scheduler 为 None 会重新启动调度线程
+                        self._scheduler = None
+                        return
+                    self._condition.wait(self._heap[0][0] - time.time() if self._heap else None)
+                if self._closed:
+                    self._scheduler = None
+                    return
+                _, _, job = heapq.heappop(self._heap)
+                # 在持有锁时提交，close 设置 _closed 后才会关闭线程池，因此这里不会提交到已关闭的线程池
+                self._executor.submit(self.__poll, job)
+
+    def __poll(self, job):
+        try:
+            job.polls += 1
+            job.job = get_response_data(self.management_client.get_sync_job(sync_job_id=job.sync_job_id)) or {}
+            job.sync_task_id = job.sync_task_id or job.job.get("syncTaskId")
+            new_logs = self.__emit_new_logs(job)
+            if job.job.get("jobStatus") in TERMINAL_JOB_STATUSES:
+                # 作业结束后再拉一次日志，避免遗漏结束前写入的最后几条
+                self.__emit_new_logs(job)
+                self.__finish(job)
+                return
+            job.interval = self.min_interval if new_logs else min(self.max_interval, job.interval * self.backoff)
+            job.errors = 0
+        except Exception as e:
+            job.errors += 1
+            if not self.__retryable(e) or job.errors >= self.max_errors:
+                self.__complete(job, error=e)
+                return
+            job.interval = min(self.max_interval, job.interval * self.backoff)
+        with self._condition:
+            if not self._closed:
+                self.__schedule(job, time.time() + job.interval)
+
+    @staticmethod
+    def __retryable(error):
+        if isinstance(error, AuthingException):
+            status = error.statusCode
+            return status == 429 or (isinstance(status, int) and status >= 500)
+        return True
+
+    def __emit_new_logs(self, job):
+        new_logs = self.__fetch_new_logs(job)
+        for log in new_logs:
+            job.logs.put(log)
+        if new_logs and self.on_log:
+            self.on_log(job.sync_job_id, new_logs)
+        return new_logs
+
+    def __fetch_new_logs(self, job):
+        limit = self.log_page_size
+        start_page = job.seen_logs // limit + 1
+        skip = job.seen_logs % limit
+
+        def fetch_page(page, limit):
+            return self.management_client.list_sync_job_logs(sync_job_id=job.sync_job_id, page=page, limit=limit)
+
+        new_logs = []
+        for page, items in iter_pages(fetch_page, limit=limit, max_workers=2, start_page=start_page):
+            if page == start_page:
+                items = items[skip:]
+            new_logs.extend(items)
+        job.seen_logs += len(new_logs)
+        return new_logs
+
+    def __finish(self, job):
+        if self.risk_rule and job.sync_task_id:
+            job.job["appliedRiskOperationIds"] = self.apply_risk_operations(job.sync_task_id)
+        self.__complete(job, result=job.job)
+
+    def __complete(self, job, result=None, error=None):
+        # 与 close 互斥，已被 close 取消的作业不再设置结果
+        with self._condition:
+            if job.future.done():
+                return
+            job.logs.put(_END)
+            job.finished_at = time.time()
+            if error is not None:
+                job.future.set_exception(error)
+            else:
+                job.future.set_result(result)
+
+    def apply_risk_operations(self, sync_task_id, rule=None):
+        """拉取同步任务的全部风险操作，执行 rule(operation) 返回 True 的操作，返回已执行的操作 ID 列表"""
+        rule = rule or self.risk_rule
+
+        def fetch_page(page, limit):
+            return self.management_client.list_sync_risk_operations(
+                sync_task_id=sync_task_id, page=page, limit=limit)
+
+        ids = []
+        for _, operations in iter_pages(fetch_page, max_workers=2):
+            for operation in operations:
+                if rule(operation):
+                    operation_id = operation.get("syncRiskOperationId")
+                    ids.append(operation_id if operation_id is not None else operation.get("id"))
+        if ids:
+            get_response_data(self.management_client.trigger_sync_risk_operations(sync_risk_operation_ids=ids))
+        return ids
@@ -0,0 +1,163 @@
+# coding: utf-8
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from .utils import get_response_data, to_millis
+from .utils.checkpoint import FileCheckpoint
+from .utils.pagination import parse_page
+from .utils.ratelimit import RateLimiter
+
+_DAY = 86400000
+
+
+class TimeSliceBackfill(object):
+    """按时间范围分片的并发回填引擎
+
+    把 [start, end] 切成 initial_slice 大小的时间片并发拉取。每个时间片先请求第一页，若 totalCount 超过 max_per_slice
+    （数据过密、分页太深），就把该时间片对半拆分后重新排队，直到时间片足够稀疏或不小于 min_slice 为止；
+    稀疏的时间片在同一线程内拉完剩余分页。所有请求共享一个令牌桶限流器。
+
+    时间片之间互不重叠且按时间顺序排列，iter_records 按时间片顺序、片内按 timestamp_key 升序流式返回，
+    整体即为时间升序。指定 align 时时间片边界（包括拆分点）对齐到 align 的整数倍，第一个时间片从 start 所在的对齐区间
+    开始，用于按天等粒度查询的接口，避免同一天落入两个时间片而被重复返回。
+    指定 checkpoint_path 后每输出完一个时间片就记录其结束时间，中断后从该时间继续。
+
+    fetch 为 fetch(start, end, page, limit) -> 接口返回值，时间均为毫秒时间戳；可以使用 for_login_history、
+    for_user_login_history、for_mau_usage_history 等工厂方法创建。
+    """
+
+    def __init__(self, fetch, timestamp_key="loginAt", page_size=50, max_per_slice=2000, initial_slice=_DAY,
+                 min_slice=60000, max_workers=4, rate=None, paginated=True, align=None):
+        """
+        Args:
+            fetch (callable): fetch(start, end, page, limit)
+            timestamp_key (str): 记录中的时间字段，用于片内排序
+            page_size (int): 每页数目
+            max_per_slice (int): 单个时间片允许的最大记录数，超过则拆分
+            initial_slice (int): 初始时间片长度，单位为毫秒
+            min_slice (int): 最小时间片长度，单位为毫秒
+            max_workers (int): 最大并发数
+            rate (float): 每秒最多发起的请求数，不填则不限流
+            paginated (bool): 接口是否分页，不分页时每个时间片只请求一次
+            align (int): 时间片边界的对齐粒度，单位为毫秒（UTC），如按天查询的接口为一天；不填则不对齐
+        """
+        self.fetch = fetch
+        self.timestamp_key = timestamp_key
+        self.page_size = page_size
+        self.max_per_slice = max_per_slice
+        self.initial_slice = initial_slice
+        self.min_slice = min_slice
+        self.max_workers = max_workers
+        self.rate_limiter = RateLimiter(rate)
+        self.paginated = paginated
+        self.align = align
+
+    # ==== 工厂方法 ====
+
+    @classmethod
+    def for_login_history(cls, authentication_client, app_id=None, client_ip=None, success=None, **kwargs):
+        """AuthenticationClient.get_login_history（当前登录用户的登录日志）"""
+        def fetch(start, end, page, limit):
+            return authentication_client.get_login_history(
+                app_id=app_id, client_ip=client_ip, success=success, start=start, end=end, page=page, limit=limit)
+        return cls(fetch, **kwargs)
+
+    @classmethod
+    def for_user_login_history(cls, management_client, user_id, user_id_type=None, app_id=None, client_ip=None,
+                               **kwargs):
+        """ManagementClient.get_user_login_history（指定用户的登录历史）"""
+        def fetch(start, end, page, limit):
+            return management_client.get_user_login_history(
+                user_id=user_id, user_id_type=user_id_type, app_id=app_id, client_ip=client_ip,
+                start=start, end=end, page=page, limit=limit)
+        return cls(fetch, **kwargs)
+
+    @classmethod
+    def for_mau_usage_history(cls, management_client, date_format="%Y%m%d", **kwargs):
+        """ManagementClient.get_mau_period_usage_history，该接口不分页，按天为粒度的日期字符串查询"""
+        def fetch(start, end, page, limit):
+            return management_client.get_mau_period_usage_history(
+                start_time=datetime.utcfromtimestamp(start / 1000.0).strftime(date_format),
+                end_time=datetime.utcfromtimestamp(end / 1000.0).strftime(date_format))
+        kwargs.setdefault("timestamp_key", "date")
+        kwargs.setdefault("initial_slice", 30 * _DAY)
+        kwargs.setdefault("min_slice", _DAY)
+        kwargs.setdefault("align", _DAY)
+        return cls(fetch, paginated=False, **kwargs)
+
+    # ==== 执行 ====
+
+    def __floor(self, timestamp):
+        # 向下对齐到 align 的整数倍，时间戳以 UTC 纪元为起点，因此按天对齐即为 UTC 零点
+        return timestamp - timestamp % self.align if self.align else timestamp
+
+    def __call(self, start, end, page):
+        self.rate_limiter.acquire()
+        return self.fetch(start, end, page, self.page_size)
+
+    def __run_slice(self, start, end):
+        # 返回 ("split", [子时间片]) 或 ("done", 记录列表)
+        resp = self.__call(start, end, 1)
+        if not self.paginated:
+            data = get_response_data(resp)
+            return "done", data if isinstance(data, list) else (data or {}).get("list") or []
+        items, total = parse_page(resp)
+        if total is not None and total > self.max_per_slice and end - start >= 2 * self.min_slice:
+            middle = self.__floor(start + (end - start + 1) // 2)
+            if middle > start:
+                return "split", [(start, middle - 1), (middle, end)]
+        records = list(items)
+        page = 1
+        while (total is not None and len(records) < total) or (total is None and len(items) >= self.page_size):
+            page += 1
+            items, _ = parse_page(self.__call(start, end, page))
+            if not items:
+                break
+            records.extend(items)
+        records.sort(key=lambda r: to_millis(r.get(self.timestamp_key)) or 0)
+        return "done", records
+
+    def iter_slices(self, start, end, checkpoint_path=None):
+        """按时间顺序返回 (slice_start, slice_end, records)"""
+        checkpoint = FileCheckpoint(checkpoint_path)
+        state = checkpoint.load() or {}
+        cursor = self.__floor(start)
+        if state.get("start") == start and state.get("end") == end and state.get("done") is not None:
+            cursor = state["done"] + 1
+
+        size = self.initial_slice
+        if self.align:
+            size = max(self.align, size - size % self.align)
+        bounds = deque()
+        while cursor <= end:
+            bounds.append((cursor, min(cursor + size - 1, end)))
+            cursor += size
+
+        # ordered 中的元素为 [slice_start, slice_end, future]，按时间顺序排列
+        ordered = deque()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            def submit(bound):
+                return [bound[0], bound[1], executor.submit(self.__run_slice, bound[0], bound[1])]
+
+            while bounds or ordered:
+                while bounds and len(ordered) < self.max_workers * 2:
+                    ordered.append(submit(bounds.popleft()))
+                slice_start, slice_end, future = ordered[0]
+                kind, result = future.result()
+                ordered.popleft()
+                if kind == "split":
+                    # 子时间片替换原时间片放回队首，保持整体时间顺序
+                    for bound in reversed(result):
+                        ordered.appendleft(submit(bound))
+                    continue
+                yield slice_start, slice_end, result
+                checkpoint.save({"start": start, "end": end, "done": slice_end})
+        checkpoint.clear()
+
+    def iter_records(self, start, end, checkpoint_path=None):
+        """按时间升序流式返回 [start, end] 内的全部记录"""
+        for _, _, records in self.iter_slices(start, end, checkpoint_path):
+            for record in records:
+                yield record
@@ -0,0 +1,157 @@
+# coding: utf-8
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .AuthingException import AuthingException
+from .utils import get_response_data
+from .utils.singleflight import SingleFlight
+
+
+class MemoryTokenStore(object):
+    """进程内的 TokenSet 存储
+
+    自定义存储（如 Redis、数据库）只需实现相同的 get、set、delete 三个方法，TokenSet 为可 JSON 序列化的 dict。
+    """
+
+    def __init__(self):
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, session_id):
+        with self._lock:
+            token_set = self._data.get(session_id)
+            return dict(token_set) if token_set else None
+
+    def set(self, session_id, token_set):
+        with self._lock:
+            self._data[session_id] = dict(token_set)
+
+    def delete(self, session_id):
+        with self._lock:
+            self._data.pop(session_id, None)
+
+
+def normalize_token_set(resp, now=None):
+    """将登录、换取 token 等接口的返回值统一为 TokenSet，并计算 expires_at
+
+    同时兼容 V3 接口（包含 statusCode 和 data）和 OIDC / OAuth token 端点（直接返回 token 字段）的返回格式。
+    """
+    if "statusCode" in resp:
+        resp = get_response_data(resp) or {}
+    elif resp.get("error"):
+        raise AuthingException(400, resp.get("error_description") or resp.get("error"))
+    if not resp.get("access_token"):
+        raise AuthingException(500, "response does not contain access_token")
+    token_set = {
+        "access_token": resp.get("access_token"),
+        "id_token": resp.get("id_token"),
+        "refresh_token": resp.get("refresh_token"),
+        "token_type": resp.get("token_type"),
+        "scope": resp.get("scope"),
+    }
+    expires_in = resp.get("expires_in")
+    token_set["expires_at"] = int((now or time.time()) + expires_in) if expires_in else None
+    return token_set
+
+
+class TokenSetManager(object):
+    """TokenSet 生命周期管理
+
+    按会话保存 sign_in_by_credentials、get_access_token_by_code、exchange_token_set_with_qr_code_ticket
+    等接口返回的 access_token、id_token 和 refresh_token：
+
+    - 距离过期不足 refresh_ahead 秒时，在后台线程中提前刷新，调用方继续使用当前仍然有效的 token，不承担刷新延迟；
+    - token 已过期时同步刷新；
+    - 同一个 refresh_token 的并发刷新只会发起一次请求（single-flight），避免刷新风暴；
+    - TokenSet 通过可替换的 store 持久化，默认为进程内存储。
+    """
+
+    def __init__(self, authentication_client, store=None, refresh_ahead=60, max_workers=4):
+        """
+        Args:
+            authentication_client (AuthenticationClient): 认证客户端
+            store: TokenSet 存储，需实现 get、set、delete 方法，默认为 MemoryTokenStore
+            refresh_ahead (int): 距离过期多少秒时开始提前刷新
+            max_workers (int): 后台刷新的最大线程数
+        """
+        self.authentication_client = authentication_client
+        self.store = store or MemoryTokenStore()
+        self.refresh_ahead = refresh_ahead
+        self._single_flight = SingleFlight()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def save(self, session_id, resp):
+        """保存登录或换取 token 接口的返回值，返回规范化后的 TokenSet"""
+        token_set = normalize_token_set(resp)
+        self.store.set(session_id, token_set)
+        return token_set
+
+    def remove(self, session_id):
+        """移除会话的 TokenSet"""
+        self.store.delete(session_id)
+
+    def get_token_set(self, session_id):
+        """获取会话的有效 TokenSet，必要时刷新；会话不存在时返回 None"""
+        token_set = self.store.get(session_id)
+        if token_set is None:
+            return None
+        expires_at = token_set.get("expires_at")
+        if not expires_at or not token_set.get("refresh_token"):
+            return token_set
+        now = time.time()
+        if now >= expires_at:
+            return self.refresh(session_id, token_set)
+        if now >= expires_at - self.refresh_ahead and not self._single_flight.in_flight(token_set["refresh_token"]):
+            self._executor.submit(self.__refresh_quietly, session_id, token_set)
+        return token_set
+
+    def get_access_token(self, session_id):
+        """获取会话的有效 access_token"""
+        token_set = self.get_token_set(session_id)
+        return token_set and token_set.get("access_token")
+
+    def activate(self, session_id):
+        """将会话的有效 access_token 设置到认证客户端（set_access_token），返回该 access_token
+
+        AuthenticationClient 的 access_token 为实例级状态，多会话并发时请为每个会话或线程使用独立的客户端实例。
+        """
+        access_token = self.get_access_token(session_id)
+        if access_token:
+            self.authentication_client.set_access_token(access_token)
+        return access_token
+
+    def refresh(self, session_id, token_set=None):
+        """立即使用 refresh_token 刷新会话的 TokenSet，并发调用会合并为一次请求"""
+        token_set = token_set or self.store.get(session_id)
+        if not token_set or not token_set.get("refresh_token"):
+            raise AuthingException(400, "session %s has no refresh_token" % session_id)
+        refresh_token = token_set["refresh_token"]
+        return self._single_flight.do(
+            refresh_token, self.__refresh, session_id, refresh_token, token_set.get("access_token"))
+
+    def __refresh(self, session_id, refresh_token, stale_access_token):
+        # 其他线程或共享 store 的其他进程可能已经完成了刷新
+        current = self.store.get(session_id)
+        if current and current.get("access_token") != stale_access_token and \
+                (current.get("expires_at") or 0) > time.time() + self.refresh_ahead:
+            return current
+        resp = self.authentication_client.get_new_access_token_by_refresh_token(refresh_token)
+        token_set = normalize_token_set(resp)
+        # 未轮换 refresh_token 时沿用原值
+        token_set["refresh_token"] = token_set.get("refresh_token") or refresh_token
+        token_set["id_token"] = token_set.get("id_token") or (current or {}).get("id_token")
+        self.store.set(session_id, token_set)
+        return token_set
+
+    def __refresh_quietly(self, session_id, token_set):
+        try:
+            self.refresh(session_id, token_set)
+        except Exception:
+            # 提前刷新失败时保留当前 token，过期后会再次同步刷新
+            pass
+
+    def close(self):
+        """关闭后台刷新线程池"""
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,214 @@
+# coding: utf-8
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .utils import get_response_data
+from .utils.bloom import BloomFilter
+from .utils.pagination import iter_pages, parse_page
+
+# 用户池内唯一的标识字段：用户字段名 -> is_user_exists 的参数名
+IDENTIFIER_FIELDS = {
+    "username": "username",
+    "email": "email",
+    "phone": "phone",
+    "externalId": "external_id",
+}
+
+# 默认视为「新增用户」的事件编码，可通过 events 参数修改
+DEFAULT_USER_CREATED_EVENTS = frozenset([
+    "authing.user.created",
+    "authing.user.register",
+])
+
+
+def _key(field, value):
+    # 邮箱不区分大小写
+    if field == "email":
+        value = value.lower()
+    return "%s:%s" % (field, value)
+
+
+class UserExistenceFilter(object):
+    """用户是否已存在的本地预判
+
+    用布隆过滤器记录用户池内所有用户的用户名、邮箱、手机号和 externalId。判断为不存在时一定不存在，
+    直接返回「新用户」而不请求服务端；判断为可能存在时再调用 is_user_exists 确认。批量导入和注册流程中绝大多数
+    候选用户都是新用户，因此几乎所有的存在性检查都在本地完成。
+
+    数据来源：
+
+    - load 流式分页拉取 list_users 构建过滤器；
+    - 通过本类的 create_user、create_users_batch 创建的用户在调用成功后加入过滤器；
+    - on_event 可作为 ManagementClient.sub_event 的回调，记录其他途径（控制台、自助注册等）创建的用户。
+
+    布隆过滤器不支持删除，delete_users_batch 删除的用户仍会被判断为可能存在，只会多一次 is_user_exists 请求，
+    不影响正确性；删除或新增较多时可通过 needs_rebuild 判断是否需要重新 load。
+    """
+
+    def __init__(self, management_client, error_rate=0.001, capacity=None, growth=0.5, page_size=50,
+                 max_workers=4, events=None):
+        """
+        Args:
+            management_client (ManagementClient): 管理客户端
+            error_rate (float): 误判率，即新用户需要请求服务端确认的比例
+            capacity (int): 预计的标识个数，默认按用户总数和 growth 估算
+            growth (float): 默认容量相对当前用户数预留的增长比例
+            page_size (int): 每页数目
+            max_workers (int): 并发拉取分页、并发调用 is_user_exists 的最大线程数
+            events (set): 视为新增用户的事件编码，默认为 DEFAULT_USER_CREATED_EVENTS
+        """
+        self.management_client = management_client
+        self.error_rate = error_rate
+        self.capacity = capacity
+        self.growth = growth
+        self.page_size = page_size
+        self.max_workers = max_workers
+        self.events = DEFAULT_USER_CREATED_EVENTS if events is None else events
+        self._bloom = None
+        self._lock = threading.Lock()
+        # load 期间新增的标识，构建完成后补写到新的过滤器
+        self._pending = None
+        self._deleted = 0
+        self.stats = {"local": 0, "remote": 0, "false_positive": 0}
+
+    # ==== 加载 ====
+
+    def load(self):
+        """流式分页拉取 list_users，重新构建过滤器"""
+        def fetch_page(page, limit):
+            return self.management_client.list_users(options={"pagination": {"page": page, "limit": limit}})
+
+        with self._lock:
+            self._pending = []
+        try:
+            capacity = self.capacity
+            if capacity is None:
+                _, total = parse_page(fetch_page(1, 1))
+                capacity = int((total or 0) * (1 + self.growth) * len(IDENTIFIER_FIELDS)) or 1000
+            bloom = BloomFilter(capacity=capacity, error_rate=self.error_rate)
+            for _, users in iter_pages(fetch_page, limit=self.page_size, max_workers=self.max_workers):
+                for user in users:
+                    self.__add_user(bloom, user)
+        finally:
+            with self._lock:
+                pending, self._pending = self._pending, None
+        with self._lock:
+            bloom.update(pending)
+            self._bloom = bloom
+            self._deleted = 0
+        return self
+
+    @staticmethod
+    def __add_user(bloom, user):
+        for field in IDENTIFIER_FIELDS:
+            if user.get(field):
+                bloom.add(_key(field, user[field]))
+
+    def add_user(self, user):
+        """把用户（包含 username / email / phone / externalId 字段的 dict）加入过滤器"""
+        keys = [_key(field, user[field]) for field in IDENTIFIER_FIELDS if user.get(field)]
+        with self._lock:
+            if self._pending is not None:
+                self._pending.extend(keys)
+            bloom = self._bloom
+        if bloom is not None:
+            bloom.update(keys)
+
+    def needs_rebuild(self):
+        """标识数超过容量，或删除的用户较多导致误判率明显升高时返回 True"""
+        bloom = self._bloom
+        if bloom is None:
+            return True
+        return len(bloom) > bloom.capacity or self._deleted > bloom.capacity * 0.1
+
+    # ==== 判断 ====
+
+    def might_exist(self, username=None, email=None, phone=None, external_id=None):
+        """只在本地判断，返回 False 时一定不存在；未 load 时总是返回 True"""
+        bloom = self._bloom
+        if bloom is None:
+            return True
+        values = {"username": username, "email": email, "phone": phone, "externalId": external_id}
+        return any(_key(field, value) in bloom for field, value in values.items() if value)
+
+    def exists(self, username=None, email=None, phone=None, external_id=None):
+        """判断用户是否存在，本地判断为可能存在时调用 is_user_exists 确认"""
+        if not self.might_exist(username, email, phone, external_id):
+            self.stats["local"] += 1
+            return False
+        self.stats["remote"] += 1
+        data = get_response_data(self.management_client.is_user_exists(
+            username=username, email=email, phone=phone, external_id=external_id))
+        exists = data.get("exists") if isinstance(data, dict) else bool(data)
+        if not exists:
+            self.stats["false_positive"] += 1
+        return bool(exists)
+
+    def check_many(self, candidates):
+        """
+        批量判断候选用户是否已存在，返回与 candidates 顺序一致的 bool 列表。
+
+        Args:
+            candidates (list): 用户 dict 列表，使用其中的 username / email / phone / externalId 字段
+        """
+        results = [False] * len(candidates)
+        remote = []
+        for i, user in enumerate(candidates):
+            kwargs = dict((arg, user.get(field)) for field, arg in IDENTIFIER_FIELDS.items())
+            if self.might_exist(**kwargs):
+                remote.append((i, kwargs))
+            else:
+                self.stats["local"] += 1
+        if remote:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for (i, _), exists in zip(remote, executor.map(lambda item: self.exists(**item[1]), remote)):
+                    results[i] = exists
+        return results
+
+    def split_new(self, candidates):
+        """把候选用户分为 (新用户列表, 已存在的用户列表)"""
+        new, existing = [], []
+        for user, exists in zip(candidates, self.check_many(candidates)):
+            (existing if exists else new).append(user)
+        return new, existing
+
+    # ==== 修改 ====
+
+    def create_user(self, **kwargs):
+        """调用 create_user 创建用户，成功后加入过滤器"""
+        data = get_response_data(self.management_client.create_user(**kwargs))
+        self.add_user(data if isinstance(data, dict) else {})
+        self.add_user(dict((field, kwargs.get(arg)) for field, arg in IDENTIFIER_FIELDS.items()))
+        return data
+
+    def create_users_batch(self, list, options=None):
+        """调用 create_users_batch 批量创建用户，成功后加入过滤器"""
+        data = get_response_data(self.management_client.create_users_batch(list=list, options=options))
+        created = data.get("list") if isinstance(data, dict) else data
+        for user in created or []:
+            self.add_user(user)
+        for user in list:
+            self.add_user(user)
+        return data
+
+    def delete_users_batch(self, user_ids, options=None):
+        """调用 delete_users_batch 批量删除用户，删除的用户仍留在过滤器中，只影响误判率"""
+        data = get_response_data(self.management_client.delete_users_batch(user_ids=user_ids, options=options))
+        self._deleted += len(user_ids)
+        return data
+
+    def on_event(self, message):
+        """事件回调，可直接传给 ManagementClient.sub_event，把新增的用户加入过滤器"""
+        try:
+            event = json.loads(message) if isinstance(message, (str, bytes)) else message
+        except ValueError:
+            return
+        if not isinstance(event, dict):
+            return
+        code = event.get("eventType") or event.get("eventCode") or event.get("eventName")
+        if code not in self.events:
+            return
+        data = event.get("data") if isinstance(event.get("data"), dict) else event
+        self.add_user(data.get("user") if isinstance(data.get("user"), dict) else data)
@@ -0,0 +1,242 @@
+# coding: utf-8
+
+import csv
+import io
+import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from .utils.checkpoint import FileCheckpoint
+from .utils.ratelimit import RateLimiter
+from .utils.writers import NdjsonWriter
+
+# 用户池内唯一的字段，导入前在本地去重
+UNIQUE_FIELDS = ("email", "phone", "username", "externalId")
+
+
+def read_rows(path, format=None):
+    """流式读取 CSV 或 NDJSON 文件，逐行返回 dict
+
+    CSV 中的空字符串视为未填写；以 `[` 或 `{` 开头的单元格按 JSON 解析。
+    """
+    format = format or ("csv" if path.endswith(".csv") else "ndjson")
+    with io.open(path, "r", encoding="utf-8", newline="" if format == "csv" else None) as f:
+        if format == "csv":
+            for row in csv.DictReader(f):
+                yield {k: _parse_cell(v) for k, v in row.items() if v not in (None, "")}
+        elif format == "ndjson":
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+        else:
+            raise ValueError("unsupported import format: %s" % format)
+
+
+def _parse_cell(value):
+    if value[:1] in ("[", "{"):
+        try:
+            return json.loads(value)
+        except ValueError:
+            pass
+    return value
+
+
+class UserImporter(object):
+    """用户批量导入引擎
+
+    基于 create_users_batch、update_user_batch 和 set_user_departments：
+
+    - 流式读取 CSV / NDJSON，导入前在本地校验必填项，并按 email、phone、username、externalId 去重；
+    - 按 chunk_size 分批，在 max_workers 个线程内并发提交，并受 rate 限流；
+    - 带 userId 的行走 update_user_batch，其余走 create_users_batch；行中的 departments 字段在用户创建后通过 set_user_departments 设置；
+    - 指定 checkpoint_path 后按已连续完成的行号记录进度，进程崩溃后再次调用 run 会跳过已完成的行；
+    - 每一行的处理结果（created、updated、duplicate、invalid、failed、unknown）写入 NDJSON 格式的报告；
+      批量接口返回的用户无法与提交的行对应时，该行记为 unknown，不设置部门。
+    """
+
+    def __init__(self, management_client, chunk_size=50, max_workers=4, rate=None, options=None):
+        """
+        Args:
+            management_client (ManagementClient): 管理客户端
+            chunk_size (int): 每批提交的用户数
+            max_workers (int): 最大并发批次数
+            rate (float): 每秒最多发起的请求数，不填则不限流
+            options (dict): 透传给 create_users_batch / update_user_batch 的 options
+        """
+        self.management_client = management_client
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.rate_limiter = RateLimiter(rate)
+        self.options = options
+
+    def validate(self, row):
+        """校验单行数据，返回错误信息，合法时返回 None"""
+        if row.get("userId"):
+            return None
+        if not any(row.get(k) for k in ("email", "phone", "username")):
+            return "email, phone or username is required"
+        return None
+
+    def run(self, rows, report_path=None, checkpoint_path=None):
+        """执行导入
+
+        Args:
+            rows (iterable): 用户数据，可以是 read_rows 的返回值
+            report_path (str): 逐行结果报告输出路径（NDJSON）
+            checkpoint_path (str): 断点记录文件路径
+
+        Returns:
+            dict: 各状态的行数统计
+        """
+        checkpoint = FileCheckpoint(checkpoint_path)
+        state = checkpoint.load() or {}
+        done_rows = state.get("row", 0)
+        report = NdjsonWriter(report_path, append=bool(state)) if report_path else None
+        stats = {}
+        seen = {field: set() for field in UNIQUE_FIELDS}
+
+        def emit(results):
+            for result in results:
+                stats[result["status"]] = stats.get(result["status"], 0) + 1
+            if report:
+                report.write_batch(results)
+
+        chunk, chunk_results = [], []
+        pending = deque()
+        index = done_rows - 1
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for index, row in enumerate(rows):
+                    # 只登记通过校验的行，非法行的唯一字段不影响后续行的去重
+                    error = self.validate(row)
+                    duplicate_of = self.__register(seen, row) if not error else None
+                    if index < done_rows:
+                        continue
+                    if error:
+                        chunk_results.append({"row": index, "status": "invalid", "message": error})
+                    elif duplicate_of:
+                        chunk_results.append({"row": index, "status": "duplicate", "message": duplicate_of})
+                    else:
+                        chunk.append((index, row))
+                    if len(chunk) >= self.chunk_size:
+                        pending.append((index + 1, executor.submit(self.__submit, chunk), chunk_results))
+                        chunk, chunk_results = [], []
+                        # 限制在途批次数，避免读取速度远超提交速度时占满内存
+                        while len(pending) >= self.max_workers * 2:
+                            self.__drain(pending, emit, checkpoint)
+                if chunk or chunk_results:
+                    pending.append((index + 1, executor.submit(self.__submit, chunk), chunk_results))
+                while pending:
+                    self.__drain(pending, emit, checkpoint)
+        finally:
+            if report:
+                report.close()
+        checkpoint.clear()
+        return stats
+
+    @staticmethod
+    def __drain(pending, emit, checkpoint):
+        # 按提交顺序等待批次完成，因此 end_row 之前的行均已处理完毕
+        end_row, future, skipped_results = pending.popleft()
+        emit(sorted(skipped_results + future.result(), key=lambda r: r["row"]))
+        checkpoint.save({"row": end_row})
+
+    @staticmethod
+    def __register(seen, row):
+        # 返回与之重复的字段名，未重复时登记该行的唯一字段
+        for field in UNIQUE_FIELDS:
+            value = row.get(field)
+            if value is None:
+                continue
+            key = value.lower() if field == "email" else value
+            if key in seen[field]:
+                return field
+        for field in UNIQUE_FIELDS:
+            value = row.get(field)
+            if value is not None:
+                seen[field].add(value.lower() if field == "email" else value)
+        return None
+
+    def __submit(self, chunk):
+        creates, updates, results = [], [], []
+        for index, row in chunk:
+            (updates if row.get("userId") else creates).append((index, row))
+        if creates:
+            results.extend(self.__apply(creates, self.management_client.create_users_batch, "created"))
+        if updates:
+            results.extend(self.__apply(updates, self.management_client.update_user_batch, "updated"))
+        return results
+
+    def __apply(self, items, batch_method, status):
+        departments = {}
+        payload = []
+        for index, row in items:
+            row = dict(row)
+            if "departments" in row:
+                departments[index] = row.pop("departments")
+            payload.append(row)
+
+        self.rate_limiter.acquire()
+        try:
+            resp = batch_method(list=payload, options=self.options)
+        except Exception as e:
+            return [{"row": index, "status": "failed", "message": str(e)} for index, _ in items]
+        if resp.get("statusCode") != 200:
+            return [{"row": index, "status": "failed", "message": resp.get("message")} for index, _ in items]
+
+        users = resp.get("data") or []
+        if len(users) != len(items):
+            users = self.__match(items, users)
+        results = []
+        for (index, row), user in zip(items, users):
+            if user is None:
+                results.append({"row": index, "status": "unknown",
+                                "message": "user not found in %s response" % batch_method.__name__})
+                continue
+            user_id = user.get("userId") or row.get("userId")
+            result = {"row": index, "status": status, "userId": user_id}
+            if index in departments and user_id:
+                error = self.__set_departments(user_id, departments[index])
+                if error:
+                    result["message"] = error
+            results.append(result)
+        return results
+
+    @staticmethod
+    def __match(items, users):
+        # 返回的用户数与提交的行数不一致时，不能按位置对应，改为按 userId 和唯一字段对应，对应不上的为 None
+        index = {}
+        for user in users:
+            if not isinstance(user, dict):
+                continue
+            for field in ("userId",) + UNIQUE_FIELDS:
+                value = user.get(field)
+                if value is not None:
+                    index[(field, value.lower() if field == "email" else value)] = user
+        matched = []
+        for _, row in items:
+            user = None
+            for field in ("userId",) + UNIQUE_FIELDS:
+                value = row.get(field)
+                if value is not None:
+                    user = index.get((field, value.lower() if field == "email" else value))
+                    if user is not None:
+                        break
+            matched.append(user)
+        return matched
+
+    def __set_departments(self, user_id, departments):
+        if not isinstance(departments, list):
+            departments = [d for d in str(departments).split(";") if d]
+        departments = [d if isinstance(d, dict) else {"departmentId": d} for d in departments]
+        self.rate_limiter.acquire()
+        try:
+            resp = self.management_client.set_user_departments(
+                user_id=user_id, departments=departments)
+        except Exception as e:
+            return "set_user_departments failed: %s" % e
+        if resp.get("statusCode") != 200:
+            return "set_user_departments failed: %s" % resp.get("message")
+        return None
@@ -0,0 +1,169 @@
+# coding: utf-8
+
+import base64
+import hashlib
+import threading
+import time
+
+import jwt
+
+from .utils import parse_jwks
+from .utils.lru import LRUCache
+from .utils.singleflight import SingleFlight
+
+# 标准 scope 对应的 claims（OIDC Core 5.4）
+SCOPE_CLAIMS = {
+    "openid": ("sub",),
+    "profile": ("name", "family_name", "given_name", "middle_name", "nickname", "preferred_username", "profile",
+                "picture", "website", "gender", "birthdate", "zoneinfo", "locale", "updated_at"),
+    "email": ("email", "email_verified"),
+    "phone": ("phone_number", "phone_number_verified"),
+    "address": ("address",),
+}
+
+# 不影响用户信息的 scope
+_IGNORED_SCOPES = ("offline_access",)
+
+# Id token 中只用于校验、不属于用户信息的 claims
+_TOKEN_CLAIMS = frozenset(["iss", "aud", "exp", "iat", "nbf", "jti", "nonce", "at_hash", "c_hash", "auth_time",
+                           "azp", "acr", "amr", "sid"])
+
+
+def _at_hash(access_token):
+    """OIDC Core 3.1.3.6：Access token 的 SHA-256 摘要左半部分的 base64url 编码"""
+    digest = hashlib.sha256(access_token.encode("utf-8")).digest()
+    return base64.urlsafe_b64encode(digest[:len(digest) // 2]).rstrip(b"=").decode("ascii")
+
+
+def _unverified_claims(token):
+    try:
+        return jwt.decode(token, options={"verify_signature": False})
+    except jwt.InvalidTokenError:
+        return None
+
+
+class UserInfoCache(object):
+    """get_user_info_by_access_token 的缓存
+
+    - 以 Access token 的 SHA-256 为 key 缓存用户信息，缓存时间不超过 ttl，也不超过 Access token 的 exp；
+      最多缓存 maxsize 个 Token，超出后淘汰最久未使用的；
+    - 同一 Access token 的并发未命中只请求一次 /oidc/me（/oauth/me）；
+    - derive_from_id_token 为 True 且传入了 id_token 时，如果请求的 scope 都是标准 scope 且均已包含在 Id token 中，
+      则在本地验签 Access token（含 exp）和 Id token，并校验 Id token 的 at_hash 与 Access token 一致后，
+      直接从 Id token 中取出用户信息，不再请求接口。任何一项校验不通过时都会请求接口。
+
+    一般通过 AuthenticationClient.get_user_info_cache 获取。
+    """
+
+    def __init__(self, client, maxsize=10000, ttl=300, derive_from_id_token=False, server_jwks=None):
+        """
+        Args:
+            client (AuthenticationClient): 认证客户端
+            maxsize (int): 最多缓存的 Token 数
+            ttl (int): 缓存时间，单位为秒
+            derive_from_id_token (bool): 是否允许从 Id token 中直接取出用户信息
+            server_jwks (dict): 服务端的 JWKS 公钥，用于校验 RS256 签名的 Id token，默认从服务端获取
+        """
+        self.client = client
+        self.ttl = ttl
+        self.derive_from_id_token = derive_from_id_token
+        self._cache = LRUCache(maxsize=maxsize)
+        self._flight = SingleFlight()
+        self._jwks = server_jwks
+        self._keys = None
+        self._keys_loaded_at = 0
+        self._keys_lock = threading.Lock()
+        self.stats = {"hit": 0, "miss": 0, "derived": 0}
+
+    def get(self, access_token, id_token=None, scope=None):
+        """
+        获取 Access token 对应的用户信息。
+
+        Args:
+            access_token (str): Access token
+            id_token (str): 与 Access token 同时签发的 Id token，derive_from_id_token 为 True 时使用
+            scope (str): 获取 Token 时请求的 scope，空格分隔
+        """
+        key = hashlib.sha256(access_token.encode("utf-8")).hexdigest()
+        user_info = self._cache.get(key)
+        if user_info is not None:
+            self.stats["hit"] += 1
+            return user_info
+        claims = _unverified_claims(access_token) or {}
+        if self.derive_from_id_token and id_token and scope:
+            user_info = self.__derive(access_token, id_token, scope)
+            if user_info is not None:
+                self.stats["derived"] += 1
+                self.__store(key, claims, user_info)
+                return user_info
+        self.stats["miss"] += 1
+        return self._flight.do(key, self.__fetch, key, claims, access_token)
+
+    def invalidate(self, access_token):
+        self._cache.pop(hashlib.sha256(access_token.encode("utf-8")).hexdigest())
+
+    def clear(self):
+        self._cache.clear()
+
+    def __fetch(self, key, claims, access_token):
+        user_info = self.client.get_user_info_by_access_token(access_token)
+        # 失败时返回的是 error / statusCode，只缓存包含 sub 的用户信息
+        if isinstance(user_info, dict) and user_info.get("sub"):
+            self.__store(key, claims, user_info)
+        return user_info
+
+    def __store(self, key, claims, user_info):
+        ttl = self.ttl
+        if claims.get("exp"):
+            ttl = min(ttl, claims["exp"] - time.time())
+        if ttl > 0:
+            self._cache.set(key, user_info, ttl=ttl)
+
+    def __derive(self, access_token, id_token, scope):
+        scopes = [s for s in scope.split() if s not in _IGNORED_SCOPES]
+        if not scopes or any(s not in SCOPE_CLAIMS for s in scopes):
+            return None
+        # Access token 必须验签通过且未过期，Id token 必须通过 at_hash 绑定到这个 Access token，
+        # 否则伪造的 Access token 搭配任意合法的 Id token 就能取得他人的用户信息
+        access_claims = self.__verify(access_token, audience=None)
+        if access_claims is None:
+            return None
+        id_claims = self.__verify(id_token, audience=self.client.app_id)
+        if id_claims is None or id_claims.get("at_hash") != _at_hash(access_token):
+            return None
+        if not id_claims.get("sub") or access_claims.get("sub") != id_claims["sub"]:
+            return None
+        for s in scopes:
+            if not any(claim in id_claims for claim in SCOPE_CLAIMS[s]):
+                return None
+        return dict((k, v) for k, v in id_claims.items() if k not in _TOKEN_CLAIMS)
+
+    def __verify(self, token, audience):
+        """验签并校验 exp，audience 为 None 时不校验 aud，失败时返回 None"""
+        options = {"require": ["exp"]}
+        if audience is None:
+            options["verify_aud"] = False
+        try:
+            header = jwt.get_unverified_header(token)
+            if header.get("alg") == "HS256":
+                if not self.client.app_secret:
+                    return None
+                return jwt.decode(token, key=self.client.app_secret, algorithms=["HS256"], audience=audience,
+                                  options=options)
+            key = self.__get_key(header.get("kid"))
+            if key is None:
+                return None
+            return jwt.decode(token, key=key, algorithms=["RS256"], audience=audience, options=options)
+        except jwt.InvalidTokenError:
+            return None
+
+    def __get_key(self, kid):
+        with self._keys_lock:
+            # 遇到未知 kid 时重新获取 JWKS 以支持密钥轮换，但每分钟最多一次
+            if self._keys is None or (kid not in self._keys and self._jwks is None and
+                                      time.time() - self._keys_loaded_at >= 60):
+                jwks = self._jwks or self.client.protocol_http_client.request(
+                    method="GET", url="/oidc/.well-known/jwks.json")
+                self._keys = parse_jwks(jwks)
+                self._keys_loaded_at = time.time()
+            return self._keys.get(kid)
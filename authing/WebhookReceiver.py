@@ -0,0 +1,205 @@
+# coding: utf-8
+
+import hashlib
+import hmac
+import json
+import queue
+import threading
+import time
+
+from .utils.lru import LRUCache
+
+try:
+    import orjson
+
+    def _loads(body):
+        return orjson.loads(body)
+except ImportError:
+    def _loads(body):
+        return json.loads(body.decode("utf-8") if isinstance(body, bytes) else body)
+
+
+class WebhookReceiver(object):
+    """Webhook 接收端，可直接作为 WSGI 应用挂载，也可以通过 asgi_app 作为 ASGI 应用挂载
+
+    处理流程：
+
+    1. 校验签名：请求头 signature_header 的值与 create_webhook 时设置的 secret 相同，或等于请求体的 HMAC-SHA256（hex），
+       均使用常量时间比较；
+    2. 解析 JSON（安装了 orjson 时优先使用）；
+    3. 按事件 id 去重，最近 dedupe_size 个事件 id 保存在 LRU 中，重复投递直接返回 200；
+    4. 放入容量为 queue_size 的有界队列，由 workers 个工作线程按批（最多 batch_size 个事件）调用 handler；
+       队列满且等待 enqueue_timeout 秒后仍无空位时返回 503（ASGI 入口不等待，队列满时立即返回 503），
+       由 Authing 稍后重试，从而形成背压。
+
+    示例::
+
+        def handle(events):
+            for event in events:
+                print(event["eventName"])
+
+        app = WebhookReceiver(secret="your-webhook-secret", handler=handle)
+        app.start()
+        # gunicorn module:app 或 uvicorn module:app.asgi_app
+    """
+
+    def __init__(self, secret, handler, signature_header="x-authing-webhook-secret", id_keys=("id", "eventId"),
+                 workers=4, queue_size=10000, batch_size=100, batch_wait=0.05, enqueue_timeout=1.0,
+                 dedupe_size=100000):
+        """
+        Args:
+            secret (str): 创建 Webhook 时设置的 secret
+            handler (callable): handler(events)，events 为事件 dict 列表
+            signature_header (str): 携带签名的请求头
+            id_keys (tuple): 事件中用于去重的 id 字段，依次查找
+            workers (int): 工作线程数
+            queue_size (int): 待处理事件队列容量
+            batch_size (int): 每次调用 handler 的最大事件数
+            batch_wait (float): 凑批的最长等待时间，单位为秒
+            enqueue_timeout (float): 队列满时的最长等待时间，单位为秒
+            dedupe_size (int): 用于去重的事件 id 个数上限
+        """
+        self.secret = secret.encode("utf-8") if not isinstance(secret, bytes) else secret
+        self.handler = handler
+        self.signature_header = signature_header.lower()
+        self.id_keys = id_keys
+        self.workers = workers
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self.enqueue_timeout = enqueue_timeout
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._seen = LRUCache(maxsize=dedupe_size)
+        self._threads = []
+        self._stopped = threading.Event()
+        self.stats = {"accepted": 0, "duplicate": 0, "rejected": 0, "dropped": 0, "failed": 0}
+        self._stats_lock = threading.Lock()
+
+    # ==== 工作线程 ====
+
+    def start(self):
+        """启动工作线程"""
+        if self._threads:
+            return self
+        self._stopped.clear()
+        for i in range(self.workers):
+            thread = threading.Thread(target=self.__work, name="authing-webhook-%d" % i)
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self, timeout=None):
+        """处理完队列中剩余的事件后停止工作线程"""
+        self._stopped.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def __work(self):
+        while not (self._stopped.is_set() and self._queue.empty()):
+            try:
+                batch = [self._queue.get(timeout=0.1)]
+            except queue.Empty:
+                continue
+            deadline = time.time() + self.batch_wait
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.time()
+                try:
+                    batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self.handler(batch)
+            except Exception:
+                self.__count("failed", len(batch))
+
+    def __count(self, name, n):
+        # 请求线程和工作线程会同时更新计数
+        with self._stats_lock:
+            self.stats[name] += n
+
+    # ==== 请求处理 ====
+
+    def verify(self, signature, body):
+        """校验签名，signature 为请求头中的值，body 为原始请求体"""
+        if not signature:
+            return False
+        signature = signature.encode("utf-8") if not isinstance(signature, bytes) else signature
+        if hmac.compare_digest(signature, self.secret):
+            return True
+        expected = hmac.new(self.secret, body, hashlib.sha256).hexdigest().encode()
+        return hmac.compare_digest(signature.lower(), expected)
+
+    def receive(self, headers, body, block=True):
+        """处理一次投递，headers 的 key 需为小写，返回 (HTTP 状态码, 响应体)
+
+        Args:
+            headers (dict): 请求头
+            body (bytes): 原始请求体
+            block (bool): 队列满时是否最多等待 enqueue_timeout 秒，为 False 时立即返回 503
+        """
+        if not self.verify(headers.get(self.signature_header), body):
+            self.__count("rejected", 1)
+            return 401, b'{"message":"invalid signature"}'
+        try:
+            event = _loads(body)
+        except ValueError:
+            self.__count("rejected", 1)
+            return 400, b'{"message":"invalid json"}'
+
+        event_id = None
+        for key in self.id_keys:
+            event_id = event.get(key) if isinstance(event, dict) else None
+            if event_id:
+                break
+        if event_id and not self._seen.add(event_id):
+            self.__count("duplicate", 1)
+            return 200, b'{"message":"duplicate"}'
+
+        try:
+            if block:
+                self._queue.put(event, timeout=self.enqueue_timeout)
+            else:
+                self._queue.put_nowait(event)
+        except queue.Full:
+            # 未入队的事件允许重新投递
+            if event_id:
+                self._seen.pop(event_id)
+            self.__count("dropped", 1)
+            return 503, b'{"message":"busy"}'
+        self.__count("accepted", 1)
+        return 200, b'{"message":"ok"}'
+
+    def __call__(self, environ, start_response):
+        """WSGI 入口"""
+        try:
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            length = 0
+        body = environ["wsgi.input"].read(length) if length else b""
+        header = "HTTP_" + self.signature_header.upper().replace("-", "_")
+        status, payload = self.receive({self.signature_header: environ.get(header)}, body)
+        start_response("%d %s" % (status, _REASONS.get(status, "")),
+                       [("Content-Type", "application/json"), ("Content-Length", str(len(payload)))])
+        return [payload]
+
+    async def asgi_app(self, scope, receive, send):
+        """ASGI 入口"""
+        if scope["type"] != "http":
+            return
+        chunks = []
+        while True:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body"):
+                break
+        headers = {k.decode("latin-1").lower(): v.decode("latin-1") for k, v in scope.get("headers", [])}
+        body = b"".join(chunks)
+        # 不在事件循环中等待队列空位，队列满时直接返回 503
+        status, payload = self.receive(headers, body, block=False)
+        await send({"type": "http.response.start", "status": status,
+                    "headers": [(b"content-type", b"application/json")]})
+        await send({"type": "http.response.body", "body": payload})
+
+
+_REASONS = {200: "OK", 400: "Bad Request", 401: "Unauthorized", 503: "Service Unavailable"}
@@ -2,11 +2,11 @@
 
 from pickle import FALSE
 from ..version import __version__
-import requests
+from .HttpSender import HttpSender
 import base64
 
 
-class AuthenticationHttpClient(object):
+class AuthenticationHttpClient(HttpSender):
     def __init__(
         self,
         app_id,
@@ -15,7 +15,9 @@ class AuthenticationHttpClient(object):
         lang,
         use_unverified_ssl,
         token_endpoint_auth_method,
-        real_ip
+        real_ip,
+        http_cache=None,
+        coalesce_requests=True
     ):
         self.app_id = app_id
         self.app_secret = app_secret
@@ -25,6 +27,7 @@ class AuthenticationHttpClient(object):
         self.access_token = None
         self.token_endpoint_auth_method = token_endpoint_auth_method
         self.real_ip = real_ip
+        self._init_sender(http_cache, coalesce_requests)
 
     def set_access_token(self, access_token):
         self.access_token = access_token
@@ -71,7 +74,7 @@ class AuthenticationHttpClient(object):
         elif self.access_token:
             headers["authorization"] = self.access_token
         verify = not self.use_unverified_ssl
-        r = requests.request(
+        r = self._send(
             method=method, url=url, headers=headers, json=json, verify=verify, **kwargs
         )
         data = r.json()
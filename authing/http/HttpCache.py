@@ -0,0 +1,287 @@
+# coding: utf-8
+
+import calendar
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import time
+from email.utils import parsedate
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from ..utils.lru import LRUCache
+
+# 可以缓存的响应状态码
+_CACHEABLE_STATUS = (200, 203)
+# 请求成功后需要让同一 URL 的缓存失效的方法
+_UNSAFE_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+# 收到 304 时用新响应更新的响应头
+_UPDATE_HEADERS = ("cache-control", "expires", "date", "etag", "last-modified", "age", "vary")
+# 只有 Last-Modified 时的启发式新鲜期：(Date - Last-Modified) * 10%，上限 1 天
+_HEURISTIC_FRACTION = 0.1
+_HEURISTIC_MAX = 86400
+
+
+def _parse_http_date(value):
+    parsed = parsedate(value) if value else None
+    return calendar.timegm(parsed) if parsed else None
+
+
+def _parse_cache_control(value):
+    directives = {}
+    for part in (value or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, arg = part.partition("=")
+        directives[name.strip().lower()] = arg.strip().strip('"') or None
+    return directives
+
+
+class MemoryCacheStore(object):
+    """进程内缓存存储，最多保存 maxsize 个响应"""
+
+    def __init__(self, maxsize=1024):
+        self._cache = LRUCache(maxsize=maxsize)
+
+    def get(self, group, key):
+        return self._cache.get((group, key))
+
+    def set(self, group, key, value):
+        self._cache.set((group, key), value)
+
+    def delete_group(self, group):
+        for key in self._cache.keys():
+            if key[0] == group:
+                self._cache.pop(key)
+
+
+class DiskCacheStore(object):
+    """磁盘缓存存储，每个 URL 一个目录，目录下每个响应一个 JSON 文件，进程重启后仍可使用"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def __path(self, group, key):
+        return os.path.join(self.directory, group, key + ".json")
+
+    def get(self, group, key):
+        try:
+            with open(self.__path(group, key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+
+    def set(self, group, key, value):
+        directory = os.path.join(self.directory, group)
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+        # 以 _ 开头的字段（如解析后的 JSON）只保留在内存中
+        value = dict((k, v) for k, v in value.items() if not k.startswith("_"))
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(value, f, ensure_ascii=False)
+        os.replace(tmp, self.__path(group, key))
+
+    def delete_group(self, group):
+        directory = os.path.join(self.directory, group)
+        try:
+            names = os.listdir(directory)
+        except OSError:
+            return
+        for name in names:
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError:
+                pass
+        try:
+            os.rmdir(directory)
+        except OSError:
+            pass
+
+
+class CachedResponse(object):
+    """从缓存返回的响应，提供与 requests.Response 相同的 status_code / headers / text / json()"""
+
+    def __init__(self, entry):
+        self._entry = entry
+        self.status_code = entry["status"]
+        self.headers = CaseInsensitiveDict(entry["headers"])
+        self.text = entry["body"]
+        self.from_cache = True
+
+    def json(self):
+        # 同一缓存条目只解析一次 JSON，每次返回副本，调用方修改结果不会影响缓存
+        if "_json" not in self._entry:
+            self._entry["_json"] = json.loads(self.text)
+        return copy.deepcopy(self._entry["_json"])
+
+
+class HttpCache(object):
+    """HTTP 客户端使用的私有缓存（RFC 7234）
+
+    - 只缓存 GET 请求的 200 / 203 响应，遵循 Cache-Control（no-store、no-cache、max-age）、Expires、Vary；
+    - 新鲜期内直接返回缓存，不发起请求，同一条目的 JSON 只解析一次；
+    - 过期后带上 If-None-Match / If-Modified-Since 重新验证，服务端返回 304 时沿用缓存的响应体；
+    - 对同一 URL 的 POST / PUT / PATCH / DELETE 成功后，使该 URL 的缓存失效；
+    - 缓存 key 包含完整 URL 和 authorization，不同身份的响应互不共享。
+
+    每个 (URL, 身份, 完整 URL) 的响应单独存储，写入时只写这一个响应；URL 失效时删除其下的全部响应。
+    存储为有容量上限的内存 LRU，指定 cache_dir 时额外写入磁盘，内存未命中时从磁盘读取。
+    缓存命中时 json() 每次返回独立的副本，调用方可以自由修改。
+
+    示例::
+
+        client = AuthenticationClient(app_id="...", app_host="...", http_cache=HttpCache(cache_dir="/tmp/authing"))
+    """
+
+    def __init__(self, maxsize=1024, cache_dir=None):
+        """
+        Args:
+            maxsize (int): 内存中最多缓存的响应数
+            cache_dir (str): 磁盘缓存目录，不填则只使用内存
+        """
+        self.memory = MemoryCacheStore(maxsize)
+        self.disk = DiskCacheStore(cache_dir) if cache_dir else None
+        self.stats = {"hit": 0, "revalidated": 0, "miss": 0}
+
+    # ==== 存储 ====
+
+    @staticmethod
+    def __key(url):
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def __load(self, group, key):
+        entry = self.memory.get(group, key)
+        if entry is None and self.disk is not None:
+            entry = self.disk.get(group, key)
+            if entry is not None:
+                self.memory.set(group, key, entry)
+        return entry
+
+    def __put(self, group, key, entry):
+        self.memory.set(group, key, entry)
+        if self.disk is not None:
+            self.disk.set(group, key, entry)
+
+    def clear(self, url):
+        """使指定 URL（不含查询参数）的缓存失效"""
+        group = self.__key(url.split("?", 1)[0])
+        self.memory.delete_group(group)
+        if self.disk is not None:
+            self.disk.delete_group(group)
+
+    # ==== 新鲜度 ====
+
+    @staticmethod
+    def __freshness_lifetime(headers, cache_control):
+        if "no-cache" in cache_control:
+            return 0
+        if cache_control.get("max-age") is not None:
+            try:
+                return max(0, int(cache_control["max-age"]))
+            except ValueError:
+                return 0
+        date = _parse_http_date(headers.get("date"))
+        expires = headers.get("expires")
+        if expires is not None:
+            expires_at = _parse_http_date(expires)
+            return max(0, expires_at - (date or time.time())) if expires_at else 0
+        last_modified = _parse_http_date(headers.get("last-modified"))
+        if last_modified and date:
+            return min(_HEURISTIC_MAX, max(0, (date - last_modified) * _HEURISTIC_FRACTION))
+        return 0
+
+    def __is_fresh(self, entry):
+        headers = entry["headers"]
+        lifetime = self.__freshness_lifetime(headers, _parse_cache_control(headers.get("cache-control")))
+        try:
+            age = int(headers.get("age") or 0)
+        except ValueError:
+            age = 0
+        return age + time.time() - entry["response_time"] < lifetime
+
+    @staticmethod
+    def __vary(headers, request_headers):
+        names = [h.strip().lower() for h in (headers.get("vary") or "").split(",") if h.strip()]
+        lowered = dict((k.lower(), v) for k, v in (request_headers or {}).items() if v is not None)
+        return dict((name, lowered.get(name)) for name in names)
+
+    @staticmethod
+    def __variant(request_headers):
+        lowered = dict((k.lower(), v) for k, v in (request_headers or {}).items() if v is not None)
+        authorization = lowered.get("authorization") or ""
+        return hashlib.sha256(authorization.encode("utf-8")).hexdigest()[:32]
+
+    @staticmethod
+    def __storable(response, request_headers):
+        if response.status_code not in _CACHEABLE_STATUS:
+            return False
+        headers = response.headers
+        cache_control = _parse_cache_control(headers.get("cache-control"))
+        request_cache_control = _parse_cache_control((request_headers or {}).get("cache-control"))
+        if "no-store" in cache_control or "no-store" in request_cache_control:
+            return False
+        if (headers.get("vary") or "").strip() == "*":
+            return False
+        # 没有验证器也没有新鲜期的响应缓存了也用不上
+        return bool(headers.get("etag") or headers.get("last-modified") or headers.get("expires") or
+                    cache_control.get("max-age") is not None)
+
+    # ==== 请求 ====
+
+    def request(self, method, url, headers=None, params=None, **kwargs):
+        """与 requests.request 参数相同"""
+        method = method.upper()
+        if method != "GET":
+            response = requests.request(method=method, url=url, headers=headers, params=params, **kwargs)
+            if method in _UNSAFE_METHODS and response.status_code < 400:
+                self.clear(url)
+            return response
+
+        full_url = requests.Request("GET", url, params=params).prepare().url
+        group = self.__key(full_url.split("?", 1)[0])
+        key = self.__key("%s %s" % (self.__variant(headers), full_url))[:32]
+        entry = self.__load(group, key)
+        if entry is not None and entry["vary"] != self.__vary(entry["headers"], headers):
+            entry = None
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if self.__is_fresh(entry):
+                self.stats["hit"] += 1
+                return CachedResponse(entry)
+            if entry["headers"].get("etag"):
+                request_headers["If-None-Match"] = entry["headers"]["etag"]
+            if entry["headers"].get("last-modified"):
+                request_headers["If-Modified-Since"] = entry["headers"]["last-modified"]
+
+        response = requests.request(method=method, url=full_url, headers=request_headers, **kwargs)
+        now = time.time()
+        if response.status_code == 304 and entry is not None:
+            self.stats["revalidated"] += 1
+            entry = dict(entry)
+            entry["headers"] = dict(entry["headers"])
+            for name in _UPDATE_HEADERS:
+                if name in response.headers:
+                    entry["headers"][name] = response.headers[name]
+            entry["response_time"] = now
+            self.__put(group, key, entry)
+            return CachedResponse(entry)
+
+        self.stats["miss"] += 1
+        if self.__storable(response, headers):
+            response_headers = dict((k.lower(), v) for k, v in response.headers.items())
+            self.__put(group, key, {
+                "status": response.status_code,
+                "headers": response_headers,
+                "body": response.text,
+                "response_time": now,
+                "vary": self.__vary(response_headers, headers),
+            })
+        return response
@@ -0,0 +1,25 @@
+# coding: utf-8
+
+import requests
+
+from ..utils.singleflight import COALESCED_METHODS, SingleFlight, request_key
+
+
+class HttpSender(object):
+    """各 HttpClient 共用的请求发送逻辑
+
+    配置了 http_cache 时通过 HttpCache 发送，否则直接使用 requests；coalesce_requests 为 True 时，
+    相同的并发 GET 请求（方法、URL、参数、请求体、身份均相同）只发起一次，所有调用方共享同一个响应。
+    """
+
+    def _init_sender(self, http_cache=None, coalesce_requests=True):
+        self.http_cache = http_cache
+        self.coalesce_requests = coalesce_requests
+        self._flight = SingleFlight()
+
+    def _send(self, method, url, headers=None, json=None, **kwargs):
+        send = (self.http_cache or requests).request
+        if self.coalesce_requests and method.upper() in COALESCED_METHODS:
+            key = request_key(method, url, headers, kwargs.get("params"), json)
+            return self._flight.do(key, send, method=method, url=url, headers=headers, json=json, **kwargs)
+        return send(method=method, url=url, headers=headers, json=json, **kwargs)
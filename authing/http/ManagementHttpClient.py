@@ -2,14 +2,16 @@
 
 from pickle import FALSE
 from ..version import __version__
+from .HttpSender import HttpSender
 from ..ManagementTokenProvider import ManagementTokenProvider
-import requests
 
-class ManagementHttpClient(object):
-    def __init__(self, host, lang, use_unverified_ssl, access_key_id, access_key_secret):
+class ManagementHttpClient(HttpSender):
+    def __init__(self, host, lang, use_unverified_ssl, access_key_id, access_key_secret, http_cache=None,
+                 coalesce_requests=True):
         self.host = host
         self.lang = lang
         self.use_unverified_ssl = use_unverified_ssl or FALSE
+        self._init_sender(http_cache, coalesce_requests)
         self.access_key_id = access_key_id
         self.access_key_secret = access_key_secret
         self.token_provider = ManagementTokenProvider(
@@ -33,6 +35,6 @@ class ManagementHttpClient(object):
         if token:
             headers["authorization"] = "Bearer %s" % token
         verify = not self.use_unverified_ssl
-        r = requests.request(method=method, url=url, headers=headers, json=json, verify=verify, **kwargs)
+        r = self._send(method=method, url=url, headers=headers, json=json, verify=verify, **kwargs)
         data = r.json()
         return data
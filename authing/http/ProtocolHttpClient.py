@@ -2,13 +2,14 @@
 
 from pickle import FALSE
 from ..version import __version__
-import requests
+from .HttpSender import HttpSender
 
 
-class ProtocolHttpClient(object):
-    def __init__(self, host, use_unverified_ssl):
+class ProtocolHttpClient(HttpSender):
+    def __init__(self, host, use_unverified_ssl, http_cache=None, coalesce_requests=True):
         self.host = host
         self.use_unverified_ssl = use_unverified_ssl or FALSE
+        self._init_sender(http_cache, coalesce_requests)
 
     def request(self, method, url, basic_token=None, bearer_token=None, raw_content=False, json=None, **kwargs):
         url = "%s%s" % (self.host, url)
@@ -21,7 +22,7 @@ class ProtocolHttpClient(object):
         if json:
             json = {k: v for k, v in json.items() if v is not None}
         verify = not self.use_unverified_ssl
-        r = requests.request(
+        r = self._send(
             method=method, url=url, json=json, headers=headers, verify=verify, **kwargs
         )
         data = r.json() if not raw_content else r.text
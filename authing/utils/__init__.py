@@ -1,5 +1,11 @@
+import json
 import string
 import random
+from datetime import datetime
+
+import jwt
+
+from ..AuthingException import AuthingException
 
 try:
     # python 3
@@ -26,3 +32,32 @@ def url_join_args(api, query=None, **kwargs):
         else:
             result = result + urlencode(kwargs)
     return result
+
+def get_response_data(resp):
+    """从接口返回值中取出 data 字段，statusCode 不为 200 时抛出 AuthingException"""
+    status_code = resp.get("statusCode")
+    if status_code != 200:
+        raise AuthingException(status_code, resp.get("message"), resp.get("apiCode"))
+    return resp.get("data")
+
+
+def to_millis(value):
+    """将毫秒时间戳、秒时间戳或 ISO 8601 字符串转换为毫秒时间戳"""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value if value > 1e11 else value * 1000)
+    text = str(value)
+    if text.isdigit():
+        return to_millis(int(text))
+    if text.endswith("Z"):
+        text = text[:-1] + "+00:00"
+    return int(datetime.fromisoformat(text).timestamp() * 1000)
+
+
+def parse_jwks(jwks):
+    """解析 JWKS 中的 RSA 公钥，返回 kid -> 公钥"""
+    keys = {}
+    for jwk in (jwks or {}).get("keys") or []:
+        keys[jwk["kid"]] = jwt.algorithms.RSAAlgorithm.from_jwk(json.dumps(jwk))
+    return keys
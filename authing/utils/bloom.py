@@ -0,0 +1,62 @@
+# coding: utf-8
+
+import hashlib
+import math
+import threading
+
+
+class BloomFilter(object):
+    """布隆过滤器：判断为不存在时一定不存在，判断为存在时有 error_rate 的概率误判
+
+    按预计元素个数 capacity 和误判率 error_rate 计算位数组长度和哈希次数，每个元素只计算一次 blake2b，
+    再用双重哈希得到各个位置。
+    """
+
+    def __init__(self, capacity=100000, error_rate=0.001):
+        """
+        Args:
+            capacity (int): 预计元素个数
+            error_rate (float): 元素个数不超过 capacity 时的误判率
+        """
+        capacity = max(1, int(capacity))
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / float(capacity) * math.log(2))))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._count
+
+    def __positions(self, item):
+        if not isinstance(item, bytes):
+            item = str(item).encode("utf-8")
+        digest = hashlib.blake2b(item, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, item):
+        positions = self.__positions(item)
+        with self._lock:
+            for position in positions:
+                self._bits[position >> 3] |= 1 << (position & 7)
+            self._count += 1
+
+    def update(self, items):
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item):
+        bits = self._bits
+        for position in self.__positions(item):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def clear(self):
+        with self._lock:
+            self._bits = bytearray(len(self._bits))
+            self._count = 0
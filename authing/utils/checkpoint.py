@@ -0,0 +1,29 @@
+# coding: utf-8
+
+import json
+import os
+
+
+class FileCheckpoint(object):
+    """基于本地 JSON 文件的断点记录，写入时先写临时文件再原子替换，进程崩溃不会留下半个文件"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self, default=None):
+        if not self.path or not os.path.exists(self.path):
+            return default
+        with open(self.path, "r") as f:
+            return json.load(f)
+
+    def save(self, state):
+        if not self.path:
+            return
+        tmp_path = "%s.tmp" % self.path
+        with open(tmp_path, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,98 @@
+# coding: utf-8
+
+import ipaddress
+import socket
+
+_BITS = {4: 32, 6: 128}
+_V4_MAPPED = 0xffff << 32
+_MISSING = object()
+
+
+def parse_ip(ip):
+    """把 IP 字符串解析为 (版本, 整数)，IPv4 映射的 IPv6 地址（::ffff:a.b.c.d）视为 IPv4，无效时抛出 ValueError"""
+    try:
+        return 4, int.from_bytes(socket.inet_pton(socket.AF_INET, ip), "big")
+    except (OSError, TypeError):
+        pass
+    try:
+        value = int.from_bytes(socket.inet_pton(socket.AF_INET6, ip.split("%", 1)[0]), "big")
+    except (OSError, TypeError, AttributeError):
+        raise ValueError("invalid ip: %r" % (ip,))
+    if value >> 32 == 0xffff:
+        return 4, value - _V4_MAPPED
+    return 6, value
+
+
+def parse_networks(text):
+    """把 1.2.3.4、1.2.3.0/24、2001:db8::/32 或 1.2.3.4-1.2.3.20 形式的字符串解析为 (版本, 网络号, 前缀长度) 列表"""
+    text = text.strip()
+    if "-" in text:
+        first, last = [ipaddress.ip_address(part.strip()) for part in text.split("-", 1)]
+        networks = ipaddress.summarize_address_range(first, last)
+    else:
+        networks = [ipaddress.ip_network(text, strict=False)]
+    return [(n.version, int(n.network_address) >> (n.max_prefixlen - n.prefixlen), n.prefixlen) for n in networks]
+
+
+class CidrTable(object):
+    """IPv4 / IPv6 网段的最长前缀匹配表
+
+    与逐位下探的二叉前缀树（radix tree）语义相同，但按前缀长度分桶：每个出现过的前缀长度对应一个
+    网络号 -> value 的字典。查找时从最长的前缀长度开始，每层只做一次移位和一次字典查找，
+    次数只与表中不同前缀长度的个数有关（通常只有 /32、/24 等几种），在 Python 中比逐位遍历节点快得多。
+    """
+
+    def __init__(self):
+        self._tables = {4: {}, 6: {}}
+        self._lengths = {4: (), 6: ()}
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def insert(self, network, value=None):
+        """插入网段，network 为 parse_networks 支持的字符串，返回插入的网段数"""
+        networks = parse_networks(network)
+        for version, prefix, length in networks:
+            table = self._tables[version].setdefault(length, {})
+            if prefix not in table:
+                self._size += 1
+            table[prefix] = value
+            self._lengths[version] = tuple(sorted(self._tables[version], reverse=True))
+        return len(networks)
+
+    def remove(self, network):
+        for version, prefix, length in parse_networks(network):
+            table = self._tables[version].get(length)
+            if table is not None and table.pop(prefix, _MISSING) is not _MISSING:
+                self._size -= 1
+                if not table:
+                    del self._tables[version][length]
+                    self._lengths[version] = tuple(sorted(self._tables[version], reverse=True))
+
+    def lookup(self, ip, default=None):
+        """返回与 ip 最长前缀匹配的网段的 value，没有匹配时返回 default"""
+        version, value = parse_ip(ip)
+        return self.lookup_int(version, value, default)
+
+    def lookup_int(self, version, value, default=None):
+        bits = _BITS[version]
+        tables = self._tables[version]
+        for length in self._lengths[version]:
+            found = tables[length].get(value >> (bits - length), _MISSING)
+            if found is not _MISSING:
+                return found
+        return default
+
+    def match(self, ip):
+        """返回 (网段字符串, value)，没有匹配时返回 (None, None)"""
+        version, value = parse_ip(ip)
+        bits = _BITS[version]
+        for length in self._lengths[version]:
+            prefix = value >> (bits - length)
+            found = self._tables[version][length].get(prefix, _MISSING)
+            if found is not _MISSING:
+                address = ipaddress.ip_address(prefix << (bits - length)) if version == 4 else \
+                    ipaddress.IPv6Address(prefix << (bits - length))
+                return "%s/%d" % (address, length), found
+        return None, None
@@ -0,0 +1,133 @@
+# coding: utf-8
+
+import ast
+import sys
+import threading
+
+try:
+    # python 3
+    from urllib.parse import quote
+except ImportError:
+    # python 2
+    from urllib import quote
+
+
+class Endpoint(object):
+    """一个接口的描述：HTTP 方法、路径、参数列表，以及参数在请求体（json）或查询字符串（params）中的字段名"""
+
+    __slots__ = ("name", "method", "url", "placement", "args", "required", "fields", "templated")
+
+    def __init__(self, name, method, url, placement, required, args, fields):
+        """
+        Args:
+            name (str): 客户端方法名
+            method (str): HTTP 方法
+            url (str): 接口路径，可以包含 {参数名} 形式的路径参数
+            placement (str): 参数位置，json、params，或 None 表示不传参数
+            required (int): 必填参数个数，即 args 中前 required 个参数
+            args (str): 以空格分隔的参数名，顺序与方法签名一致
+            fields (str): 以空格分隔的 字段名:参数名，字段名与参数名相同时只写参数名
+        """
+        self.name = name
+        self.method = method
+        self.url = url
+        self.placement = placement
+        self.required = required
+        # page、limit 等参数名在各接口间大量重复，intern 后共用同一个字符串
+        self.args = tuple(sys.intern(arg) for arg in args.split())
+        self.fields = tuple(tuple(sys.intern(s) for s in field.split(":", 1)) if ":" in field else
+                            (sys.intern(field), sys.intern(field)) for field in fields.split())
+        self.templated = "{" in url
+
+    def build(self, arguments):
+        """把参数转换为 http_client.request 的参数"""
+        url = self.url
+        if self.templated:
+            url = url.format(**dict((k, quote(str(v), safe="")) for k, v in arguments.items() if v is not None))
+        request = {"method": self.method, "url": url}
+        if self.placement is not None:
+            request[self.placement] = dict((field, arguments.get(arg)) for field, arg in self.fields)
+        return request
+
+    def __repr__(self):
+        return "<Endpoint %s %s %s>" % (self.name, self.method, self.url)
+
+
+def _make_method(endpoint):
+    args = endpoint.args
+    allowed = frozenset(args)
+    required = args[:endpoint.required]
+
+    def method(self, *positional, **kwargs):
+        if len(positional) > len(args):
+            raise TypeError("%s() takes at most %d arguments (%d given)" % (endpoint.name, len(args), len(positional)))
+        arguments = dict(zip(args, positional))
+        if kwargs:
+            for key in kwargs:
+                if key not in allowed:
+                    raise TypeError("%s() got an unexpected keyword argument '%s'" % (endpoint.name, key))
+                if key in arguments:
+                    raise TypeError("%s() got multiple values for argument '%s'" % (endpoint.name, key))
+            arguments.update(kwargs)
+        for arg in required:
+            if arg not in arguments:
+                raise TypeError("%s() missing required argument: '%s'" % (endpoint.name, arg))
+        return self.call_endpoint(endpoint, arguments)
+
+    method.__name__ = endpoint.name
+    method.endpoint = endpoint
+    return method
+
+
+class _LazyMethod(object):
+    """占位描述符，第一次访问时才根据接口表生成方法并替换自身，未用到的接口不创建任何对象"""
+
+    __slots__ = ("entry",)
+
+    def __init__(self, entry):
+        self.entry = entry
+
+    def __get__(self, instance, owner):
+        endpoint = Endpoint(*self.entry)
+        method = _make_method(endpoint)
+        method.__qualname__ = "%s.%s" % (owner.__name__, endpoint.name)
+        setattr(owner, endpoint.name, method)
+        return method if instance is None else method.__get__(instance, owner)
+
+
+def bind_endpoints(cls, table):
+    """
+    按接口表为 cls 添加方法，cls 中已经手写的同名方法不会被覆盖，返回接口表中的方法名集合。
+
+    方法在第一次访问时生成，调用 self.call_endpoint(endpoint, arguments)，签名和文档见同名的 .pyi 文件；
+    生成的方法的 endpoint 属性为对应的 Endpoint。
+    """
+    for entry in table:
+        if entry[0] not in cls.__dict__:
+            setattr(cls, entry[0], _LazyMethod(entry))
+    return frozenset(entry[0] for entry in table)
+
+
+_docs = {}
+_docs_lock = threading.Lock()
+
+
+def load_stub_docs(path, class_name):
+    """从 .pyi 文件中读取 class_name 各方法的文档，首次调用时解析，之后使用缓存"""
+    key = (path, class_name)
+    with _docs_lock:
+        if key not in _docs:
+            try:
+                with open(path, "rb") as f:
+                    tree = ast.parse(f.read())
+            except (IOError, OSError):
+                # 安装包中没有 .pyi 文件时不提供文档
+                tree = ast.Module(body=[], type_ignores=[])
+            docs = {}
+            for node in tree.body:
+                if isinstance(node, ast.ClassDef) and node.name == class_name:
+                    for item in node.body:
+                        if isinstance(item, ast.FunctionDef):
+                            docs[item.name] = ast.get_docstring(item)
+            _docs[key] = docs
+        return _docs[key]
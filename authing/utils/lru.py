@@ -0,0 +1,69 @@
+# coding: utf-8
+
+import threading
+import time
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class LRUCache(object):
+    """线程安全的 LRU 缓存，容量超过 maxsize 时淘汰最久未使用的条目
+
+    set 时可以指定 ttl（秒），过期的条目在读取时视为不存在。
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING:
+                return default
+            value, expires_at = item
+            if expires_at is not None and expires_at <= time.time():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        with self._lock:
+            self._data[key] = (value, time.time() + ttl if ttl is not None else None)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def add(self, key, value=True, ttl=None):
+        """key 不存在（或已过期）时写入并返回 True，否则返回 False"""
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is not _MISSING and (item[1] is None or item[1] > time.time()):
+                self._data.move_to_end(key)
+                return False
+            self._data[key] = (value, time.time() + ttl if ttl is not None else None)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+            return True
+
+    def pop(self, key, default=None):
+        with self._lock:
+            item = self._data.pop(key, _MISSING)
+            return default if item is _MISSING else item[0]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def keys(self):
+        with self._lock:
+            return list(self._data.keys())
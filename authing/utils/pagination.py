@@ -0,0 +1,61 @@
+# coding: utf-8
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from . import get_response_data
+
+
+def parse_page(resp):
+    """解析分页接口的返回值，返回 (list, totalCount)"""
+    data = get_response_data(resp) or {}
+    if isinstance(data, list):
+        return data, None
+    return data.get("list") or [], data.get("totalCount")
+
+
+def iter_pages(fetch_page, limit=50, max_workers=4, start_page=1, executor=None):
+    """并发拉取分页接口，按页码顺序依次返回 (page, items)
+
+    先同步请求 start_page 获取 totalCount，之后最多同时保持 max_workers 个页面在途，
+    因此内存中最多只有 max_workers * limit 条记录。接口没有返回 totalCount 时退化为顺序拉取，直到某页不满 limit 条。
+
+    Args:
+        fetch_page (callable): fetch_page(page, limit) -> 接口返回值
+        limit (int): 每页数目
+        max_workers (int): 最大并发数
+        start_page (int): 起始页码，从 1 开始，可用于断点续传
+        executor (Executor): 可选，复用外部线程池
+    """
+    items, total = parse_page(fetch_page(start_page, limit))
+    yield start_page, items
+    if total is None:
+        page = start_page
+        while len(items) >= limit:
+            page += 1
+            items, _ = parse_page(fetch_page(page, limit))
+            if not items:
+                return
+            yield page, items
+        return
+
+    last_page = (total + limit - 1) // limit
+    if last_page <= start_page:
+        return
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        pending = deque()
+        next_page = start_page + 1
+        while next_page <= last_page or pending:
+            while next_page <= last_page and len(pending) < max_workers:
+                pending.append((next_page, executor.submit(fetch_page, next_page, limit)))
+                next_page += 1
+            page, future = pending.popleft()
+            items, _ = parse_page(future.result())
+            yield page, items
+    finally:
+        if own_executor:
+            executor.shutdown(wait=False)
@@ -0,0 +1,35 @@
+# coding: utf-8
+
+import threading
+import time
+
+
+class RateLimiter(object):
+    """线程安全的令牌桶限流器
+
+    Args:
+        rate (float): 每秒产生的令牌数，为 None 或 0 时不限流
+        burst (int): 桶容量，默认与 rate 相同
+    """
+
+    def __init__(self, rate=None, burst=None):
+        self.rate = rate
+        self.burst = burst or max(1, int(rate or 1))
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        """阻塞直到取得 tokens 个令牌"""
+        if not self.rate:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
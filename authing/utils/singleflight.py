@@ -0,0 +1,45 @@
+# coding: utf-8
+
+import json
+import threading
+from concurrent.futures import Future
+
+# 幂等、可以合并的 HTTP 方法
+COALESCED_METHODS = ("GET", "HEAD")
+
+
+def request_key(method, url, headers=None, params=None, json_body=None):
+    """HTTP 请求的合并 key，由方法、URL、查询参数、请求体和请求头（含 authorization 等身份信息）组成"""
+    return "%s %s %s" % (method.upper(), url, json.dumps([params, json_body, headers], sort_keys=True, default=str))
+
+
+class SingleFlight(object):
+    """合并相同 key 的并发调用：同一时刻同一 key 只有一个调用真正执行，其余调用等待并共享其结果（或异常）"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn, *args, **kwargs):
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    def in_flight(self, key):
+        with self._lock:
+            return key in self._calls
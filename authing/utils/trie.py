@@ -0,0 +1,166 @@
+# coding: utf-8
+
+
+def split_path(path):
+    """把 a/b/c 或 /a/b/c 切分为 ["a", "b", "c"]"""
+    if isinstance(path, (list, tuple)):
+        return list(path)
+    return [segment for segment in path.split("/") if segment]
+
+
+class _Node(object):
+    __slots__ = ("children", "value", "present")
+
+    def __init__(self):
+        self.children = {}
+        self.value = None
+        self.present = False
+
+
+class PathTrie(object):
+    """以 / 分隔的路径为 key 的前缀树
+
+    查找、插入为 O(路径深度)；subtree / accumulate / expand 的遍历只访问命中的子树，每个节点的路径由父节点的路径
+    拼接一段得到，耗时与访问的节点数及其路径长度之和成正比。
+    expand 支持通配符：* 匹配一层，** 匹配任意层（包括零层）。
+    """
+
+    def __init__(self):
+        self._root = _Node()
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, path):
+        node = self.__find(split_path(path))
+        return node is not None and node.present
+
+    def __find(self, segments):
+        node = self._root
+        for segment in segments:
+            node = node.children.get(segment)
+            if node is None:
+                return None
+        return node
+
+    def insert(self, path, value=None):
+        node = self._root
+        for segment in split_path(path):
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _Node()
+            node = child
+        if not node.present:
+            self._size += 1
+        node.present = True
+        node.value = value
+
+    def get(self, path, default=None):
+        node = self.__find(split_path(path))
+        return node.value if node is not None and node.present else default
+
+    def remove(self, path):
+        """删除路径及其整棵子树，返回删除的节点数"""
+        segments = split_path(path)
+        if not segments:
+            return 0
+        parent = self.__find(segments[:-1])
+        node = parent.children.pop(segments[-1], None) if parent is not None else None
+        if node is None:
+            return 0
+        removed = sum(1 for _ in self.__walk(node, ""))
+        self._size -= removed
+        return removed
+
+    def prefixes(self, path):
+        """返回 path 的所有已存在的祖先（含自身），由浅到深，元素为 (路径, value)"""
+        node = self._root
+        result = []
+        segments = []
+        for segment in split_path(path):
+            node = node.children.get(segment)
+            if node is None:
+                break
+            segments.append(segment)
+            if node.present:
+                result.append(("/".join(segments), node.value))
+        return result
+
+    def longest_prefix(self, path):
+        """path 最深的已存在的祖先（含自身），不存在时返回 (None, None)"""
+        found = self.prefixes(path)
+        return found[-1] if found else (None, None)
+
+    @staticmethod
+    def __join(prefix, segment):
+        return prefix + "/" + segment if prefix else segment
+
+    def __walk(self, node, path, initial=None, func=None):
+        # 先序遍历，用显式栈避免深树递归过深；栈中保存父节点拼好的路径，不重复拼接祖先的各段
+        # 指定 func 时同时向下传递累积值，元素为 (路径, value, 累积值)
+        join = self.__join
+        stack = [(node, path, func(initial, node.value) if func else None)]
+        while stack:
+            node, path, acc = stack.pop()
+            if node.present:
+                yield path, node.value, acc
+            for segment in reversed(list(node.children)):
+                child = node.children[segment]
+                stack.append((child, join(path, segment), func(acc, child.value) if func else None))
+
+    def subtree(self, path="", include_self=True):
+        """遍历 path 下的所有节点，元素为 (路径, value)"""
+        for item_path, value, _ in self.accumulate(path, include_self=include_self):
+            yield item_path, value
+
+    def accumulate(self, path="", initial=None, func=None, include_self=True):
+        """
+        遍历 path 下的所有节点，元素为 (路径, value, 累积值)。
+
+        Args:
+            path (str): 起始路径
+            initial: path 父节点的累积值
+            func (callable): func(父节点的累积值, 节点 value) -> 节点的累积值，不存在的中间节点 value 为 None；
+                不指定时累积值为 None
+            include_self (bool): 是否包含 path 本身
+        """
+        segments = split_path(path)
+        node = self.__find(segments)
+        if node is None:
+            return
+        start = "/".join(segments)
+        for item in self.__walk(node, start, initial, func):
+            if include_self or item[0] != start:
+                yield item
+
+    def children(self, path=""):
+        node = self.__find(split_path(path))
+        return list(node.children) if node is not None else []
+
+    def expand(self, pattern):
+        """展开带通配符的路径，元素为 (路径, value)"""
+        pattern = split_path(pattern)
+        join = self.__join
+        seen = set()
+        stack = [(self._root, 0, "")]
+        while stack:
+            node, i, path = stack.pop()
+            if i == len(pattern):
+                if node.present and path not in seen:
+                    seen.add(path)
+                    yield path, node.value
+                continue
+            segment = pattern[i]
+            if segment == "**":
+                # ** 匹配零层，或消耗一层后仍停留在 **
+                stack.append((node, i + 1, path))
+                for name, child in node.children.items():
+                    stack.append((child, i, join(path, name)))
+            elif segment == "*":
+                for name, child in node.children.items():
+                    stack.append((child, i + 1, join(path, name)))
+            else:
+                child = node.children.get(segment)
+                if child is not None:
+                    stack.append((child, i + 1, join(path, segment)))
@@ -0,0 +1,125 @@
+# coding: utf-8
+
+import csv
+import io
+import json
+import os
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+class NdjsonWriter(object):
+    """逐行写入 JSON（NDJSON），append 为 True 时追加到已有文件末尾"""
+
+    def __init__(self, path, append=False):
+        self.path = path
+        self._file = io.open(path, "a" if append else "w", encoding="utf-8")
+
+    def write_batch(self, records):
+        for record in records:
+            self._file.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+            self._file.write(u"\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class CsvWriter(object):
+    """写入 CSV，嵌套字段（list / dict）会被序列化为 JSON 字符串
+
+    fields 未指定时使用第一批记录的字段作为表头；追加到已有文件时沿用文件中的表头，与 fields 不一致时抛出 ValueError。
+    """
+
+    def __init__(self, path, fields=None, append=False):
+        self.path = path
+        self.fields = list(fields) if fields is not None else None
+        exists = append and os.path.exists(path) and os.path.getsize(path) > 0
+        if exists:
+            with io.open(path, "r", encoding="utf-8", newline="") as f:
+                header = next(csv.reader(f), None)
+            if header:
+                if self.fields is not None and self.fields != header:
+                    raise ValueError("csv header of %s does not match fields: %r != %r" % (path, header, self.fields))
+                self.fields = header
+        self._file = io.open(path, "a" if append else "w", encoding="utf-8", newline="")
+        self._writer = None
+        self._header_written = exists
+
+    def write_batch(self, records):
+        if not records:
+            return
+        if self._writer is None:
+            if self.fields is None:
+                self.fields = list(records[0].keys())
+            self._writer = csv.DictWriter(self._file, fieldnames=self.fields, extrasaction="ignore")
+            if not self._header_written:
+                self._writer.writeheader()
+                self._header_written = True
+        for record in records:
+            self._writer.writerow({k: self.__format(record.get(k)) for k in self.fields})
+        self._file.flush()
+
+    @staticmethod
+    def __format(value):
+        if isinstance(value, (list, dict)):
+            return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        return value
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetWriter(object):
+    """按批写入 Parquet，每一批为目录下的一个 part 文件，便于断点续传时继续追加
+
+    所有 part 文件使用同一个 schema：schema 未指定时由第一批记录推断（全为空的列视为字符串），追加时沿用已有
+    part 文件的 schema。之后的记录按该 schema 的列写入，多出的字段被忽略，缺少的字段为空。
+    dict 类型的字段会被序列化为 JSON 字符串。需要安装 pyarrow。
+    """
+
+    def __init__(self, path, append=False, schema=None):
+        if pyarrow is None:
+            raise ImportError("ParquetWriter requires pyarrow, please run: pip install pyarrow")
+        self.path = path
+        self.schema = schema
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        parts = sorted(f for f in os.listdir(path) if f.endswith(".parquet")) if append else []
+        self._part = len(parts)
+        if parts and self.schema is None:
+            self.schema = pyarrow.parquet.read_schema(os.path.join(path, parts[0]))
+
+    def write_batch(self, records):
+        if not records:
+            return
+        rows = [
+            {k: json.dumps(v, ensure_ascii=False) if isinstance(v, dict) else v for k, v in r.items()}
+            for r in records
+        ]
+        if self.schema is None:
+            schema = pyarrow.Table.from_pylist(rows).schema
+            self.schema = pyarrow.schema([
+                field.with_type(pyarrow.string()) if pyarrow.types.is_null(field.type) else field for field in schema
+            ])
+        table = pyarrow.Table.from_pylist(rows, schema=self.schema)
+        self._part += 1
+        pyarrow.parquet.write_table(table, os.path.join(self.path, "part-%05d.parquet" % self._part))
+
+    def close(self):
+        pass
+
+
+def open_writer(format, path, append=False, **kwargs):
+    """根据格式名（csv、ndjson、parquet）创建 writer"""
+    if format == "csv":
+        return CsvWriter(path, append=append, **kwargs)
+    if format == "ndjson":
+        return NdjsonWriter(path, append=append)
+    if format == "parquet":
+        return ParquetWriter(path, append=append, **kwargs)
+    raise ValueError("unsupported export format: %s" % format)
@@ -33,6 +33,9 @@ setup(
     url='https://github.com/Authing/authing-py-sdk',  # 作者链接
     packages=find_packages(),
     include_package_data=True,
+    package_data={
+        'authing': ['*.pyi'],
+    },
     zip_safe=False,
     classifiers=[
         'Programming Language :: Python :: 2',
@@ -51,5 +54,10 @@ setup(
     install_requires=[
         'requests',
         'pyjwt'
-    ]
+    ],
+    extras_require={
+        'parquet': ['pyarrow'],
+        'encrypt': ['cryptography', 'gmssl'],
+        'numpy': ['numpy'],
+    }
 )
@@ -0,0 +1,27 @@
+# coding: utf-8
+
+import jwt
+
+from authing.BulkTokenVerifier import _verify_chunk
+
+SECRET = "s" * 32
+OPTIONS = {"audience": None, "algorithms": ["HS256"], "verify_exp": True}
+
+
+def test_malformed_tokens_do_not_abort_chunk():
+    good = jwt.encode({"sub": "u1"}, SECRET, algorithm="HS256", headers={"kid": "k1"})
+    chunk = [(0, None), (1, 123), (2, "not-a-token"), (3, "a.b.c"), (4, good)]
+    results = dict((index, (payload, error)) for index, payload, error in
+                   _verify_chunk(chunk, {"k1": SECRET}, OPTIONS))
+    assert sorted(results) == [0, 1, 2, 3, 4]
+    for index in range(4):
+        payload, error = results[index]
+        assert payload is None and error
+    assert results[4] == ({"sub": "u1"}, None)
+
+
+def test_wrong_key_type_reported_per_token():
+    good = jwt.encode({"sub": "u1"}, SECRET, algorithm="HS256", headers={"kid": "k1"})
+    results = _verify_chunk([(0, good), (1, good)], {"k1": 12345}, OPTIONS)
+    assert len(results) == 2
+    assert all(payload is None and error for _, payload, error in results)
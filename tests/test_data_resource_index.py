@@ -0,0 +1,39 @@
+# coding: utf-8
+
+from authing.DataResourceIndex import UserResourceView
+from authing.utils.trie import PathTrie
+
+
+def _view(inherit):
+    view = UserResourceView("r", inherit=inherit)
+    view.trie.insert("r", frozenset())
+    view.trie.insert("r/a", frozenset(["read"]))
+    view.trie.insert("r/a/b", frozenset())
+    view.trie.insert("r/a/b/d", frozenset())
+    view.trie.insert("r/c", frozenset())
+    return view
+
+
+def test_authorized_paths_matches_is_allowed_for_ungranted_children():
+    view = _view(inherit=True)
+    paths = [path for path, _ in view.trie.subtree("r")]
+    expected = [path for path in paths if view.is_allowed(path, "read")]
+    assert list(view.authorized_paths(action="read")) == expected == ["r/a", "r/a/b", "r/a/b/d"]
+    assert list(view.authorized_paths("r/a/b", action="read")) == ["r/a/b", "r/a/b/d"]
+
+
+def test_authorized_paths_without_inherit():
+    view = _view(inherit=False)
+    assert list(view.authorized_paths(action="read")) == ["r/a"]
+    assert not view.is_allowed("r/a/b", "read")
+
+
+def test_trie_subtree_and_expand_paths():
+    trie = PathTrie()
+    for path in ["a/b/c", "a/b/d", "a/x", "y"]:
+        trie.insert(path, path)
+    assert [path for path, _ in trie.subtree()] == ["a/b/c", "a/b/d", "a/x", "y"]
+    assert all(path == value for path, value in trie.subtree("a"))
+    assert sorted(path for path, _ in trie.expand("a/*/c")) == ["a/b/c"]
+    assert sorted(path for path, _ in trie.expand("**")) == ["a/b/c", "a/b/d", "a/x", "y"]
+    assert trie.remove("a/b") == 2 and len(trie) == 2
@@ -0,0 +1,12 @@
+# coding: utf-8
+
+from authing.http.HttpCache import CachedResponse
+
+
+def test_cached_json_is_not_shared():
+    entry = {"status": 200, "headers": {"Content-Type": "application/json"},
+             "body": '{"data": {"list": [1, 2]}}'}
+    first = CachedResponse(entry).json()
+    first["data"]["list"].append(3)
+    first["extra"] = True
+    assert CachedResponse(entry).json() == {"data": {"list": [1, 2]}}
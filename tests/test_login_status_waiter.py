@@ -0,0 +1,38 @@
+# coding: utf-8
+
+import asyncio
+import threading
+
+from authing.LoginStatusWaiter import LoginStatusWaiter
+
+
+class SlowClient(object):
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def check_qr_code_status(self, qrcode_id):
+        self.started.set()
+        self.release.wait(5)
+        return {"statusCode": 200, "message": "", "data": {"status": "PENDING"}}
+
+
+def test_cancel_during_poll_cleans_up_watch():
+    async def run():
+        client = SlowClient()
+        waiter = LoginStatusWaiter(client, min_interval=0.01, max_interval=0.01)
+        future = waiter.watch("qrcode", "qr-1")
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, client.started.wait, 5)
+        # 轮询进行中，调用方直接取消 Future
+        future.cancel()
+        client.release.set()
+        for _ in range(100):
+            if waiter.pending_count == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert waiter.pending_count == 0
+        # 没有待跟踪的登录后调度协程应当退出
+        await asyncio.wait_for(waiter._scheduler, 1)
+
+    asyncio.run(run())
@@ -0,0 +1,76 @@
+# coding: utf-8
+
+import pytest
+
+from authing.AuthingException import AuthingException
+from authing.SyncJobMonitor import SyncJobMonitor
+
+
+def _ok(data):
+    return {"statusCode": 200, "message": "", "data": data}
+
+
+class FakeClient(object):
+    def __init__(self, failures):
+        # 每次 get_sync_job 依次取出的结果：异常实例或作业状态
+        self.failures = list(failures)
+        self.polls = 0
+
+    def get_sync_job(self, sync_job_id):
+        self.polls += 1
+        if self.failures:
+            item = self.failures.pop(0)
+            if isinstance(item, Exception):
+                raise item
+            return _ok({"jobStatus": item})
+        return _ok({"jobStatus": "SUCCESS"})
+
+    def list_sync_job_logs(self, sync_job_id, page, limit):
+        return _ok({"list": [], "totalCount": 0})
+
+
+def _monitor(client, **kwargs):
+    return SyncJobMonitor(client, min_interval=0.001, max_interval=0.005, **kwargs)
+
+
+def test_transient_error_is_retried_and_job_completes():
+    client = FakeClient(["RUNNING", ConnectionError("reset"), "RUNNING"])
+    monitor = _monitor(client)
+    try:
+        result = monitor.track("job-1").result(timeout=5)
+    finally:
+        monitor.close()
+    assert result["jobStatus"] == "SUCCESS"
+    assert client.polls == 4
+    assert monitor.metrics()["job-1"]["errors"] == 0
+
+
+def test_server_error_is_retried():
+    client = FakeClient([AuthingException(503, "unavailable")])
+    monitor = _monitor(client)
+    try:
+        assert monitor.track("job-1").result(timeout=5)["jobStatus"] == "SUCCESS"
+    finally:
+        monitor.close()
+
+
+def test_consecutive_errors_fail_the_job():
+    client = FakeClient([TimeoutError("timeout")] * 10)
+    monitor = _monitor(client, max_errors=3)
+    try:
+        with pytest.raises(TimeoutError):
+            monitor.track("job-1").result(timeout=5)
+    finally:
+        monitor.close()
+    assert client.polls == 3
+
+
+def test_api_error_fails_immediately():
+    client = FakeClient([AuthingException(404, "not found")])
+    monitor = _monitor(client)
+    try:
+        with pytest.raises(AuthingException):
+            monitor.track("job-1").result(timeout=5)
+    finally:
+        monitor.close()
+    assert client.polls == 1